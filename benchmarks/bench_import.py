@@ -0,0 +1,91 @@
+"""Import 시간 벤치마크
+
+백테스트 엔진만 사용하는 워커 프로세스의 콜드 스타트 시간을 측정합니다.
+매 회차 새 인터프리터에서 import하므로 디스크 캐시 외에는 콜드 상태입니다.
+전체 시간(numpy/pandas 포함)과 프로젝트 모듈 자체 시간을 따로 측정하고,
+tests/test_imports.py가 아래 상한으로 회귀를 검사합니다.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# 엔진 전용 워커가 실행하는 import
+WORKER_IMPORTS = """
+import sys, time
+start = time.perf_counter()
+import numpy, pandas
+deps = time.perf_counter()
+from src.backtest import BacktestEngine, BacktestConfig
+from src.strategies.kimp import KimpCashCarryStrategy
+BacktestEngine, BacktestConfig, KimpCashCarryStrategy
+end = time.perf_counter()
+print(__import__('json').dumps({
+    'elapsed': end - start, 'own': end - deps, 'modules': sorted(sys.modules),
+}))
+"""
+
+# import 시간 상한 (초, 느린 CI 머신 기준으로 넉넉하게 - 측정값 약 0.55초 / 0.1초)
+IMPORT_BUDGET_SEC = 3.0         # 전체 (numpy/pandas 포함)
+OWN_IMPORT_BUDGET_SEC = 0.5     # 프로젝트 모듈만
+
+# 엔진 워커에서 로드되면 안 되는 모듈
+HEAVY_MODULES = (
+    'httpx',
+    'loguru',
+    'sqlalchemy',
+    'matplotlib',
+    'plotly',
+    'vectorbt',
+    'torch',
+    'sklearn',
+    'binance',
+    'pyupbit',
+    'supabase',
+)
+
+
+def measure() -> dict:
+    """새 인터프리터에서 워커 import 1회 측정"""
+    output = subprocess.run(
+        [sys.executable, '-c', WORKER_IMPORTS],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def heavy_modules_loaded(modules: list) -> list:
+    """로드된 무거운 모듈 목록"""
+    return sorted({m.split('.')[0] for m in modules} & set(HEAVY_MODULES))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    results = [measure() for _ in range(args.runs)]
+    times = sorted(r['elapsed'] * 1000 for r in results)
+    own = sorted(r['own'] * 1000 for r in results)
+
+    print(f"engine worker import ({args.runs} runs)")
+    print(f"  median: {statistics.median(times):.1f} ms  (budget {IMPORT_BUDGET_SEC * 1000:.0f} ms)")
+    print(f"  min:    {times[0]:.1f} ms")
+    print(f"  max:    {times[-1]:.1f} ms")
+    print(f"  own:    {statistics.median(own):.1f} ms  (budget {OWN_IMPORT_BUDGET_SEC * 1000:.0f} ms)")
+    print(f"  heavy modules loaded: {heavy_modules_loaded(results[-1]['modules']) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""로깅 호출 오버헤드 벤치마크
+
+핫 루프에서 호출 1회당 비용을 비교합니다.
+
+- debug_enabled() 확인 후 생략 (DEBUG 비활성)
+- loguru debug 직접 호출 (DEBUG 비활성, 메시지 포맷팅 포함)
+- loguru 파일 싱크 동기 기록 / enqueue 기록
+- EventLog JSONL 배치 기록
+
+Usage:
+    python benchmarks/bench_logging.py [--calls 100000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.events import EventLog  # noqa: E402
+from src.utils.logger import debug_enabled, get_logger, setup_logger  # noqa: E402
+
+
+def per_call(calls: int, func) -> float:
+    """호출 1회당 시간 (ns)"""
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def file_sink(log_file: Path, calls: int, enqueue: bool) -> float:
+    """파일 싱크 INFO 기록 (콘솔 싱크 없이)"""
+    logger = get_logger()
+    logger.remove()
+    logger.add(log_file, level='INFO', enqueue=enqueue)
+    elapsed = per_call(calls, lambda i: logger.info(f"fill {i} price={136_500_000 + i}"))
+    logger.complete()
+    logger.remove()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=100_000)
+    args = parser.parse_args()
+    calls = args.calls
+    kimp = 0.0312
+
+    setup_logger('INFO')
+    logger = get_logger()
+
+    def gated(i: int) -> None:
+        if debug_enabled():
+            logger.debug(f"bar {i} 김프 {kimp:.4%}")
+
+    def ungated(i: int) -> None:
+        logger.debug(f"bar {i} 김프 {kimp:.4%}")
+
+    results = {
+        'debug off, debug_enabled() gate': per_call(calls, gated),
+        'debug off, loguru.debug direct': per_call(calls, ungated),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        results['loguru file sink (sync)'] = file_sink(tmp / 'sync.log', calls, enqueue=False)
+        results['loguru file sink (enqueue)'] = file_sink(tmp / 'async.log', calls, enqueue=True)
+
+        events = EventLog(str(tmp / 'events.jsonl'))
+        results['EventLog.log (JSONL batch)'] = per_call(
+            calls, lambda i: events.log('fill', bar=i, price=136_500_000 + i, side='BUY')
+        )
+        events.close()
+
+    setup_logger('INFO')
+    print(f"calls: {calls:,}")
+    for name, ns in results.items():
+        print(f"{name:<34} {ns:>9.0f} ns/call")
+
+
+if __name__ == '__main__':
+    main()
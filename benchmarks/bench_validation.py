@@ -0,0 +1,71 @@
+"""데이터 품질 검증 벤치마크
+
+1분봉 김프 데이터 전체에 대한 validate()/clean() 처리 시간을 측정합니다.
+
+Usage:
+    python benchmarks/bench_validation.py [--bars 5000000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.validation import clean, validate  # noqa: E402
+
+
+def make_data(n: int) -> pd.DataFrame:
+    """잘못된 bar가 섞인 합성 김프 데이터"""
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2020-01-01', periods=n, freq='min')
+    binance = 100_000 * np.exp(np.cumsum(rng.normal(0, 5e-4, n)))
+    usd_krw = 1_300 + np.cumsum(rng.normal(0, 0.05, n))
+    upbit = binance * usd_krw * (1.02 + rng.normal(0, 2e-3, n))
+
+    bad = rng.choice(n, size=n // 10_000, replace=False)
+    upbit[bad[::2]] *= 1.5
+    binance[bad[1::2]] = np.nan
+    return pd.DataFrame({
+        'timestamp': index,
+        'upbit_price': upbit,
+        'binance_price': binance,
+        'usd_krw': usd_krw,
+    }, index=index)
+
+
+def best_of(repeat: int, func, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bars', type=int, default=5_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    data = make_data(args.bars)
+    report = validate(data)
+
+    elapsed = best_of(args.repeat, validate, data)
+    skip = best_of(args.repeat, clean, data, report, 'skip')
+    ffill = best_of(args.repeat, clean, data, report, 'ffill')
+
+    print(f"bars: {args.bars:,}  bad: {report.bad_rows:,}")
+    print(f"validate:     {elapsed:.3f}s  ({args.bars / elapsed / 1e6:.1f}M bars/s)")
+    print(f"clean skip:   {skip:.3f}s")
+    print(f"clean ffill:  {ffill:.3f}s")
+    print(report.summary())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""로컬 모의 거래소 서버
+
+업비트 캔들, 바이낸스 klines 엔드포인트를 흉내 내는 HTTP 서버입니다.
+응답 지연과 에러 응답을 주입해 DataFetcher의 처리량/에러율을 측정합니다.
+
+Example:
+    >>> with MockExchange(latency=0.01) as exchange:
+    ...     fetcher = DataFetcher(upbit_url=exchange.url, binance_url=exchange.url)
+    ...     exchange.fail_next(2, status=503)
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class MockExchange:
+    """
+    모의 거래소 서버
+
+    Args:
+        latency: 응답 지연 (초)
+        error_rate: 무작위 503 응답 비율 (0~1, 요청 순번 기반으로 결정적)
+    """
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.hits: Counter = Counter()
+        self._failures: list = []
+        self._lock = threading.Lock()
+        self._count = 0
+
+        exchange = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                exchange._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def fail_next(self, count: int, status: int = 503, retry_after: float = None) -> None:
+        """다음 count개 요청에 에러 응답"""
+        with self._lock:
+            self._failures.extend([(status, retry_after, None)] * count)
+
+    def malformed_next(self, count: int) -> None:
+        """다음 count개 요청에 깨진 JSON 본문(200) 응답"""
+        with self._lock:
+            self._failures.extend([(200, None, b'[{"market": "KRW-BTC", ')] * count)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        parts = urlsplit(request.path)
+        params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+        with self._lock:
+            self.hits[parts.path] += 1
+            self._count += 1
+            failure = self._failures.pop(0) if self._failures else None
+            if failure is None and self.error_rate and (self._count * self.error_rate) % 1 < self.error_rate:
+                failure = (503, None, None)
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if failure:
+            status, retry_after, body = failure
+            headers = {'Retry-After': str(retry_after)} if retry_after is not None else {}
+            if body is not None:
+                return self._send_raw(request, status, body, headers)
+            return self._send(request, status, {'error': 'mock failure'}, headers)
+
+        if parts.path.startswith('/v1/candles/'):
+            return self._send(request, 200, _upbit_candles(int(params.get('count', 200))))
+        if parts.path in ('/api/v3/klines', '/fapi/v1/klines'):
+            return self._send(request, 200, _binance_klines(int(params.get('limit', 1000))))
+        return self._send(request, 404, {'error': 'not found'})
+
+    @staticmethod
+    def _send(request, status: int, payload, headers=None) -> None:
+        MockExchange._send_raw(request, status, json.dumps(payload).encode(), headers)
+
+    @staticmethod
+    def _send_raw(request, status: int, body: bytes, headers=None) -> None:
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def _upbit_candles(count: int) -> list:
+    base = 1_704_067_200  # 2024-01-01 00:00:00 UTC
+    return [
+        {
+            'candle_date_time_utc': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(base + 60 * i)),
+            'opening_price': 130_000_000.0 + i,
+            'high_price': 130_100_000.0 + i,
+            'low_price': 129_900_000.0 + i,
+            'trade_price': 130_050_000.0 + i,
+            'candle_acc_trade_volume': 1.5,
+        }
+        for i in reversed(range(count))  # 업비트는 최신순 반환
+    ]
+
+
+def _binance_klines(limit: int) -> list:
+    base = 1_704_067_200_000
+    return [
+        [base + 60_000 * i, '100000.0', '100100.0', '99900.0', '100050.0', '12.5',
+         base + 60_000 * i + 59_999, '1250000.0', 100, '6.0', '600000.0', '0']
+        for i in range(limit)
+    ]
@@ -0,0 +1,37 @@
+"""지연 import 헬퍼
+
+패키지 ``__init__``에서 공개 이름을 첫 접근 시점에 import합니다 (PEP 562).
+httpx, sqlalchemy 같은 무거운 의존성은 해당 기능을 실제로 사용하는
+프로세스에서만 로드됩니다.
+"""
+
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    지연 export용 ``__getattr__``, ``__dir__`` 생성
+
+    Args:
+        package: 패키지 이름 (``__name__``)
+        exports: {공개 이름: 상대 모듈 경로} (예: {'DataFetcher': '.fetcher'})
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {'DataFetcher': '.fetcher'})
+    """
+    def __getattr__(name: str) -> object:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(exports[name], package)
+        value = getattr(module, name)
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(exports) | set(vars(importlib.import_module(package))))
+
+    return __getattr__, __dir__
@@ -1,6 +1,46 @@
-"""백테스트 엔진"""
+"""백테스트 엔진
 
-from .engine import BacktestEngine, BacktestConfig
-from .metrics import PerformanceMetrics
+공개 클래스는 첫 사용 시 로드됩니다 (ResultStore의 sqlalchemy 등 지연 import).
+"""
 
-__all__ = ["BacktestEngine", "BacktestConfig", "PerformanceMetrics"]
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .engine import BacktestConfig, BacktestEngine
+    from .metrics import PerformanceMetrics
+    from .portfolio import Portfolio, Position, Trade
+    from .replay import ReplayHarness, ReplayResult
+    from .risk import RiskConfig, RiskEngine
+    from .store import ResultStore
+
+_EXPORTS = {
+    "BacktestEngine": ".engine",
+    "BacktestConfig": ".engine",
+    "PerformanceMetrics": ".metrics",
+    "Portfolio": ".portfolio",
+    "Position": ".portfolio",
+    "Trade": ".portfolio",
+    "ReplayHarness": ".replay",
+    "ReplayResult": ".replay",
+    "RiskConfig": ".risk",
+    "RiskEngine": ".risk",
+    "ResultStore": ".store",
+}
+
+__all__ = [
+    "BacktestEngine",
+    "BacktestConfig",
+    "PerformanceMetrics",
+    "Portfolio",
+    "Position",
+    "Trade",
+    "ReplayHarness",
+    "ReplayResult",
+    "RiskConfig",
+    "RiskEngine",
+    "ResultStore",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,13 +1,20 @@
 """백테스트 엔진"""
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, List, Dict, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+from ..data.schema import is_epoch_index
+from ..data.validation import BAD_BAR_METHODS, ValidationConfig, ValidationReport, clean, validate
 from ..strategies.base import BaseStrategy, Signal
+from ..utils.cache import MemoCache, fingerprint
+from ..utils.events import EventLog
+from ..utils.hashing import stable_hash
 from .metrics import PerformanceMetrics
+from .portfolio import Portfolio, Trade
+from .risk import RiskEngine
 
 
 @dataclass
@@ -18,18 +25,9 @@ class BacktestConfig:
     initial_capital: float = 20_000_000  # 2천만원
     commission_rate: float = 0.001     # 0.1%
     slippage_rate: float = 0.0005      # 0.05%
-    
-
-@dataclass
-class Trade:
-    """거래 기록"""
-    timestamp: datetime
-    symbol: str
-    side: str  # 'BUY', 'SELL'
-    quantity: float
-    price: float
-    commission: float
-    pnl: float = 0
+    spot_price_col: str = 'upbit_price'      # 현물 레그 가격 (없으면 'close')
+    hedge_price_col: str = 'binance_price'   # 선물 레그 가격 (없으면 헤지 없음)
+    fx_col: str = 'usd_krw'                  # 선물 가격 환산 환율 (선물 레그 사용 시 필수)
     
 
 @dataclass
@@ -45,6 +43,8 @@ class BacktestResult:
     total_trades: int
     trades: List[Trade] = field(default_factory=list)
     equity_curve: pd.Series = field(default_factory=pd.Series)
+    risk_blocked: Dict[str, int] = field(default_factory=dict)   # 사유별 차단된 진입 수
+    quality: Optional[ValidationReport] = None   # 잘못된 bar 처리 시 구간 검증 결과
     
     def summary(self) -> str:
         """결과 요약 문자열"""
@@ -69,6 +69,34 @@ Profit Factor: {self.profit_factor:.2f}
         """
 
 
+def run_key(
+    config: BacktestConfig,
+    strategy: BaseStrategy,
+    data_hash: str,
+    **run_kwargs: Any
+) -> str:
+    """
+    백테스트 실행 키
+    
+    설정 + 전략 이름/버전/파라미터 + 입력 데이터 지문의 해시입니다.
+    결과 저장소와 메모이제이션 캐시가 같은 키를 사용합니다.
+    """
+    return stable_hash({
+        'config': config,
+        'strategy': strategy.name,
+        'version': strategy.version,
+        'params': strategy.params,
+        'data_hash': data_hash,
+        'run_kwargs': run_kwargs,
+    })
+
+
+def _holding(actions: np.ndarray) -> bool:
+    """액션 배열 마지막 시그널 이후 포지션 보유 여부"""
+    events = np.flatnonzero(actions)
+    return bool(len(events)) and actions[events[-1]] > 0
+
+
 class BacktestEngine:
     """
     벡터화 백테스트 엔진
@@ -82,61 +110,175 @@ class BacktestEngine:
         >>> engine = BacktestEngine(config)
         >>> result = engine.run(strategy, data)
         >>> print(result.summary())
+        
+        같은 설정/파라미터/데이터의 반복 실행은 캐시로 재사용할 수 있습니다:
+        
+        >>> engine = BacktestEngine(config, cache=MemoCache('data/cache'))
+        
+        체결 내역은 JSONL 이벤트 로그로 기록할 수 있습니다 (백그라운드 배치 기록):
+        
+        >>> engine = BacktestEngine(config, event_log=EventLog('logs/fills.jsonl'))
+        
+        진입 주문 앞에 리스크 검사 단계를 둘 수 있습니다:
+        
+        >>> engine = BacktestEngine(config, risk=RiskEngine(RiskConfig(daily_loss_limit=0.02)))
+        
+        품질 검증에 실패한 bar(0/NaN 가격, 중복 시각, 이상 김프 등)는 제거하거나
+        직전 bar 값으로 채울 수 있습니다 (검증 결과는 engine.quality):
+        
+        >>> engine = BacktestEngine(config, bad_bars='ffill')
     """
     
-    def __init__(self, config: BacktestConfig):
+    def __init__(
+        self,
+        config: BacktestConfig,
+        cache: Optional[MemoCache] = None,
+        event_log: Optional[EventLog] = None,
+        risk: Optional[RiskEngine] = None,
+        bad_bars: Optional[str] = None,
+        validation: Optional[ValidationConfig] = None
+    ):
+        if bad_bars is not None and bad_bars not in BAD_BAR_METHODS:
+            raise ValueError(f"bad_bars는 {BAD_BAR_METHODS} 중 하나여야 합니다: {bad_bars!r}")
         self.config = config
+        self.cache = cache
+        self.event_log = event_log
+        self.risk = risk
+        self.bad_bars = bad_bars
+        self.validation = validation
+        self.quality: Optional[ValidationReport] = None
         self.trades: List[Trade] = []
-        self.equity_curve: List[float] = []
+        self.equity_curve: pd.Series = pd.Series(dtype=float)
         
-    def run(self, strategy: BaseStrategy, data: pd.DataFrame) -> BacktestResult:
+    def run(
+        self, 
+        strategy: BaseStrategy, 
+        data: pd.DataFrame,
+        vectorized: bool = False
+    ) -> BacktestResult:
         """
         백테스트 실행
         
         Args:
             strategy: 전략 객체
             data: OHLCV DataFrame
+            vectorized: True면 bar별 prefix 슬라이싱 대신
+                strategy.generate_signals로 시그널을 일괄 생성 (빠른 경로).
+                LookAheadBiasDetector로 검증된 전략에만 사용하세요.
             
         Returns:
             BacktestResult
+            
+        Note:
+            캐시 적중 시에는 시뮬레이션을 건너뛰므로 strategy는 reset() 직후
+            상태(실행 종료 시점 상태가 아님)이고, risk.blocked와 quality는
+            캐시된 실행의 값으로 복원되며, event_log에는 캐시된 체결이 fill
+            이벤트로 기록됩니다 (restore 참고).
+        """
+        if self.cache is None:
+            return self._run(strategy, data, vectorized)
+        
+        computed = False
+        
+        def compute() -> BacktestResult:
+            nonlocal computed
+            computed = True
+            return self._run(strategy, data, vectorized)
+        
+        key = self.run_key(strategy, fingerprint(data), vectorized=vectorized)
+        result = self.cache.get_or_compute(key, compute)
+        if not computed:
+            self.restore(strategy, result)
+        return result
+    
+    def restore(self, strategy: BaseStrategy, result: BacktestResult) -> None:
+        """
+        저장된 결과(캐시/ResultStore)로 실행 후 상태 복원
+        
+        시뮬레이션 없이 결과를 재사용할 때 호출합니다. strategy는 reset()하고,
+        trades/equity_curve/quality와 risk.blocked는 결과 값으로 설정합니다.
+        event_log가 있으면 결과의 체결을 fill 이벤트로 다시 기록합니다
+        (캐시 적중 여부와 무관하게 같은 이벤트).
         """
+        strategy.reset()
+        if self.risk is not None:
+            self.risk.blocked = dict(result.risk_blocked)
+        self.quality = result.quality
+        self.trades = result.trades
+        self.equity_curve = result.equity_curve
+        for trade in result.trades:
+            self._log_fill(trade, strategy)
+    
+    def run_key(self, strategy: BaseStrategy, data_hash: str, **run_kwargs: Any) -> str:
+        """실행 키 (리스크 한도/잘못된 bar 처리를 사용하면 키에 포함)"""
+        if self.risk is not None:
+            run_kwargs['risk'] = self.risk.config
+        if self.bad_bars is not None:
+            run_kwargs['bad_bars'] = self.bad_bars
+            run_kwargs['validation'] = self.validation or ValidationConfig()
+        return run_key(self.config, strategy, data_hash, **run_kwargs)
+    
+    def _run(
+        self, 
+        strategy: BaseStrategy, 
+        data: pd.DataFrame,
+        vectorized: bool
+    ) -> BacktestResult:
+        """백테스트 실행 (캐시 미사용)"""
         # 초기화
         strategy.reset()
         self.trades = []
-        capital = self.config.initial_capital
-        self.equity_curve = [capital]
         
         # 데이터 필터링
-        mask = (
-            (data.index >= self.config.start_date) & 
-            (data.index <= self.config.end_date)
+        period = self._period_mask(data.index)
+        filtered_data = data[period].copy()
+        if self.bad_bars is not None:
+            self.quality = validate(filtered_data, self.validation)
+            filtered_data = clean(filtered_data, self.quality, self.bad_bars)
+        spot, hedge, fx = self._leg_prices(filtered_data)
+        portfolio = Portfolio(
+            self.config.initial_capital,
+            self.config.commission_rate,
+            self.config.slippage_rate
         )
-        filtered_data = data[mask].copy()
+        if self.risk is not None:
+            if 'fx_ma' in filtered_data.columns:
+                self.risk.prepare(filtered_data.index, spot, hedge, fx, filtered_data['fx_ma'].to_numpy())
+            else:
+                self.risk.prepare(
+                    filtered_data.index, spot, hedge, fx, fx_history=self._fx_history(data, period)
+                )
         
         # 시뮬레이션
-        for i in range(1, len(filtered_data)):
-            # 현재까지의 데이터만 전달 (look-ahead bias 방지)
-            current_data = filtered_data.iloc[:i+1]
-            
-            # 시그널 생성
-            signal = strategy.generate_signal(current_data)
-            
-            if signal:
-                # 주문 실행
-                trade = self._execute_order(signal, capital)
-                if trade:
-                    self.trades.append(trade)
-                    capital += trade.pnl - trade.commission
-            
-            self.equity_curve.append(capital)
+        if vectorized:
+            self._run_vectorized(strategy, filtered_data, portfolio, spot, hedge, fx)
+        else:
+            for i in range(len(filtered_data)):
+                # 현재까지의 데이터만 전달 (look-ahead bias 방지)
+                current_data = filtered_data.iloc[:i+1]
+                
+                # 시그널 생성
+                signal = strategy.generate_signal(current_data)
+                
+                if signal:
+                    # 주문 실행
+                    trade = self._execute_order(signal, portfolio, i, spot, hedge, fx)
+                    if trade:
+                        self._record_trade(trade, strategy)
+                    elif signal.action in ('BUY', 'SELL'):
+                        strategy.on_order_rejected({
+                            'symbol': signal.symbol,
+                            'quantity': signal.quantity,
+                            'side': signal.action,
+                        })
         
-        # 성과 계산
-        equity_series = pd.Series(
-            self.equity_curve, 
-            index=filtered_data.index[:len(self.equity_curve)]
+        # 성과 계산 (포지션 × 가격 평가)
+        self.equity_curve = pd.Series(
+            portfolio.mark_to_market(spot, hedge, fx),
+            index=filtered_data.index
         )
         
-        metrics = PerformanceMetrics(equity_series, self.trades)
+        metrics = PerformanceMetrics(self.equity_curve, self.trades)
         
         return BacktestResult(
             config=self.config,
@@ -148,45 +290,226 @@ class BacktestEngine:
             profit_factor=metrics.profit_factor(),
             total_trades=len(self.trades),
             trades=self.trades,
-            equity_curve=equity_series
+            equity_curve=self.equity_curve,
+            risk_blocked=dict(self.risk.blocked) if self.risk is not None else {},
+            quality=self.quality
         )
     
+    def _run_vectorized(
+        self,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        portfolio: Portfolio,
+        spot: np.ndarray,
+        hedge: Optional[np.ndarray],
+        fx: Optional[np.ndarray]
+    ) -> None:
+        """
+        일괄 시그널 기반 시뮬레이션 (시그널 발생 bar만 순회)
+        
+        generate_signals는 모든 주문이 체결된다고 가정하므로, 진입이 거부되면
+        그 다음 bar부터 포지션 없는 상태로 시그널을 다시 생성합니다
+        (bar별 경로의 on_order_rejected와 같은 결과).
+        """
+        actions = strategy.generate_signals(data).to_numpy().copy()
+        symbol, fraction = strategy.order_spec()
+        
+        # 원래 시그널은 events를 순서대로, 다시 생성한 구간의 시그널은 resumed를 먼저 처리
+        events = np.flatnonzero(actions)
+        resumed: Deque[int] = deque()
+        k = 0
+        while resumed or k < len(events):
+            if resumed:
+                i = resumed.popleft()
+            else:
+                i = events[k]
+                k += 1
+            timestamp = pd.Timestamp(data.index[i])
+            
+            if actions[i] > 0:
+                trade = self._open(portfolio, i, timestamp, symbol, fraction, spot, hedge, fx)
+                if trade is None:
+                    stop = self._resume(strategy, data, actions, i)
+                    resumed = deque(
+                        [int(j) for j in i + 1 + np.flatnonzero(actions[i + 1:stop])]
+                        + [j for j in resumed if j >= stop]
+                    )
+                    k = max(k, int(np.searchsorted(events, stop)))
+            else:
+                trade = self._close(portfolio, i, timestamp, symbol, spot, hedge, fx)
+            if trade:
+                self._record_trade(trade, strategy)
+    
+    @staticmethod
+    def _resume(
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        actions: np.ndarray,
+        bar: int
+    ) -> int:
+        """
+        bar 진입 거부 후 시그널 재생성 (actions를 제자리에서 갱신)
+        
+        bar+1부터 포지션 없는 상태로 다시 계산하고, 구간 끝의 보유 상태가
+        원래 시그널과 같아지면 이후 시그널도 같으므로 거기서 멈춥니다
+        (구간 길이를 64 bar부터 두 배씩 늘려 확인).
+        
+        Returns:
+            다시 계산한 구간의 끝 (exclusive)
+        """
+        n = len(actions)
+        start = bar + 1
+        window = 64
+        while True:
+            stop = min(n, start + window)
+            resumed = strategy.resume_signals(data, start, stop)
+            if stop == n or _holding(resumed) == _holding(actions[bar:stop]):
+                actions[start:stop] = resumed
+                return stop
+            window *= 2
+    
+    def _record_trade(self, trade: Trade, strategy: BaseStrategy) -> None:
+        """체결 기록 (이벤트 로그가 있으면 함께 기록)"""
+        self.trades.append(trade)
+        self._log_fill(trade, strategy)
+    
+    def _log_fill(self, trade: Trade, strategy: BaseStrategy) -> None:
+        """fill 이벤트 기록 (이벤트 로그가 없으면 무시)"""
+        if self.event_log is not None:
+            self.event_log.log('fill', strategy=strategy.name, **asdict(trade))
+    
+    def _period_mask(self, index: pd.Index) -> np.ndarray:
+        """
+        백테스트 기간 마스크
+        
+        DatetimeIndex와 컴팩트 스키마의 int64 epoch-ns 인덱스를 모두 지원합니다.
+        """
+        start, end = self.config.start_date, self.config.end_date
+        if is_epoch_index(index):
+            values = index.to_numpy()
+            return (values >= pd.Timestamp(start).value) & (values <= pd.Timestamp(end).value)
+        return (index >= start) & (index <= end)
+    
+    def _fx_history(self, data: pd.DataFrame, period: np.ndarray) -> Optional[np.ndarray]:
+        """
+        백테스트 시작 전 환율 (리스크 환율 MA 워밍업용)
+        
+        기간 시작 이전 bar 중 정상 값(양수)만 최근 fx_ma_period-1개 반환합니다.
+        """
+        window = self.risk.config.fx_ma_period - 1
+        start = np.flatnonzero(period)
+        if self.config.fx_col not in data.columns or not len(start) or window <= 0:
+            return None
+        history = data[self.config.fx_col].to_numpy(dtype=np.float64)[:start[0]]
+        with np.errstate(invalid='ignore'):
+            history = history[np.isfinite(history) & (history > 0)]
+        return history[-window:]
+    
+    def _leg_prices(
+        self, 
+        data: pd.DataFrame
+    ) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        레그별 가격 배열 추출
+        
+        Returns:
+            (현물 가격, 선물 가격 또는 None, 환율 또는 None) - 환율은 선물 레그가
+            있을 때만 반환
+            
+        Raises:
+            ValueError: 선물 가격 컬럼은 있는데 환율 컬럼이 없음 (USDT 손익을
+                원화 자산에 환산 없이 더하게 되므로 실행하지 않음)
+        """
+        spot_col = self.config.spot_price_col
+        if spot_col not in data.columns:
+            spot_col = 'close'
+        spot = data[spot_col].to_numpy(dtype=np.float64)
+        
+        hedge = fx = None
+        if self.config.hedge_price_col in data.columns:
+            if self.config.fx_col not in data.columns:
+                raise ValueError(
+                    f"선물 가격 컬럼 '{self.config.hedge_price_col}'을 쓰려면 환율 컬럼 "
+                    f"'{self.config.fx_col}'이 필요합니다 (BacktestConfig.fx_col)"
+                )
+            hedge = data[self.config.hedge_price_col].to_numpy(dtype=np.float64)
+            fx = data[self.config.fx_col].to_numpy(dtype=np.float64)
+        return spot, hedge, fx
+    
     def _execute_order(
         self, 
         signal: Signal, 
-        capital: float
+        portfolio: Portfolio,
+        bar: int,
+        spot: np.ndarray,
+        hedge: Optional[np.ndarray],
+        fx: Optional[np.ndarray]
     ) -> Optional[Trade]:
         """
         주문 실행 (시뮬레이션)
         
+        BUY는 현물 매수 + 선물 숏 진입, SELL은 양 레그 청산으로 처리합니다.
+        체결가는 해당 bar의 레그별 가격에 슬리피지를 적용합니다.
+        
         Args:
             signal: 시그널
-            capital: 현재 자본
+            portfolio: 포트폴리오
+            bar: 시그널 발생 bar 인덱스
+            spot, hedge, fx: 레그별 가격 배열
             
         Returns:
             Trade 또는 None
         """
         if signal.price is None or signal.price <= 0:
             return None
-            
-        # 슬리피지 적용
+        
         if signal.action == 'BUY':
-            exec_price = signal.price * (1 + self.config.slippage_rate)
-        else:
-            exec_price = signal.price * (1 - self.config.slippage_rate)
-        
-        # 수량 계산
-        quantity = signal.quantity * capital / exec_price
-        
-        # 수수료 계산
-        commission = quantity * exec_price * self.config.commission_rate
-        
-        return Trade(
-            timestamp=signal.timestamp,
-            symbol=signal.symbol,
-            side=signal.action,
-            quantity=quantity,
-            price=exec_price,
-            commission=commission,
-            pnl=0  # 청산 시 계산
+            return self._open(
+                portfolio, bar, signal.timestamp, signal.symbol, signal.quantity, spot, hedge, fx
+            )
+        if signal.action == 'SELL':
+            return self._close(portfolio, bar, signal.timestamp, signal.symbol, spot, hedge, fx)
+        return None
+    
+    def _open(
+        self,
+        portfolio: Portfolio,
+        bar: int,
+        timestamp: Any,
+        symbol: str,
+        fraction: float,
+        spot: np.ndarray,
+        hedge: Optional[np.ndarray],
+        fx: Optional[np.ndarray]
+    ) -> Optional[Trade]:
+        """진입 체결 (리스크 검사 후 허용 수량 이내)"""
+        max_quantity = None
+        if self.risk is not None:
+            max_quantity = self.risk.max_entry_quantity(bar, portfolio)
+            if max_quantity <= 0:
+                return None
+        return portfolio.open(
+            bar, timestamp, symbol, fraction, spot[bar],
+            hedge[bar] if hedge is not None else 0.0,
+            fx[bar] if fx is not None else 1.0,
+            max_quantity=max_quantity
+        )
+    
+    def _close(
+        self,
+        portfolio: Portfolio,
+        bar: int,
+        timestamp: Any,
+        symbol: str,
+        spot: np.ndarray,
+        hedge: Optional[np.ndarray],
+        fx: Optional[np.ndarray]
+    ) -> Optional[Trade]:
+        """청산 체결"""
+        if self.risk is not None:
+            self.risk.observe(bar, portfolio)
+        return portfolio.close(
+            bar, timestamp, symbol, spot[bar],
+            hedge[bar] if hedge is not None else 0.0,
+            fx[bar] if fx is not None else 1.0
         )
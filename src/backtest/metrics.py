@@ -30,7 +30,7 @@ class PerformanceMetrics:
         if len(self.equity) < 2:
             return 0.0
         
-        total_days = (self.equity.index[-1] - self.equity.index[0]).days
+        total_days = self._elapsed_days()
         if total_days <= 0:
             return 0.0
             
@@ -42,6 +42,13 @@ class PerformanceMetrics:
             
         return (1 + total_ret) ** (1 / years) - 1
     
+    def _elapsed_days(self) -> int:
+        """자산 곡선 기간 (일, 정수 epoch-ns 인덱스 지원)"""
+        start, end = self.equity.index[0], self.equity.index[-1]
+        if isinstance(start, (int, np.integer)):
+            start, end = pd.Timestamp(start), pd.Timestamp(end)
+        return (end - start).days
+    
     def sharpe_ratio(self, risk_free_rate: float = 0.03) -> float:
         """
         샤프 비율
@@ -71,21 +78,27 @@ class PerformanceMetrics:
         drawdown = (self.equity - cummax) / cummax
         return abs(drawdown.min())
     
+    def closed_trades(self) -> List:
+        """청산 거래 목록 (실현손익이 기록된 SELL 거래)"""
+        return [t for t in self.trades if t.side == 'SELL']
+    
     def win_rate(self) -> float:
-        """승률"""
-        if not self.trades:
+        """승률 (청산 거래 기준)"""
+        closed = self.closed_trades()
+        if not closed:
             return 0.0
             
-        wins = sum(1 for t in self.trades if t.pnl > 0)
-        return wins / len(self.trades)
+        wins = sum(1 for t in closed if t.pnl > 0)
+        return wins / len(closed)
     
     def profit_factor(self) -> float:
         """Profit Factor (총이익/총손실)"""
-        if not self.trades:
+        closed = self.closed_trades()
+        if not closed:
             return 0.0
             
-        gross_profit = sum(t.pnl for t in self.trades if t.pnl > 0)
-        gross_loss = abs(sum(t.pnl for t in self.trades if t.pnl < 0))
+        gross_profit = sum(t.pnl for t in closed if t.pnl > 0)
+        gross_loss = abs(sum(t.pnl for t in closed if t.pnl < 0))
         
         if gross_loss == 0:
             return float('inf') if gross_profit > 0 else 0.0
@@ -0,0 +1,260 @@
+"""포지션 및 손익 관리
+
+김프 차익거래의 두 레그(업비트 현물 롱 / 바이낸스 선물 숏)를 하나의 포지션으로
+추적합니다. 체결 시점의 상태만 기록하고, 평가금액(mark-to-market)은 백테스트
+종료 후 포지션 × 가격 배열 연산 한 번으로 계산합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+
+
+@dataclass
+class Trade:
+    """거래 기록
+
+    BUY는 진입(현물 매수 + 선물 숏), SELL은 청산(현물 매도 + 선물 커버)입니다.
+    pnl은 청산 거래에만 기록되며 양 레그의 진입/청산 수수료를 차감한 실현손익입니다.
+    """
+    timestamp: datetime
+    symbol: str
+    side: str  # 'BUY', 'SELL'
+    quantity: float
+    price: float
+    commission: float
+    pnl: float = 0
+    hedge_quantity: float = 0  # 선물 숏 수량
+    hedge_price: float = 0     # 선물 체결가 (USDT)
+
+
+@dataclass
+class Position:
+    """페어 포지션 (현물 롱 + 선물 숏)"""
+    spot_qty: float = 0.0          # 업비트 현물 수량
+    spot_entry: float = 0.0        # 현물 평균 진입가 (KRW)
+    hedge_qty: float = 0.0         # 바이낸스 선물 숏 수량
+    hedge_entry: float = 0.0       # 선물 평균 진입가 (USDT)
+    entry_commission: float = 0.0  # 진입 수수료 누계 (KRW)
+
+    @property
+    def is_open(self) -> bool:
+        return self.spot_qty > 0
+
+
+class Portfolio:
+    """
+    페어 포지션 포트폴리오
+
+    Args:
+        initial_capital: 초기 자본 (KRW)
+        commission_rate: 레그별 수수료율
+        slippage_rate: 레그별 슬리피지율
+
+    Example:
+        >>> portfolio = Portfolio(20_000_000, 0.001, 0.0005)
+        >>> portfolio.open(10, ts, 'BTC', 1.0, 136_500_000, 100_000, 1_300)
+        >>> portfolio.close(20, ts, 'BTC', 131_000_000, 100_500, 1_300)
+        >>> equity = portfolio.mark_to_market(spot, hedge, fx)
+    """
+
+    def __init__(
+        self,
+        initial_capital: float,
+        commission_rate: float = 0.0,
+        slippage_rate: float = 0.0
+    ):
+        self.initial_capital = initial_capital
+        self.commission_rate = commission_rate
+        self.slippage_rate = slippage_rate
+        self.cash = float(initial_capital)
+        self.position = Position()
+
+        # 상태 변경 기록 (체결 bar 인덱스 기준)
+        self._bars: List[int] = []
+        self._cash: List[float] = []
+        self._spot_qty: List[float] = []
+        self._hedge_qty: List[float] = []
+        self._hedge_entry: List[float] = []
+
+    def equity(self, spot_price: float, hedge_price: float = 0.0, fx: float = 1.0) -> float:
+        """현재 평가금액 (단일 시점)"""
+        pos = self.position
+        return (
+            self.cash
+            + pos.spot_qty * spot_price
+            + pos.hedge_qty * (pos.hedge_entry - hedge_price) * fx
+        )
+
+    def open(
+        self,
+        bar: int,
+        timestamp: datetime,
+        symbol: str,
+        fraction: float,
+        spot_price: float,
+        hedge_price: float = 0.0,
+        fx: float = 1.0,
+        max_quantity: Optional[float] = None
+    ) -> Optional[Trade]:
+        """
+        진입 (현물 매수 + 선물 숏)
+
+        보유 현금의 ``fraction`` 만큼을 현물 매수 대금과 양 레그 수수료에
+        사용합니다. 선물 레그는 현물과 같은 수량으로 헤지합니다.
+        hedge_price가 0이면 현물 단일 레그로 처리합니다.
+
+        Args:
+            max_quantity: 최대 진입 수량 (리스크 한도, None이면 제한 없음)
+
+        Returns:
+            Trade 또는 None (진입 불가)
+        """
+        if fraction <= 0 or not spot_price > 0 or self.cash <= 0:
+            return None
+
+        spot_exec = spot_price * (1 + self.slippage_rate)
+        hedge_exec = hedge_price * (1 - self.slippage_rate) if hedge_price > 0 else 0.0
+        hedge_krw = hedge_exec * fx
+
+        # 현물 대금 + 양 레그 수수료가 배정 금액을 넘지 않도록 수량 계산
+        budget = fraction * self.cash
+        quantity = budget / (spot_exec * (1 + self.commission_rate) + hedge_krw * self.commission_rate)
+        if max_quantity is not None:
+            quantity = min(quantity, max_quantity)
+            if quantity <= 0:
+                return None
+        hedge_qty = quantity if hedge_exec > 0 else 0.0
+        commission = (quantity * spot_exec + hedge_qty * hedge_krw) * self.commission_rate
+
+        pos = self.position
+        new_spot = pos.spot_qty + quantity
+        new_hedge = pos.hedge_qty + hedge_qty
+        pos.spot_entry = (pos.spot_qty * pos.spot_entry + quantity * spot_exec) / new_spot
+        if new_hedge > 0:
+            pos.hedge_entry = (pos.hedge_qty * pos.hedge_entry + hedge_qty * hedge_exec) / new_hedge
+        pos.spot_qty = new_spot
+        pos.hedge_qty = new_hedge
+        pos.entry_commission += commission
+
+        self.cash -= quantity * spot_exec + commission
+        self._record(bar)
+
+        return Trade(
+            timestamp=timestamp,
+            symbol=symbol,
+            side='BUY',
+            quantity=quantity,
+            price=spot_exec,
+            commission=commission,
+            hedge_quantity=hedge_qty,
+            hedge_price=hedge_exec
+        )
+
+    def close(
+        self,
+        bar: int,
+        timestamp: datetime,
+        symbol: str,
+        spot_price: float,
+        hedge_price: float = 0.0,
+        fx: float = 1.0
+    ) -> Optional[Trade]:
+        """
+        청산 (현물 매도 + 선물 숏 커버)
+
+        Returns:
+            실현손익(양 레그 진입/청산 수수료 차감)이 기록된 Trade 또는 None
+        """
+        pos = self.position
+        if not pos.is_open or not spot_price > 0:
+            return None
+
+        spot_exec = spot_price * (1 - self.slippage_rate)
+        hedge_exec = hedge_price * (1 + self.slippage_rate) if pos.hedge_qty > 0 else 0.0
+
+        spot_proceeds = pos.spot_qty * spot_exec
+        hedge_pnl = pos.hedge_qty * (pos.hedge_entry - hedge_exec) * fx
+        commission = (spot_proceeds + pos.hedge_qty * hedge_exec * fx) * self.commission_rate
+
+        pnl = (
+            pos.spot_qty * (spot_exec - pos.spot_entry)
+            + hedge_pnl
+            - pos.entry_commission
+            - commission
+        )
+
+        trade = Trade(
+            timestamp=timestamp,
+            symbol=symbol,
+            side='SELL',
+            quantity=pos.spot_qty,
+            price=spot_exec,
+            commission=commission,
+            pnl=pnl,
+            hedge_quantity=pos.hedge_qty,
+            hedge_price=hedge_exec
+        )
+
+        self.cash += spot_proceeds + hedge_pnl - commission
+        self.position = Position()
+        self._record(bar)
+
+        return trade
+
+    def mark_to_market(
+        self,
+        spot_prices: np.ndarray,
+        hedge_prices: Optional[np.ndarray] = None,
+        fx: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        bar별 평가금액 계산 (벡터화)
+
+        체결 기록을 bar 축으로 펼친 뒤 포지션 × 가격 배열 연산으로
+        평가금액을 구합니다. 같은 bar의 체결은 bar 종가 기준으로 반영됩니다.
+
+        Args:
+            spot_prices: 현물 가격 배열 (KRW)
+            hedge_prices: 선물 가격 배열 (USDT)
+            fx: 환율 배열
+
+        Returns:
+            평가금액 배열 (len(spot_prices))
+        """
+        spot_prices = np.asarray(spot_prices, dtype=np.float64)
+        n = len(spot_prices)
+
+        # 상태 0: 초기 상태, 상태 k: k번째 체결 이후
+        cash = np.concatenate(([float(self.initial_capital)], self._cash))
+        spot_qty = np.concatenate(([0.0], self._spot_qty))
+        hedge_qty = np.concatenate(([0.0], self._hedge_qty))
+        hedge_entry = np.concatenate(([0.0], self._hedge_entry))
+
+        state = np.searchsorted(np.asarray(self._bars, dtype=np.int64), np.arange(n), side='right')
+
+        # 포지션이 없는 구간은 가격 결측(NaN)과 무관하게 0
+        held = spot_qty[state]
+        equity = cash[state] + np.where(held > 0, held * spot_prices, 0.0)
+        if hedge_prices is not None and len(self._bars):
+            hedge_prices = np.asarray(hedge_prices, dtype=np.float64)
+            fx = np.ones(n) if fx is None else np.asarray(fx, dtype=np.float64)
+            qty = hedge_qty[state]
+            equity = equity + np.where(qty > 0, qty * (hedge_entry[state] - hedge_prices) * fx, 0.0)
+        return equity
+
+    def _record(self, bar: int) -> None:
+        """체결 후 상태 기록 (같은 bar는 마지막 상태로 덮어씀)"""
+        if self._bars and self._bars[-1] == bar:
+            self._bars.pop()
+            self._cash.pop()
+            self._spot_qty.pop()
+            self._hedge_qty.pop()
+            self._hedge_entry.pop()
+        self._bars.append(bar)
+        self._cash.append(self.cash)
+        self._spot_qty.append(self.position.spot_qty)
+        self._hedge_qty.append(self.position.hedge_qty)
+        self._hedge_entry.append(self.position.hedge_entry)
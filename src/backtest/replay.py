@@ -0,0 +1,281 @@
+"""리플레이 하네스
+
+캐시된 김프 데이터를 라이브와 같은 경로(BaseStrategy.on_bar 증분 처리 →
+시그널 이벤트 발행 → 체결 콜백)로 흘려보내고, BacktestEngine.run 결과와
+시그널 단위로 비교합니다.
+
+파이프라인은 제너레이터로 연결되어 있어 한 번에 청크 하나(chunk_size개 bar)만
+메모리에 올립니다. bar별 처리 지연은 고정 크기 로그 히스토그램에 누적하므로
+bar 수와 무관하게 메모리 사용량이 일정합니다.
+
+    데이터 청크 → bar dict → (속도 조절) → strategy.on_bar → 이벤트 로그 / 체결 콜백
+
+Example:
+    >>> harness = ReplayHarness(strategy, speed=None, event_log=EventLog('logs/replay.jsonl'))
+    >>> result = harness.run(KimpDataset('data/kimp', 'BTC'), start='2024-01-01')
+    >>> result.summary()
+    {'bars': 525600, 'signals': 48, 'bars_per_sec': 410000.0, 'latency_p50_us': 1.9, ...}
+    >>> result.diff(BacktestEngine(config).run(strategy, data))
+    Empty DataFrame
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..data.dataset import KimpDataset
+from ..strategies.base import BaseStrategy, Signal
+from ..utils.events import EventLog
+from .engine import BacktestResult
+from .portfolio import Trade
+
+SIGNAL_COLUMNS = ['timestamp', 'action', 'price', 'reason']
+
+
+class LatencyStats:
+    """
+    처리 지연 히스토그램 (고정 메모리)
+
+    10ns ~ 10s 구간을 로그 간격 bin으로 나눠 누적합니다 (bin 폭 약 9%).
+    분위수는 해당 bin의 상한값입니다.
+
+    Args:
+        bins: bin 수
+    """
+
+    def __init__(self, bins: int = 240):
+        self.edges = np.geomspace(10, 1e10, bins + 1)
+        self.counts = np.zeros(bins + 2, dtype=np.int64)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, samples: np.ndarray) -> None:
+        """지연 샘플 추가 (ns)"""
+        if not len(samples):
+            return
+        self.counts += np.bincount(np.searchsorted(self.edges, samples), minlength=len(self.counts))
+        self.count += len(samples)
+        self.total_ns += int(samples.sum())
+        self.max_ns = max(self.max_ns, int(samples.max()))
+
+    def percentile(self, q: float) -> float:
+        """분위수 (ns, q: 0~100)"""
+        if not self.count:
+            return float('nan')
+        rank = np.searchsorted(np.cumsum(self.counts), q / 100 * self.count)
+        if rank >= len(self.edges):
+            return float(self.max_ns)
+        return float(min(self.edges[rank], self.max_ns))
+
+    @property
+    def mean(self) -> float:
+        """평균 (ns)"""
+        return self.total_ns / self.count if self.count else float('nan')
+
+
+@dataclass
+class ReplayResult:
+    """리플레이 결과"""
+    bars: int
+    signals: pd.DataFrame
+    elapsed: float                  # 벽시계 시간 (초)
+    latency: LatencyStats = field(default_factory=LatencyStats)
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 bar 수"""
+        return self.bars / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def summary(self) -> Dict[str, float]:
+        """처리량/지연 요약 (지연 단위: µs)"""
+        return {
+            'bars': self.bars,
+            'signals': len(self.signals),
+            'elapsed_sec': round(self.elapsed, 3),
+            'bars_per_sec': round(self.throughput, 1),
+            'latency_mean_us': round(self.latency.mean / 1e3, 2),
+            'latency_p50_us': round(self.latency.percentile(50) / 1e3, 2),
+            'latency_p99_us': round(self.latency.percentile(99) / 1e3, 2),
+            'latency_max_us': round(self.latency.max_ns / 1e3, 2),
+        }
+
+    def diff(self, backtest: Union[BacktestResult, List[Trade]]) -> pd.DataFrame:
+        """BacktestEngine.run 체결 내역과 시그널 비교 (diff_signals 참고)"""
+        trades = backtest.trades if isinstance(backtest, BacktestResult) else backtest
+        return diff_signals(self.signals, trades)
+
+
+def diff_signals(signals: pd.DataFrame, trades: List[Trade]) -> pd.DataFrame:
+    """
+    시그널 단위 비교
+
+    리플레이 시그널과 백테스트 체결의 (시각, BUY/SELL) 쌍을 맞춰보고
+    한쪽에만 있는 항목을 반환합니다.
+
+    Args:
+        signals: ReplayResult.signals
+        trades: BacktestResult.trades
+
+    Returns:
+        timestamp, action, source('replay' | 'backtest') 컬럼 DataFrame
+        (비어 있으면 일치)
+    """
+    replay = pd.DataFrame({
+        'timestamp': pd.to_datetime(signals['timestamp'].tolist()),
+        'action': signals['action'].to_numpy(dtype=object),
+    })
+    backtest = pd.DataFrame({
+        'timestamp': pd.to_datetime([t.timestamp for t in trades]),
+        'action': pd.Series([t.side for t in trades], dtype=object),
+    })
+    merged = replay.merge(backtest, on=['timestamp', 'action'], how='outer', indicator=True)
+    mismatched = merged[merged['_merge'] != 'both']
+    source = mismatched['_merge'].map({'left_only': 'replay', 'right_only': 'backtest'})
+    return pd.DataFrame({
+        'timestamp': mismatched['timestamp'],
+        'action': mismatched['action'],
+        'source': source.astype(object),
+    }).sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+
+def frame_chunks(data: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """DataFrame을 chunk_size개 bar씩 나눠 반환"""
+    for start in range(0, len(data), chunk_size):
+        yield data.iloc[start:start + chunk_size]
+
+
+def iter_bars(chunks: Iterable[pd.DataFrame]) -> Iterator[Dict[str, Any]]:
+    """
+    청크를 bar dict로 펼치기 (라이브 수신 메시지 형식)
+
+    timestamp 컬럼이 없으면 인덱스를 사용합니다 (컴팩트 스키마).
+    """
+    for chunk in chunks:
+        columns = list(chunk.columns)
+        values = [chunk[name].tolist() for name in columns]
+        if 'timestamp' not in chunk.columns:
+            columns.append('timestamp')
+            values.append(chunk.index.tolist())
+        for row in zip(*values):
+            yield dict(zip(columns, row))
+
+
+def paced(
+    bars: Iterable[Dict[str, Any]],
+    speed: Optional[float],
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep
+) -> Iterator[Dict[str, Any]]:
+    """
+    bar 시각 간격을 실시간 × speed 배속으로 재현
+
+    Args:
+        bars: bar dict 제너레이터
+        speed: 배속 (60 = 1분봉을 1초에 하나, None이면 최대 속도)
+    """
+    if not speed:
+        yield from bars
+        return
+
+    origin: Optional[pd.Timestamp] = None
+    wall_origin = 0.0
+    for bar in bars:
+        timestamp = pd.Timestamp(bar['timestamp'])
+        if origin is None:
+            origin, wall_origin = timestamp, clock()
+        wait = wall_origin + (timestamp - origin).total_seconds() / speed - clock()
+        if wait > 0:
+            sleep(wait)
+        yield bar
+
+
+class ReplayHarness:
+    """
+    라이브 경로 리플레이 드라이버
+
+    Args:
+        strategy: 증분(on_bar) 처리할 전략
+        speed: 배속 (None이면 최대 속도)
+        chunk_size: 한 번에 읽는 bar 수 (메모리 상한)
+        event_log: 시그널 이벤트 기록 (라이브와 같은 JSONL 로그)
+    """
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        speed: Optional[float] = None,
+        chunk_size: int = 10_000,
+        event_log: Optional[EventLog] = None
+    ):
+        self.strategy = strategy
+        self.speed = speed
+        self.chunk_size = chunk_size
+        self.event_log = event_log
+
+    def run(
+        self,
+        source: Union[pd.DataFrame, KimpDataset],
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> ReplayResult:
+        """
+        리플레이 실행
+
+        Args:
+            source: 데이터 (DataFrame 또는 KimpDataset 캐시)
+            start, end: KimpDataset 조회 구간 (DataFrame은 그대로 사용)
+
+        Returns:
+            ReplayResult
+        """
+        if isinstance(source, pd.DataFrame):
+            chunks = frame_chunks(source, self.chunk_size)
+        else:
+            chunks = source.iter_chunks(start, end, self.chunk_size)
+
+        strategy = self.strategy
+        strategy.reset()
+        latency = LatencyStats()
+        samples = np.empty(self.chunk_size, dtype=np.int64)
+        filled = 0
+        bars = 0
+        signals: List[tuple] = []
+        now = time.perf_counter_ns
+
+        started = time.perf_counter()
+        for bar in paced(iter_bars(chunks), self.speed):
+            received = now()
+            signal = strategy.on_bar(bar)
+            if signal is not None:
+                self._publish(signal)
+                signals.append((signal.timestamp, signal.action, signal.price, signal.reason))
+            samples[filled] = now() - received
+            filled += 1
+            bars += 1
+            if filled == len(samples):
+                latency.add(samples)
+                filled = 0
+        latency.add(samples[:filled])
+        elapsed = time.perf_counter() - started
+
+        return ReplayResult(
+            bars=bars,
+            signals=pd.DataFrame(signals, columns=SIGNAL_COLUMNS),
+            elapsed=elapsed,
+            latency=latency,
+        )
+
+    def _publish(self, signal: Signal) -> None:
+        """시그널 발행 (이벤트 로그 + 즉시 체결 가정 콜백)"""
+        if self.event_log is not None:
+            self.event_log.log('signal', strategy=self.strategy.name, **signal.model_dump())
+        if signal.action in ('BUY', 'SELL'):
+            self.strategy.on_order_filled({
+                'symbol': signal.symbol,
+                'quantity': signal.quantity,
+                'side': signal.action,
+            })
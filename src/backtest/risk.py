@@ -0,0 +1,187 @@
+"""주문 전 리스크 검사
+
+strategies/kimchi_premium/RISK_MANAGEMENT.md, PARAMETERS.md의 규칙을
+BacktestEngine의 진입 주문 앞 단계로 적용합니다.
+
+- 레그별 최대 명목금액 (업비트 현물 / 바이낸스 선물, KRW)
+- 바이낸스 선물 숏 증거금 사용률 (명목금액 / 증거금)
+- 환율 급등 진입 차단 (환율 > 720분 MA × FX_SURGE_THRESHOLD)
+- 일일 손실 한도 (당일 시작 평가금액 대비)
+
+환율 차단 마스크, bar별 날짜/당일 첫 bar는 prepare()에서 한 번 계산하고,
+당일 시작 평가금액은 체결 직전에만 갱신하므로 검사 비용은 bar 수와 무관하게
+주문당 O(1)입니다.
+
+차단되거나 한도로 수량이 0이 된 진입은 전략에 거부로 알려지고
+(BaseStrategy.on_order_rejected), 전략은 포지션 없는 상태에서 다음 bar부터
+다시 진입을 판단합니다.
+
+Example:
+    >>> risk = RiskEngine(RiskConfig(max_spot_notional=30_000_000, daily_loss_limit=0.02))
+    >>> engine = BacktestEngine(config, risk=risk)
+    >>> result = engine.run(strategy, data, vectorized=True)
+    >>> risk.blocked
+    {'fx_surge': 3, 'daily_loss': 1}
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data.features import FX_MA_PERIOD, rolling_mean_std
+from ..data.schema import epoch_ns
+from .portfolio import Portfolio
+
+# PARAMETERS.md 기본값
+FX_SURGE_THRESHOLD = 1.001
+BINANCE_ALLOCATION = 0.50
+
+NS_PER_DAY = 86_400 * 10**9
+
+
+@dataclass
+class RiskConfig:
+    """리스크 한도 (None이면 해당 검사 안 함)"""
+    max_spot_notional: Optional[float] = None     # 업비트 현물 레그 최대 명목금액 (KRW)
+    max_hedge_notional: Optional[float] = None    # 바이낸스 선물 레그 최대 명목금액 (KRW 환산)
+    max_margin_usage: Optional[float] = None      # 선물 명목금액 / 증거금 상한 (1.0 = 1x)
+    hedge_margin_ratio: float = BINANCE_ALLOCATION  # 평가금액 중 바이낸스 증거금 비율
+    fx_surge_threshold: Optional[float] = FX_SURGE_THRESHOLD  # 환율 / 환율 MA 상한
+    fx_ma_period: int = FX_MA_PERIOD              # 환율 MA 기간 (데이터에 fx_ma가 없을 때)
+    daily_loss_limit: Optional[float] = None      # 당일 손실 한도 (당일 시작 평가금액 대비, 0.02 = 2%)
+
+
+class RiskEngine:
+    """
+    주문 전 리스크 검사기
+
+    Args:
+        config: 리스크 한도
+
+    Attributes:
+        blocked: 사유별 차단된 진입 수
+    """
+
+    def __init__(self, config: Optional[RiskConfig] = None):
+        self.config = config or RiskConfig()
+        self.blocked: Dict[str, int] = {}
+
+        self._spot = np.empty(0)
+        self._hedge: Optional[np.ndarray] = None
+        self._fx: Optional[np.ndarray] = None
+        self._fx_blocked = np.zeros(0, dtype=bool)
+        self._day = np.zeros(0, dtype=np.int64)
+        self._day_start = np.zeros(0, dtype=np.int64)
+        self._current_day: Optional[int] = None
+        self._day_start_equity = math.nan
+
+    def prepare(
+        self,
+        index: pd.Index,
+        spot: np.ndarray,
+        hedge: Optional[np.ndarray] = None,
+        fx: Optional[np.ndarray] = None,
+        fx_ma: Optional[np.ndarray] = None,
+        fx_history: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        백테스트 구간 사전 계산 (실행마다 호출)
+
+        Args:
+            index: bar 시각 (DatetimeIndex 또는 int64 epoch-ns)
+            spot, hedge, fx: 레그별 가격 배열 (엔진과 동일)
+            fx_ma: 환율 이동평균 (add_features의 fx_ma, None이면 계산)
+            fx_history: 구간 시작 전 환율 (fx_ma 계산 시 워밍업; 없으면 처음
+                fx_ma_period-1개 bar는 MA가 없어 환율 차단을 하지 않음)
+        """
+        cfg = self.config
+        n = len(spot)
+        self.blocked = {}
+        self._spot, self._hedge, self._fx = spot, hedge, fx
+        self._current_day = None
+        self._day_start_equity = math.nan
+
+        self._fx_blocked = np.zeros(n, dtype=bool)
+        if cfg.fx_surge_threshold is not None and fx is not None:
+            if fx_ma is None:
+                history = np.asarray(fx_history if fx_history is not None else [], dtype=np.float64)
+                fx_ma = rolling_mean_std(np.concatenate([history, fx]), cfg.fx_ma_period)[0][len(history):]
+            with np.errstate(invalid='ignore'):
+                self._fx_blocked = fx > np.asarray(fx_ma, dtype=np.float64) * cfg.fx_surge_threshold
+
+        # bar별 날짜(UTC)와 당일 첫 bar
+        self._day = epoch_ns(index) // NS_PER_DAY if n else np.zeros(0, dtype=np.int64)
+        starts = np.flatnonzero(np.diff(self._day, prepend=self._day[:1] - 1))
+        self._day_start = starts[np.searchsorted(starts, np.arange(n), side='right') - 1]
+
+    def observe(self, bar: int, portfolio: Portfolio) -> None:
+        """
+        체결 직전 호출 (날짜가 바뀌면 당일 시작 평가금액 갱신)
+
+        당일 첫 체결 전까지 포트폴리오 상태가 그대로이므로
+        현재 상태 × 당일 첫 bar 가격으로 당일 시작 평가금액을 구합니다.
+        """
+        day = self._day[bar]
+        if day != self._current_day:
+            self._current_day = day
+            self._day_start_equity = self._equity(portfolio, self._day_start[bar])
+
+    def max_entry_quantity(self, bar: int, portfolio: Portfolio) -> float:
+        """
+        진입 가능 최대 수량
+
+        Returns:
+            최대 수량 (inf = 제한 없음, 0 = 진입 차단)
+        """
+        cfg = self.config
+        self.observe(bar, portfolio)
+
+        if self._fx_blocked[bar]:
+            self._count('fx_surge')
+            return 0.0
+
+        equity = self._equity(portfolio, bar)
+        if cfg.daily_loss_limit is not None and self._day_start_equity > 0:
+            if equity <= self._day_start_equity * (1 - cfg.daily_loss_limit):
+                self._count('daily_loss')
+                return 0.0
+
+        pos = portfolio.position
+        spot = self._spot[bar]
+        hedge_krw = self._price(self._hedge, bar, 0.0) * self._price(self._fx, bar, 1.0)
+
+        limits = {}
+        if cfg.max_spot_notional is not None and spot > 0:
+            limits['spot_notional'] = (cfg.max_spot_notional - pos.spot_qty * spot) / spot
+        if hedge_krw > 0:
+            hedge_used = pos.hedge_qty * hedge_krw
+            if cfg.max_hedge_notional is not None:
+                limits['hedge_notional'] = (cfg.max_hedge_notional - hedge_used) / hedge_krw
+            if cfg.max_margin_usage is not None:
+                margin = equity * cfg.hedge_margin_ratio
+                limits['margin'] = (margin * cfg.max_margin_usage - hedge_used) / hedge_krw
+
+        if not limits:
+            return math.inf
+        reason, quantity = min(limits.items(), key=lambda item: item[1])
+        if quantity <= 0:
+            self._count(reason)
+            return 0.0
+        return quantity
+
+    def _equity(self, portfolio: Portfolio, bar: int) -> float:
+        return portfolio.equity(
+            self._spot[bar],
+            self._price(self._hedge, bar, 0.0),
+            self._price(self._fx, bar, 1.0),
+        )
+
+    @staticmethod
+    def _price(values: Optional[np.ndarray], bar: int, default: float) -> float:
+        return values[bar] if values is not None else default
+
+    def _count(self, reason: str, count: int = 1) -> None:
+        self.blocked[reason] = self.blocked.get(reason, 0) + count
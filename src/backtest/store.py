@@ -0,0 +1,339 @@
+"""백테스트 결과 저장소
+
+결과(설정, 파라미터, 성과 지표)는 로컬 SQLite에, 자산 곡선과 거래 내역은
+Parquet 파일로 저장합니다. 같은 설정 + 파라미터 + 데이터 해시의 실행은
+저장된 결과를 재사용합니다.
+
+디렉토리 구조:
+    data/results/
+    ├── results.db           # runs, run_params 테이블
+    ├── curves/<run_id>.parquet
+    ├── trades/<run_id>.parquet
+    └── state/
+        ├── <run_id>.json    # 리스크 차단 횟수, 데이터 검증 요약
+        └── <run_id>.parquet # 데이터 검증 행별 플래그 (잘못된 bar 처리 실행만)
+"""
+
+import json
+from dataclasses import asdict, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import (
+    Column, Float, Index, Integer, MetaData, String, Table, Text,
+    and_, create_engine, exists, insert, select, delete,
+)
+
+from ..data.validation import ValidationReport
+from ..strategies.base import BaseStrategy
+from ..utils.hashing import frame_fingerprint
+from .engine import BacktestConfig, BacktestEngine, BacktestResult
+from .portfolio import Trade
+
+# 인덱스가 걸린 성과 지표 컬럼
+METRIC_COLUMNS = (
+    'total_return',
+    'cagr',
+    'sharpe_ratio',
+    'max_drawdown',
+    'win_rate',
+    'profit_factor',
+    'total_trades',
+)
+
+Range = Tuple[Optional[float], Optional[float]]
+
+metadata = MetaData()
+
+runs = Table(
+    'runs', metadata,
+    Column('run_id', String(32), primary_key=True),
+    Column('strategy', String(64), nullable=False),
+    Column('data_hash', String(32), nullable=False),
+    Column('config', Text, nullable=False),
+    Column('params', Text, nullable=False),
+    Column('created_at', String(32), nullable=False),
+    Column('start_date', String(32)),
+    Column('end_date', String(32)),
+    Column('total_return', Float),
+    Column('cagr', Float),
+    Column('sharpe_ratio', Float),
+    Column('max_drawdown', Float),
+    Column('win_rate', Float),
+    Column('profit_factor', Float),
+    Column('total_trades', Integer),
+    Index('ix_runs_strategy_data', 'strategy', 'data_hash'),
+    Index('ix_runs_sharpe', 'sharpe_ratio'),
+    Index('ix_runs_total_return', 'total_return'),
+    Index('ix_runs_max_drawdown', 'max_drawdown'),
+)
+
+# 수치 파라미터 (범위 검색용)
+run_params = Table(
+    'run_params', metadata,
+    Column('run_id', String(32), primary_key=True),
+    Column('name', String(64), primary_key=True),
+    Column('value', Float, nullable=False),
+    Index('ix_run_params_name_value', 'name', 'value'),
+)
+
+
+class ResultStore:
+    """
+    백테스트 결과 저장소
+
+    Args:
+        root: 저장 디렉토리 (기본: data/results)
+
+    Example:
+        >>> store = ResultStore()
+        >>> result = store.get_or_run(engine, strategy, data)
+        >>> top = store.query(
+        ...     order_by='sharpe_ratio',
+        ...     limit=20,
+        ...     metrics={'max_drawdown': (None, 0.05)},
+        ...     params={'entry_threshold': (0.02, 0.03)}
+        ... )
+    """
+
+    def __init__(self, root: str = 'data/results'):
+        self.root = Path(root)
+        (self.root / 'curves').mkdir(parents=True, exist_ok=True)
+        (self.root / 'trades').mkdir(parents=True, exist_ok=True)
+        (self.root / 'state').mkdir(parents=True, exist_ok=True)
+
+        self.db = create_engine(
+            f"sqlite:///{self.root / 'results.db'}",
+            connect_args={'timeout': 30}
+        )
+        metadata.create_all(self.db)
+
+    def get_or_run(
+        self,
+        engine: BacktestEngine,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        **run_kwargs: Any
+    ) -> BacktestResult:
+        """
+        저장된 결과 조회, 없으면 실행 후 저장
+
+        저장된 결과를 쓰면 engine.restore로 전략/엔진 상태를 복원합니다
+        (BacktestEngine 캐시 적중과 동일).
+
+        Args:
+            engine: 백테스트 엔진
+            strategy: 전략 객체
+            data: 입력 데이터
+            **run_kwargs: engine.run 추가 인자 (예: vectorized=True)
+
+        Returns:
+            BacktestResult
+        """
+        data_hash = frame_fingerprint(data)
+        run_id = engine.run_key(strategy, data_hash, **run_kwargs)
+
+        cached = self.load(run_id)
+        if cached is not None:
+            engine.restore(strategy, cached)
+            return cached
+
+        result = engine.run(strategy, data, **run_kwargs)
+        self.save(result, strategy, data_hash, run_id=run_id)
+        return result
+
+    def save(
+        self,
+        result: BacktestResult,
+        strategy: BaseStrategy,
+        data_hash: str,
+        run_id: Optional[str] = None,
+        engine: Optional[BacktestEngine] = None,
+        **run_kwargs: Any
+    ) -> str:
+        """
+        결과 저장 (같은 run_id는 덮어씀)
+
+        run_id를 주지 않으면 get_or_run과 같은 키(engine.run_key)를 사용하므로,
+        같은 엔진 설정/실행 인자로 get_or_run하면 저장한 결과를 찾습니다.
+
+        Args:
+            result: 백테스트 결과
+            strategy: 전략 객체
+            data_hash: 입력 데이터 지문
+            run_id: 실행 키 (None이면 계산)
+            engine: 결과를 만든 엔진 (리스크 한도 등 엔진 설정을 키에 반영, None이면 result.config만)
+            **run_kwargs: engine.run 추가 인자 (예: vectorized=True)
+
+        Returns:
+            run_id
+        """
+        if run_id is None:
+            engine = engine or BacktestEngine(result.config)
+            run_id = engine.run_key(strategy, data_hash, **run_kwargs)
+
+        curve = result.equity_curve.rename('equity').to_frame()
+        curve.to_parquet(self._curve_path(run_id))
+        pd.DataFrame(
+            [asdict(t) for t in result.trades],
+            columns=[f.name for f in fields(Trade)]
+        ).to_parquet(self._trades_path(run_id), index=False)
+        self._save_state(run_id, result)
+
+        row = {
+            'run_id': run_id,
+            'strategy': strategy.name,
+            'data_hash': data_hash,
+            'config': json.dumps(asdict(result.config), sort_keys=True),
+            'params': json.dumps(strategy.params, sort_keys=True, default=str),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'start_date': result.config.start_date,
+            'end_date': result.config.end_date,
+            **{name: getattr(result, name) for name in METRIC_COLUMNS},
+        }
+        numeric_params = [
+            {'run_id': run_id, 'name': name, 'value': float(value)}
+            for name, value in strategy.params.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ]
+
+        with self.db.begin() as conn:
+            conn.execute(delete(run_params).where(run_params.c.run_id == run_id))
+            conn.execute(delete(runs).where(runs.c.run_id == run_id))
+            conn.execute(insert(runs), [row])
+            if numeric_params:
+                conn.execute(insert(run_params), numeric_params)
+
+        return run_id
+
+    def load(self, run_id: str) -> Optional[BacktestResult]:
+        """
+        저장된 결과 로드
+
+        Returns:
+            BacktestResult 또는 None (없음)
+        """
+        with self.db.connect() as conn:
+            row = conn.execute(select(runs).where(runs.c.run_id == run_id)).mappings().first()
+        if row is None or not self._curve_path(run_id).exists():
+            return None
+
+        curve = pd.read_parquet(self._curve_path(run_id))['equity']
+        trades = [
+            Trade(**record)
+            for record in pd.read_parquet(self._trades_path(run_id)).to_dict('records')
+        ]
+
+        return BacktestResult(
+            config=BacktestConfig(**json.loads(row['config'])),
+            trades=trades,
+            equity_curve=curve,
+            **{name: row[name] for name in METRIC_COLUMNS},
+            **self._load_state(run_id),
+        )
+
+    def query(
+        self,
+        order_by: str = 'sharpe_ratio',
+        descending: bool = True,
+        limit: int = 20,
+        strategy: Optional[str] = None,
+        metrics: Optional[Dict[str, Range]] = None,
+        params: Optional[Dict[str, Range]] = None
+    ) -> pd.DataFrame:
+        """
+        결과 검색
+
+        Args:
+            order_by: 정렬 기준 지표
+            descending: 내림차순 여부
+            limit: 최대 결과 수
+            strategy: 전략 이름 필터
+            metrics: 지표 범위 필터 {'max_drawdown': (None, 0.05)} (양 끝 포함)
+            params: 파라미터 범위 필터 {'entry_threshold': (0.02, 0.03)} (양 끝 포함)
+
+        Returns:
+            run_id, strategy, params, 지표 컬럼을 가진 DataFrame
+        """
+        if order_by not in METRIC_COLUMNS:
+            raise ValueError(f"정렬 기준은 {METRIC_COLUMNS} 중 하나여야 합니다: {order_by}")
+
+        conditions = []
+        if strategy:
+            conditions.append(runs.c.strategy == strategy)
+
+        for name, bounds in (metrics or {}).items():
+            if name not in METRIC_COLUMNS:
+                raise ValueError(f"알 수 없는 지표: {name}")
+            conditions.extend(_range(runs.c[name], bounds))
+
+        for name, bounds in (params or {}).items():
+            conditions.append(exists().where(and_(
+                run_params.c.run_id == runs.c.run_id,
+                run_params.c.name == name,
+                *_range(run_params.c.value, bounds)
+            )))
+
+        order = runs.c[order_by].desc() if descending else runs.c[order_by].asc()
+        stmt = (
+            select(runs.c.run_id, runs.c.strategy, runs.c.params, runs.c.start_date,
+                   runs.c.end_date, *[runs.c[name] for name in METRIC_COLUMNS])
+            .where(and_(True, *conditions))
+            .order_by(order)
+            .limit(limit)
+        )
+
+        with self.db.connect() as conn:
+            frame = pd.DataFrame(conn.execute(stmt).mappings().all())
+        if not frame.empty:
+            frame['params'] = frame['params'].map(json.loads)
+        return frame
+
+    def _save_state(self, run_id: str, result: BacktestResult) -> None:
+        """risk_blocked, quality 저장 (검증 플래그는 Parquet, 나머지는 JSON)"""
+        quality = result.quality
+        flags_path = self._state_path(run_id, 'parquet')
+        if quality is not None:
+            pd.DataFrame({'flags': quality.flags}).to_parquet(flags_path, index=False)
+        else:
+            flags_path.unlink(missing_ok=True)
+        self._state_path(run_id, 'json').write_text(json.dumps({
+            'risk_blocked': result.risk_blocked,
+            'quality': None if quality is None else {
+                f.name: getattr(quality, f.name) for f in fields(ValidationReport) if f.name != 'flags'
+            },
+        }))
+
+    def _load_state(self, run_id: str) -> Dict[str, Any]:
+        """_save_state로 저장한 BacktestResult 필드 (이전 버전 결과는 빈 dict)"""
+        path = self._state_path(run_id, 'json')
+        if not path.exists():
+            return {}
+        state = json.loads(path.read_text())
+        quality = state['quality']
+        if quality is not None:
+            flags = pd.read_parquet(self._state_path(run_id, 'parquet'))['flags'].to_numpy()
+            quality = ValidationReport(flags=flags, **quality)
+        return {'risk_blocked': state['risk_blocked'], 'quality': quality}
+
+    def _state_path(self, run_id: str, suffix: str) -> Path:
+        return self.root / 'state' / f'{run_id}.{suffix}'
+
+    def _curve_path(self, run_id: str) -> Path:
+        return self.root / 'curves' / f'{run_id}.parquet'
+
+    def _trades_path(self, run_id: str) -> Path:
+        return self.root / 'trades' / f'{run_id}.parquet'
+
+
+def _range(column, bounds: Range) -> list:
+    """(하한, 상한) 범위 조건 (None은 제한 없음)"""
+    low, high = bounds
+    conditions = []
+    if low is not None:
+        conditions.append(column >= low)
+    if high is not None:
+        conditions.append(column <= high)
+    return conditions
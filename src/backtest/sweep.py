@@ -0,0 +1,623 @@
+"""분산 파라미터 스윕
+
+코디네이터가 파라미터 그리드 × 기간 윈도우를 태스크로 나눠 SQLite 작업 큐에
+넣으면, 워커 프로세스(여러 노드 가능)가 태스크를 가져가 실행하고 성과 지표만
+결과 테이블에 기록합니다. 데이터는 워커가 공유 KimpDataset 캐시에서 직접 읽습니다.
+
+- 태스크 ID: 전략 + 파라미터 + 기간 + 설정 + 데이터셋 위치/버전의 해시 (중복 제출 무시).
+  데이터셋이 갱신(refresh)되면 버전이 바뀌므로 다시 제출한 태스크는 새 태스크이고,
+  워커는 각 태스크를 제출 시점 버전의 데이터(append-only 앞부분)로 실행합니다.
+- 임대(lease): 가져간 태스크는 lease_seconds 동안 다른 워커가 가져가지 않습니다.
+  워커는 실행 중 lease_seconds/3마다 임대를 갱신하므로 오래 걸리는 태스크도
+  계속 임대를 유지합니다. 워커가 죽으면 갱신이 멈추고, 임대 만료 후 다른
+  워커가 다시 실행합니다. 완료/실패 기록은
+  현재 임대를 가진 워커만 할 수 있으므로, 임대가 만료된 뒤 뒤늦게 끝난
+  워커는 새 임대를 가진 워커의 태스크 상태를 바꾸지 못합니다.
+- 재시도: 실패한 태스크는 max_attempts까지 다시 대기열로 돌아갑니다.
+- 결과 기록: task_id 기준 덮어쓰기 (재실행되어도 태스크당 결과 1행)
+
+여러 노드에서 사용할 때는 큐 파일과 데이터셋 캐시를 공유 스토리지에 두세요.
+SQLite 파일 잠금이 동작하는 파일시스템(로컬 디스크, 잠금을 지원하는 NFS)이어야 합니다.
+
+디렉토리 구조:
+    data/sweep/
+    └── queue.db             # tasks, results 테이블
+
+Example:
+    >>> coordinator = SweepCoordinator(TaskQueue('data/sweep/queue.db'))
+    >>> coordinator.submit(
+    ...     'src.strategies.kimp.cash_carry:KimpCashCarryStrategy',
+    ...     grid={'entry_threshold': [0.02, 0.03], 'exit_threshold': [0.0, 0.01]},
+    ...     windows=date_windows('2024-01-01', '2024-12-31', '90D'),
+    ...     dataset={'root': 'data/kimp', 'symbol': 'BTC'},
+    ... )
+
+    노드마다 워커 실행:
+
+    $ python -m src.backtest.sweep worker data/sweep/queue.db
+
+    >>> coordinator.wait()
+    >>> coordinator.results().sort_values('sharpe_ratio', ascending=False)
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import (
+    Column, Float, Index, Integer, MetaData, String, Table, Text,
+    and_, create_engine, event, func, insert, or_, select, delete, update,
+)
+
+from ..data.dataset import KimpDataset
+from ..utils.hashing import stable_hash
+from ..utils.logger import get_logger
+from .engine import BacktestConfig, BacktestEngine
+from .store import METRIC_COLUMNS
+
+# 태스크 상태
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+metadata = MetaData()
+
+tasks = Table(
+    'tasks', metadata,
+    Column('seq', Integer, primary_key=True, autoincrement=True),
+    Column('task_id', String(32), nullable=False, unique=True),
+    Column('payload', Text, nullable=False),
+    Column('status', String(16), nullable=False),
+    Column('attempts', Integer, nullable=False, default=0),
+    Column('worker', String(128)),
+    Column('lease_until', Float),
+    Column('error', Text),
+    Column('updated_at', Float),
+    Index('ix_tasks_status', 'status', 'seq'),
+)
+
+results = Table(
+    'results', metadata,
+    Column('task_id', String(32), primary_key=True),
+    Column('strategy', String(128), nullable=False),
+    Column('params', Text, nullable=False),
+    Column('start_date', String(32)),
+    Column('end_date', String(32)),
+    Column('total_return', Float),
+    Column('cagr', Float),
+    Column('sharpe_ratio', Float),
+    Column('max_drawdown', Float),
+    Column('win_rate', Float),
+    Column('profit_factor', Float),
+    Column('total_trades', Integer),
+    Column('worker', String(128)),
+    Column('finished_at', Float),
+)
+
+
+@dataclass
+class SweepTask:
+    """스윕 태스크 (전략 1개 × 파라미터 1조합 × 기간 1개)"""
+    strategy: str                  # 'module.path:ClassName'
+    params: Dict[str, Any]
+    start_date: str
+    end_date: str
+    dataset: Dict[str, str]        # KimpDataset 위치 {'root': ..., 'symbol': ...}
+    config: Dict[str, Any] = field(default_factory=dict)  # BacktestConfig 추가 필드
+    dataset_version: Dict[str, Any] = field(default_factory=dict)  # KimpDataset.version() (비면 최신)
+    vectorized: bool = True
+    compact: bool = False          # 컴팩트 스키마로 로드
+    task_id: str = ''
+    attempts: int = 0
+
+    def payload(self) -> Dict[str, Any]:
+        """큐 저장용 내용 (task_id, attempts 제외)"""
+        data = asdict(self)
+        data.pop('task_id')
+        data.pop('attempts')
+        return data
+
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    파라미터 그리드 전개
+
+    Example:
+        >>> expand_grid({'a': [1, 2], 'b': [0.1]})
+        [{'a': 1, 'b': 0.1}, {'a': 2, 'b': 0.1}]
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def date_windows(
+    start: str,
+    end: str,
+    length: str,
+    step: Optional[str] = None
+) -> List[Tuple[str, str]]:
+    """
+    기간 윈도우 분할 (walk-forward)
+
+    Args:
+        start, end: 전체 기간
+        length: 윈도우 길이 (예: '30D')
+        step: 윈도우 시작 간격 (None이면 length, 겹치지 않음)
+
+    Returns:
+        [(시작, 끝)] - 끝은 다음 구간 직전 시각 (BacktestConfig는 양 끝 포함)
+    """
+    start_ts, end_ts = pd.Timestamp(start), pd.Timestamp(end)
+    length_td = pd.Timedelta(length)
+    starts = pd.date_range(start_ts, end_ts, freq=pd.Timedelta(step or length))
+    return [
+        (s.isoformat(), min(s + length_td - pd.Timedelta(1, 'ns'), end_ts).isoformat())
+        for s in starts
+    ]
+
+
+class TaskQueue:
+    """
+    SQLite 작업 큐
+
+    모든 트랜잭션은 BEGIN IMMEDIATE로 시작하므로 여러 프로세스가 동시에
+    태스크를 가져가도 같은 태스크가 두 워커에 배정되지 않습니다.
+
+    Args:
+        path: 큐 DB 파일 경로
+        max_attempts: 태스크당 최대 실행 횟수
+        lease_seconds: 태스크 임대 시간 (이 시간 안에 완료나 renew가 없으면 다른 워커가 재실행)
+    """
+
+    def __init__(
+        self,
+        path: str = 'data/sweep/queue.db',
+        max_attempts: int = 3,
+        lease_seconds: float = 600.0
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+
+        self.db = create_engine(f"sqlite:///{self.path}", connect_args={'timeout': 60})
+        event.listen(self.db, 'connect', _autocommit_driver)
+        event.listen(self.db, 'begin', _begin_immediate)
+        metadata.create_all(self.db)
+
+    def put(self, items: List[SweepTask]) -> List[str]:
+        """
+        태스크 등록 (이미 있는 task_id는 건너뜀)
+
+        Returns:
+            task_id 목록 (items 순서)
+        """
+        ids = []
+        rows = {}
+        for task in items:
+            payload = task.payload()
+            task.task_id = stable_hash(payload)
+            ids.append(task.task_id)
+            rows[task.task_id] = json.dumps(payload, sort_keys=True, default=str)
+
+        now = time.time()
+        with self.db.begin() as conn:
+            existing = set(conn.execute(
+                select(tasks.c.task_id).where(tasks.c.task_id.in_(list(rows)))
+            ).scalars())
+            new = [
+                {'task_id': task_id, 'payload': payload, 'status': PENDING,
+                 'attempts': 0, 'updated_at': now}
+                for task_id, payload in rows.items() if task_id not in existing
+            ]
+            if new:
+                conn.execute(insert(tasks), new)
+        return ids
+
+    def claim(self, worker: str) -> Optional[SweepTask]:
+        """
+        다음 태스크 가져오기 (대기 중이거나 임대가 만료된 태스크)
+
+        Returns:
+            SweepTask 또는 None (가져갈 태스크 없음)
+        """
+        now = time.time()
+        expired = and_(tasks.c.status == RUNNING, tasks.c.lease_until < now)
+
+        with self.db.begin() as conn:
+            # 임대 만료 + 최대 시도 초과 → 실패 처리
+            conn.execute(
+                update(tasks)
+                .where(and_(expired, tasks.c.attempts >= self.max_attempts))
+                .values(status=FAILED, error='임대 만료 (최대 시도 횟수 초과)', updated_at=now)
+            )
+            row = conn.execute(
+                select(tasks.c.task_id, tasks.c.payload, tasks.c.attempts)
+                .where(or_(tasks.c.status == PENDING, expired))
+                .order_by(tasks.c.seq)
+                .limit(1)
+            ).first()
+            if row is None:
+                return None
+
+            conn.execute(
+                update(tasks)
+                .where(tasks.c.task_id == row.task_id)
+                .values(
+                    status=RUNNING,
+                    worker=worker,
+                    attempts=row.attempts + 1,
+                    lease_until=now + self.lease_seconds,
+                    updated_at=now,
+                )
+            )
+
+        return SweepTask(**json.loads(row.payload), task_id=row.task_id, attempts=row.attempts + 1)
+
+    def renew(self, task: SweepTask, worker: str) -> bool:
+        """
+        임대 연장 (지금부터 lease_seconds)
+
+        Returns:
+            False면 임대를 잃어 연장하지 않음 (다른 워커가 재실행 중이거나 완료)
+        """
+        now = time.time()
+        with self.db.begin() as conn:
+            updated = conn.execute(
+                update(tasks)
+                .where(self._leased(task, worker))
+                .values(lease_until=now + self.lease_seconds, updated_at=now)
+            )
+        return bool(updated.rowcount)
+
+    def complete(self, task: SweepTask, worker: str, metrics: Dict[str, float]) -> bool:
+        """
+        결과 기록 (task_id 기준 덮어쓰기) 및 완료 처리
+
+        Returns:
+            False면 임대를 잃어 기록하지 않음 (다른 워커가 재실행 중이거나 완료)
+        """
+        now = time.time()
+        row = {
+            'task_id': task.task_id,
+            'strategy': task.strategy,
+            'params': json.dumps(task.params, sort_keys=True, default=str),
+            'start_date': task.start_date,
+            'end_date': task.end_date,
+            **{name: metrics.get(name) for name in METRIC_COLUMNS},
+            'worker': worker,
+            'finished_at': now,
+        }
+        with self.db.begin() as conn:
+            updated = conn.execute(
+                update(tasks)
+                .where(self._leased(task, worker))
+                .values(status=DONE, lease_until=None, error=None, updated_at=now)
+            )
+            if not updated.rowcount:
+                return False
+            conn.execute(delete(results).where(results.c.task_id == task.task_id))
+            conn.execute(insert(results), [row])
+        return True
+
+    def fail(self, task: SweepTask, worker: str, error: str) -> Optional[str]:
+        """
+        실패 기록 (최대 시도 전이면 대기열로 복귀)
+
+        Returns:
+            변경된 상태 ('pending' 또는 'failed'), 임대를 잃었으면 None
+        """
+        status = PENDING if task.attempts < self.max_attempts else FAILED
+        with self.db.begin() as conn:
+            updated = conn.execute(
+                update(tasks)
+                .where(self._leased(task, worker))
+                .values(status=status, lease_until=None, error=error, updated_at=time.time())
+            )
+        return status if updated.rowcount else None
+
+    @staticmethod
+    def _leased(task: SweepTask, worker: str):
+        """worker가 task의 현재 임대를 가지고 있는 행 조건 (재임대되면 attempts가 바뀜)"""
+        return and_(
+            tasks.c.task_id == task.task_id,
+            tasks.c.status == RUNNING,
+            tasks.c.worker == worker,
+            tasks.c.attempts == task.attempts,
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 태스크 수"""
+        with self.db.begin() as conn:
+            rows = conn.execute(
+                select(tasks.c.status, func.count()).group_by(tasks.c.status)
+            ).all()
+        return {status: count for status, count in rows}
+
+    def errors(self) -> pd.DataFrame:
+        """실패/재시도 태스크의 마지막 에러"""
+        with self.db.begin() as conn:
+            rows = conn.execute(
+                select(tasks.c.task_id, tasks.c.status, tasks.c.attempts, tasks.c.error)
+                .where(tasks.c.error.is_not(None))
+                .order_by(tasks.c.seq)
+            ).mappings().all()
+        return pd.DataFrame(rows)
+
+    def results(self) -> pd.DataFrame:
+        """결과 테이블 (params는 dict로 변환)"""
+        with self.db.begin() as conn:
+            frame = pd.DataFrame(conn.execute(select(results)).mappings().all())
+        if not frame.empty:
+            frame['params'] = frame['params'].map(json.loads)
+        return frame
+
+
+class SweepCoordinator:
+    """
+    스윕 코디네이터 (태스크 분할/등록, 진행 상황, 결과 수집)
+
+    Args:
+        queue: 작업 큐
+    """
+
+    def __init__(self, queue: TaskQueue):
+        self.queue = queue
+
+    def submit(
+        self,
+        strategy: str,
+        grid: Dict[str, List[Any]],
+        windows: List[Tuple[str, str]],
+        dataset: Dict[str, str],
+        config: Optional[Dict[str, Any]] = None,
+        vectorized: bool = True,
+        compact: bool = False
+    ) -> List[str]:
+        """
+        파라미터 그리드 × 기간 윈도우 태스크 등록
+
+        Args:
+            strategy: 전략 클래스 경로 ('module.path:ClassName')
+            grid: 파라미터 그리드 {'entry_threshold': [0.02, 0.03], ...}
+            windows: 기간 윈도우 [(시작, 끝)]
+            dataset: KimpDataset 위치 {'root': 'data/kimp', 'symbol': 'BTC'}
+            config: BacktestConfig 추가 필드 (initial_capital 등)
+            vectorized: 엔진 빠른 경로 사용 여부
+            compact: 워커가 컴팩트 스키마로 데이터를 로드
+
+        Returns:
+            task_id 목록
+        """
+        version = KimpDataset(dataset['root'], dataset['symbol']).version()
+        items = [
+            SweepTask(
+                strategy=strategy,
+                params=params,
+                start_date=start,
+                end_date=end,
+                dataset=dict(dataset),
+                config=dict(config or {}),
+                dataset_version=dict(version),
+                vectorized=vectorized,
+                compact=compact,
+            )
+            for params in expand_grid(grid)
+            for start, end in windows
+        ]
+        return self.queue.put(items)
+
+    def progress(self) -> Dict[str, int]:
+        """상태별 태스크 수"""
+        return self.queue.counts()
+
+    def wait(self, timeout: Optional[float] = None, poll: float = 1.0) -> bool:
+        """
+        모든 태스크 종료(완료/실패) 대기
+
+        Returns:
+            timeout 전에 끝났으면 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            counts = self.progress()
+            if not counts.get(PENDING) and not counts.get(RUNNING):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll)
+
+    def results(self) -> pd.DataFrame:
+        """결과 수집"""
+        return self.queue.results()
+
+
+class SweepWorker:
+    """
+    스윕 워커
+
+    데이터셋은 위치/버전별로 한 번 로드해 태스크 간에 재사용합니다 (위치마다
+    마지막으로 쓴 버전만 유지). 태스크 실행 중에는
+    백그라운드 스레드가 임대를 주기적으로 갱신합니다.
+
+    Args:
+        queue: 작업 큐
+        worker_id: 워커 식별자 (기본: 호스트명-PID)
+    """
+
+    def __init__(self, queue: TaskQueue, worker_id: Optional[str] = None):
+        self.queue = queue
+        self.worker_id = worker_id or f'{socket.gethostname()}-{os.getpid()}'
+        self._data: Dict[Tuple[str, str, bool], Tuple[Tuple[Any, ...], pd.DataFrame]] = {}
+
+    def run(
+        self,
+        max_tasks: Optional[int] = None,
+        wait: float = 0.0,
+        poll: float = 1.0
+    ) -> int:
+        """
+        태스크 실행 루프
+
+        Args:
+            max_tasks: 최대 실행 태스크 수 (None이면 제한 없음)
+            wait: 큐가 빈 뒤 새 태스크를 기다리는 시간 (초)
+            poll: 빈 큐 재확인 간격 (초)
+
+        Returns:
+            처리한 태스크 수 (실패 포함)
+        """
+        processed = 0
+        idle_since = time.monotonic()
+        while max_tasks is None or processed < max_tasks:
+            task = self.queue.claim(self.worker_id)
+            if task is None:
+                if time.monotonic() - idle_since >= wait:
+                    break
+                time.sleep(poll)
+                continue
+
+            try:
+                with self._renewing(task):
+                    metrics = self.execute(task)
+            except Exception as e:
+                status = self.queue.fail(task, self.worker_id, f'{type(e).__name__}: {e}')
+                get_logger().warning(
+                    f"태스크 실패 {task.task_id} (시도 {task.attempts}, {status or '임대 만료'}) - {e!r}"
+                )
+            else:
+                if not self.queue.complete(task, self.worker_id, metrics):
+                    get_logger().warning(f"임대 만료로 결과 미기록 {task.task_id} (시도 {task.attempts})")
+
+            processed += 1
+            idle_since = time.monotonic()
+        return processed
+
+    @contextmanager
+    def _renewing(self, task: SweepTask) -> Iterator[None]:
+        """블록 실행 중 lease_seconds/3마다 임대 갱신 (임대를 잃으면 갱신 중단)"""
+        stop = threading.Event()
+
+        def renew() -> None:
+            while not stop.wait(self.queue.lease_seconds / 3):
+                try:
+                    if not self.queue.renew(task, self.worker_id):
+                        return
+                except Exception as e:
+                    get_logger().warning(f"임대 갱신 실패 {task.task_id} - {e!r}")
+
+        thread = threading.Thread(target=renew, name=f'lease-{task.task_id}', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def execute(self, task: SweepTask) -> Dict[str, float]:
+        """
+        태스크 실행
+
+        Returns:
+            성과 지표 {METRIC_COLUMNS}
+        """
+        data = self._load(task)
+        strategy = _load_class(task.strategy)(dict(task.params))
+        config = BacktestConfig(start_date=task.start_date, end_date=task.end_date, **task.config)
+
+        result = BacktestEngine(config).run(strategy, data, vectorized=task.vectorized)
+        return {name: getattr(result, name) for name in METRIC_COLUMNS}
+
+    def _load(self, task: SweepTask) -> pd.DataFrame:
+        """
+        태스크 버전의 데이터셋 로드 (워커 내 캐시)
+
+        Raises:
+            ValueError: 데이터셋이 재구축되어 태스크 버전의 데이터가 없음
+        """
+        key = (task.dataset['root'], task.dataset['symbol'], task.compact)
+        version = tuple(sorted(task.dataset_version.items()))
+        cached = self._data.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        dataset = KimpDataset(task.dataset['root'], task.dataset['symbol'])
+        rows = task.dataset_version.get('rows')
+        end = task.dataset_version.get('last_timestamp')
+        data = dataset.load(end=end, compact=task.compact)
+        if rows is not None and len(data) != rows:
+            raise ValueError(
+                f"데이터셋 버전 불일치 (태스크 {task.dataset_version}, 현재 {dataset.version()}) "
+                "- 재구축된 데이터셋은 다시 제출하세요"
+            )
+        self._data[key] = (version, data)
+        return data
+
+
+def run_worker(
+    queue_path: str,
+    max_attempts: int = 3,
+    lease_seconds: float = 600.0,
+    **run_kwargs: Any
+) -> int:
+    """워커 프로세스 진입점 (multiprocessing 대상)"""
+    queue = TaskQueue(queue_path, max_attempts=max_attempts, lease_seconds=lease_seconds)
+    return SweepWorker(queue).run(**run_kwargs)
+
+
+def _load_class(path: str) -> type:
+    """'module.path:ClassName' 형식 클래스 로드"""
+    module_name, _, class_name = path.partition(':')
+    if not class_name:
+        raise ValueError(f"전략 경로는 'module.path:ClassName' 형식이어야 합니다: {path}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _autocommit_driver(dbapi_connection, connection_record) -> None:
+    """pysqlite 자체 트랜잭션 관리 비활성 (BEGIN을 직접 실행)"""
+    dbapi_connection.isolation_level = None
+
+
+def _begin_immediate(connection) -> None:
+    """쓰기 잠금을 먼저 잡는 트랜잭션 (태스크 중복 배정 방지)"""
+    connection.exec_driver_sql('BEGIN IMMEDIATE')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='분산 파라미터 스윕')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    worker = commands.add_parser('worker', help='워커 실행')
+    worker.add_argument('queue', help='큐 DB 경로')
+    worker.add_argument('--max-tasks', type=int, default=None)
+    worker.add_argument('--wait', type=float, default=0.0, help='빈 큐 대기 시간 (초)')
+    worker.add_argument('--max-attempts', type=int, default=3)
+    worker.add_argument('--lease', type=float, default=600.0, help='태스크 임대 시간 (초)')
+
+    status = commands.add_parser('status', help='진행 상황 출력')
+    status.add_argument('queue', help='큐 DB 경로')
+
+    args = parser.parse_args()
+    if args.command == 'worker':
+        processed = run_worker(
+            args.queue, args.max_attempts, args.lease,
+            max_tasks=args.max_tasks, wait=args.wait
+        )
+        print(f"처리한 태스크: {processed}")
+    else:
+        print(json.dumps(TaskQueue(args.queue).counts(), ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
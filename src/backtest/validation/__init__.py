@@ -0,0 +1,5 @@
+"""백테스트 검증 도구"""
+
+from .bias_detector import LookAheadBiasDetector, BiasReport
+
+__all__ = ["LookAheadBiasDetector", "BiasReport"]
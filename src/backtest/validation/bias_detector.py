@@ -0,0 +1,173 @@
+"""Look-Ahead Bias 감지기
+
+전략을 전체 데이터와 잘린(truncated) 데이터로 각각 실행해 시그널을 비교하는
+차분(differential) 검사입니다. 미래 정보를 사용하지 않는 전략이라면 cut 시점
+이전의 시그널은 이후 데이터가 추가되어도 바뀌지 않아야 합니다.
+"""
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...strategies.base import BaseStrategy
+
+# 워커 프로세스별 공유 입력 (initializer에서 한 번만 전달)
+_shared: Dict[str, Any] = {}
+
+
+@dataclass
+class BiasReport:
+    """Look-Ahead Bias 검사 결과"""
+    strategy: str
+    cut_points: List[int]
+    mismatches: List[Tuple[int, pd.Timestamp]] = field(default_factory=list)  # (cut, 첫 불일치 시점)
+
+    @property
+    def has_lookahead(self) -> bool:
+        return bool(self.mismatches)
+
+    def summary(self) -> str:
+        """결과 요약 문자열"""
+        if not self.has_lookahead:
+            return f"[{self.strategy}] cut {len(self.cut_points)}개 검사 - Look-Ahead 없음"
+        first_cut, first_ts = self.mismatches[0]
+        return (
+            f"[{self.strategy}] cut {len(self.cut_points)}개 중 {len(self.mismatches)}개 불일치 "
+            f"- Look-Ahead 의심 (cut={first_cut}, 시점={first_ts})"
+        )
+
+
+class LookAheadBiasDetector:
+    """
+    Look-Ahead Bias (미래 정보 사용) 감지기
+
+    탐지 방법:
+    1. 전체 데이터로 시그널 생성
+    2. 샘플링한 cut 시점마다 data.iloc[:cut]으로 시그널 재생성
+    3. cut 이전 구간의 시그널이 하나라도 다르면 미래 정보 사용으로 판정
+
+    cut 시점 검사는 pandas/Python 코드라 GIL을 놓지 않으므로 프로세스 풀에서
+    병렬로 실행합니다. 전략과 데이터는 워커 생성 시 한 번만 전달합니다.
+
+    Args:
+        n_cuts: 샘플링할 cut 시점 수
+        min_bars: 최소 cut 길이 (지표 워밍업 구간)
+        max_workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+        seed: cut 샘플링 시드
+
+    Example:
+        >>> detector = LookAheadBiasDetector(n_cuts=20)
+        >>> report = detector.detect(strategy, data)
+        >>> assert not report.has_lookahead
+    """
+
+    def __init__(
+        self,
+        n_cuts: int = 20,
+        min_bars: int = 1,
+        max_workers: Optional[int] = None,
+        seed: int = 0
+    ):
+        self.n_cuts = n_cuts
+        self.min_bars = min_bars
+        self.max_workers = max_workers
+        self.seed = seed
+
+    def detect(self, strategy: BaseStrategy, data: pd.DataFrame) -> BiasReport:
+        """
+        Look-Ahead Bias 탐지
+
+        Args:
+            strategy: 검사할 전략 (상태는 변경되지 않음)
+            data: 전략 입력 DataFrame
+
+        Returns:
+            BiasReport
+        """
+        full = self._signals(strategy, data)
+        cuts = self.sample_cuts(len(data))
+
+        if self.max_workers == 1 or len(cuts) <= 1:
+            _init_worker(strategy, data, full)
+            try:
+                results = [_check_cut(cut) for cut in cuts]
+            finally:
+                _shared.clear()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(strategy, data, full)
+            ) as pool:
+                results = list(pool.map(_check_cut, cuts))
+
+        return BiasReport(
+            strategy=strategy.name,
+            cut_points=cuts,
+            mismatches=[r for r in results if r is not None]
+        )
+
+    def compare_reference(
+        self,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        max_bars: int = 2_000
+    ) -> Optional[pd.Timestamp]:
+        """
+        일괄 시그널과 bar별 기준 경로 비교
+
+        전략이 오버라이드한 generate_signals 결과를 BaseStrategy의
+        prefix 슬라이싱 기준 경로와 비교합니다. 기준 경로는 O(n²)이므로
+        앞쪽 max_bars 구간만 사용합니다.
+
+        Returns:
+            첫 불일치 시점 또는 None (일치)
+        """
+        sample = data.iloc[:max_bars]
+        fast = self._signals(strategy, sample)
+        reference = BaseStrategy.generate_signals(self._fresh(strategy), sample).to_numpy()
+
+        diff = np.flatnonzero(fast != reference)
+        return sample.index[diff[0]] if len(diff) else None
+
+    def sample_cuts(self, n: int) -> List[int]:
+        """cut 시점 샘플링 (오름차순, 중복 없음)"""
+        if n <= self.min_bars:
+            return []
+        candidates = np.arange(self.min_bars, n)
+        rng = np.random.default_rng(self.seed)
+        size = min(self.n_cuts, len(candidates))
+        cuts = rng.choice(candidates, size=size, replace=False)
+        return sorted(int(c) for c in cuts)
+
+    @classmethod
+    def _signals(cls, strategy: BaseStrategy, data: pd.DataFrame) -> np.ndarray:
+        """독립된 전략 복사본으로 시그널 생성"""
+        return cls._fresh(strategy).generate_signals(data).to_numpy()
+
+    @staticmethod
+    def _fresh(strategy: BaseStrategy) -> BaseStrategy:
+        """상태를 공유하지 않는 전략 복사본"""
+        clone = copy.deepcopy(strategy)
+        clone.reset()
+        return clone
+
+
+def _init_worker(strategy: BaseStrategy, data: pd.DataFrame, full: np.ndarray) -> None:
+    """워커 초기화 (전략/데이터/전체 시그널 보관)"""
+    _shared.update(strategy=strategy, data=data, full=full)
+
+
+def _check_cut(cut: int) -> Optional[Tuple[int, pd.Timestamp]]:
+    """cut 시점 검사 (불일치 시 (cut, 첫 불일치 시점))"""
+    data, full = _shared['data'], _shared['full']
+    truncated = LookAheadBiasDetector._signals(_shared['strategy'], data.iloc[:cut])
+    diff = np.flatnonzero(truncated != full[:cut])
+    if len(diff):
+        return cut, data.index[diff[0]]
+    return None
+
@@ -1,5 +1,48 @@
-"""데이터 로더"""
+"""데이터 로더
 
-from .fetcher import DataFetcher
+공개 클래스/함수는 첫 사용 시 로드됩니다 (httpx 등 지연 import).
+"""
 
-__all__ = ["DataFetcher"]
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .dataset import KimpDataset
+    from .features import add_features, kimp_rate
+    from .fetcher import DataFetcher
+    from .pyramid import BarPyramid
+    from .schema import concat_compact, from_compact, to_compact
+    from .validation import ValidationConfig, ValidationReport, clean, validate
+
+_EXPORTS = {
+    "DataFetcher": ".fetcher",
+    "KimpDataset": ".dataset",
+    "BarPyramid": ".pyramid",
+    "add_features": ".features",
+    "kimp_rate": ".features",
+    "to_compact": ".schema",
+    "from_compact": ".schema",
+    "concat_compact": ".schema",
+    "ValidationConfig": ".validation",
+    "ValidationReport": ".validation",
+    "validate": ".validation",
+    "clean": ".validation",
+}
+
+__all__ = [
+    "DataFetcher",
+    "KimpDataset",
+    "BarPyramid",
+    "add_features",
+    "kimp_rate",
+    "to_compact",
+    "from_compact",
+    "concat_compact",
+    "ValidationConfig",
+    "ValidationReport",
+    "validate",
+    "clean",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
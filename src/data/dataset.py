@@ -0,0 +1,326 @@
+"""김프 데이터셋 로컬 캐시
+
+1분봉 김프 데이터와 파생 피처를 append-only Parquet 파티션으로 저장합니다.
+증분 갱신(refresh)은 마지막 캐시 시점 이후 bar만 가져와 새 파티션으로 추가하고,
+롤링 피처는 저장된 tail 상태(마지막 window-1개 bar를 포함하는 누적합 블록부터)에서
+이어서 계산합니다. tail이 전체 데이터 기준 블록 경계에서 시작하므로 결과는 전체
+재계산과 비트 단위로 일치합니다 (features.block_size 참고).
+가장 최근 bar는 다음 bar로 스파이크 여부를 확인할 때까지 저장을 보류합니다.
+
+디렉토리 구조:
+    data/kimp/BTC/
+    ├── state.json            # 파티션 목록, 마지막 시점, 피처 파라미터
+    ├── tail.parquet          # 롤링 피처 계산용 마지막 bar들 (블록 경계부터)
+    ├── pending.parquet       # 검증 보류 중인 가장 최근 bar (다음 추가 때 저장)
+    ├── part-00000.parquet
+    └── part-00001.parquet
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from ..utils.logger import get_logger
+from .features import (
+    BB_PERIOD, BB_STD_MULT, FX_MA_PERIOD, ZSCORE_WINDOW, add_features, block_size,
+)
+from .schema import to_compact
+from .validation import BAD_BAR_METHODS, ValidationConfig, clean, validate
+
+BASE_COLUMNS = ['timestamp', 'upbit_price', 'binance_price', 'usd_krw']
+
+# since(마지막 캐시 시점, 없으면 None) 이후의 bar를 반환하는 함수
+BarLoader = Callable[[Optional[pd.Timestamp]], pd.DataFrame]
+
+
+class KimpDataset:
+    """
+    김프 데이터셋 (append-only 파티션 캐시)
+
+    Args:
+        root: 데이터셋 루트 디렉토리
+        symbol: 심볼
+        feature_params: add_features 파라미터 (zscore_window, bb_period, bb_mult, fx_ma_period)
+        validation: 추가 bar 품질 검증 기준
+        bad_bars: 검증 실패 bar 처리 ('ffill', 'skip', None이면 그대로 저장)
+
+    Example:
+        >>> dataset = KimpDataset('data/kimp', 'BTC')
+        >>> dataset.refresh(loader)        # 마지막 시점 이후 bar만 추가
+        >>> data = dataset.load(start='2024-01-01')
+        >>> dataset.quality()              # 파티션별 검증 요약
+    """
+
+    def __init__(
+        self,
+        root: str = 'data/kimp',
+        symbol: str = 'BTC',
+        feature_params: Optional[Dict[str, Any]] = None,
+        validation: Optional[ValidationConfig] = None,
+        bad_bars: Optional[str] = 'ffill'
+    ):
+        if bad_bars is not None and bad_bars not in BAD_BAR_METHODS:
+            raise ValueError(f"bad_bars는 {BAD_BAR_METHODS} 중 하나여야 합니다: {bad_bars!r}")
+        self.path = Path(root) / symbol
+        self.symbol = symbol
+        self.validation = validation
+        self.bad_bars = bad_bars
+        self.feature_params = {
+            'zscore_window': ZSCORE_WINDOW,
+            'bb_period': BB_PERIOD,
+            'bb_mult': BB_STD_MULT,
+            'fx_ma_period': FX_MA_PERIOD,
+            **(feature_params or {}),
+        }
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def tail_size(self) -> int:
+        """롤링 피처 계산에 필요한 과거 bar 수"""
+        p = self.feature_params
+        return max(p['zscore_window'], p['bb_period'], p['fx_ma_period']) - 1
+
+    def tail_start(self, rows: int) -> int:
+        """
+        rows개 bar 저장 후 tail이 시작하는 전체 데이터 기준 위치
+
+        다음 bar의 윈도우 시작점을 포함하는 누적합 블록의 경계입니다.
+        """
+        size = block_size(self.tail_size + 1)
+        return max(rows - self.tail_size, 0) // size * size
+
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        """마지막 캐시 시점"""
+        last = self._state().get('last_timestamp')
+        return pd.Timestamp(last) if last else None
+
+    def version(self) -> Dict[str, Any]:
+        """
+        데이터 버전 (저장 bar 수, 마지막 시점)
+
+        append-only이므로 같은 버전의 데이터는 load(end=last_timestamp)로 다시
+        읽을 수 있습니다 (rebuild 전까지).
+        """
+        state = self._state()
+        return {'rows': state.get('rows', 0), 'last_timestamp': state.get('last_timestamp')}
+
+    def quality(self) -> List[Dict[str, Any]]:
+        """파티션별 품질 검증 요약 (ValidationReport.summary + partition)"""
+        return self._state().get('quality', [])
+
+    def partitions(self) -> List[Path]:
+        """파티션 파일 목록 (시간순)"""
+        return [self.path / name for name in self._state().get('partitions', [])]
+
+    def load(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        compact: bool = False
+    ) -> pd.DataFrame:
+        """
+        캐시 데이터 로드
+
+        Args:
+            start, end: 조회 구간 (양 끝 포함)
+            compact: True면 컴팩트 스키마 (int64 epoch-ns 인덱스, float32 값)
+
+        Returns:
+            DatetimeIndex + timestamp 컬럼을 가진 DataFrame (BacktestEngine 입력 형식)
+        """
+        filters = []
+        if start is not None:
+            filters.append(('timestamp', '>=', pd.Timestamp(start)))
+        if end is not None:
+            filters.append(('timestamp', '<=', pd.Timestamp(end)))
+
+        frames = [
+            pd.read_parquet(path, filters=filters or None)
+            for path in self.partitions()
+        ]
+        if not frames:
+            return pd.DataFrame()
+
+        data = pd.concat(frames, ignore_index=True)
+        data.index = pd.DatetimeIndex(data['timestamp'], name=None)
+        return to_compact(data) if compact else data
+
+    def iter_chunks(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        chunk_size: int = 10_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        캐시 데이터를 chunk_size개 bar씩 순서대로 읽기 (메모리 사용량 일정)
+
+        Args:
+            start, end: 조회 구간 (양 끝 포함)
+            chunk_size: 청크당 최대 bar 수
+
+        Yields:
+            load()와 같은 형식의 DataFrame 청크
+        """
+        import pyarrow.parquet as pq
+
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+
+        for path in self.partitions():
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+                chunk = batch.to_pandas()
+                if start is not None:
+                    chunk = chunk[chunk['timestamp'] >= start]
+                if end is not None:
+                    if not chunk.empty and chunk['timestamp'].iloc[0] > end:
+                        return
+                    chunk = chunk[chunk['timestamp'] <= end]
+                if chunk.empty:
+                    continue
+                chunk.index = pd.DatetimeIndex(chunk['timestamp'], name=None)
+                yield chunk
+
+    def rebuild(self, bars: pd.DataFrame) -> int:
+        """
+        전체 재구축 (기존 파티션 삭제 후 단일 파티션으로 저장)
+
+        Returns:
+            저장한 bar 수
+        """
+        for path in self.partitions():
+            path.unlink(missing_ok=True)
+        (self.path / 'tail.parquet').unlink(missing_ok=True)
+        (self.path / 'pending.parquet').unlink(missing_ok=True)
+        self._write_state({})
+        return self.append(bars)
+
+    def refresh(self, loader: BarLoader) -> int:
+        """
+        증분 갱신
+
+        loader로 마지막 캐시 시점 이후 bar만 가져와 추가합니다.
+
+        Returns:
+            추가한 bar 수
+        """
+        return self.append(loader(self.last_timestamp()))
+
+    def append(self, bars: pd.DataFrame) -> int:
+        """
+        신규 bar 추가
+
+        마지막 캐시 시점 이전/중복 bar는 무시합니다. 신규 bar는 저장 전에
+        품질 검증을 거치고 (bad_bars 설정에 따라 처리, 요약은 state.json에 기록),
+        파생 피처는 저장된 tail 상태 + 신규 bar로 계산합니다.
+
+        가장 최근 bar는 앞뒤 bar가 모두 있어야 스파이크를 판단할 수 있으므로
+        pending.parquet에 보류했다가 다음 추가 때 함께 검증/저장합니다
+        (같은 시각 bar가 다시 오면 새 값 사용). last_timestamp는 마지막 저장
+        bar이므로 refresh는 보류 중인 bar부터 다시 가져옵니다.
+
+        Returns:
+            추가한 bar 수 (보류 bar 제외)
+        """
+        state = self._state()
+        if state and state.get('feature_params') != self.feature_params:
+            raise ValueError(
+                f"피처 파라미터가 캐시와 다릅니다 ({state.get('feature_params')}) - rebuild 필요"
+            )
+
+        new = self._normalize(bars)
+        last = self.last_timestamp()
+        if last is not None:
+            new = new[new['timestamp'] > last]
+        pending_path = self.path / 'pending.parquet'
+        if pending_path.exists():
+            new = self._normalize(pd.concat([pd.read_parquet(pending_path), new], ignore_index=True))
+        if new.empty:
+            return 0
+
+        new, held = new.iloc[:-1].reset_index(drop=True), new.iloc[-1:]
+        held.to_parquet(pending_path, index=False)
+        if new.empty:
+            return 0
+
+        stored = state.get('rows', 0)
+        tail = self._tail(stored)
+        if tail is None:
+            tail = new.iloc[:0]
+        context = tail.iloc[len(tail) - self.tail_size:]
+        report = validate(new, self.validation, after=last, context=context, following=held)
+        if report.bad_rows:
+            get_logger(symbol=self.symbol).warning(f"품질 검증 실패 bar: {report.summary()}")
+            if self.bad_bars is not None:
+                new = clean(new, report, self.bad_bars, context=context).reset_index(drop=True)
+                if new.empty:
+                    return 0
+
+        combined = pd.concat([tail, new], ignore_index=True)
+
+        featured = add_features.uncached(combined, **self.feature_params)
+        partition = featured.iloc[len(tail):].reset_index(drop=True)
+
+        partitions = state.get('partitions', [])
+        name = f'part-{len(partitions):05d}.parquet'
+        partition.to_parquet(self.path / name, index=False)
+        rows = stored + len(partition)
+        combined.iloc[self.tail_start(rows) - (stored - len(tail)):].to_parquet(
+            self.path / 'tail.parquet', index=False
+        )
+
+        self._write_state({
+            'symbol': self.symbol,
+            'partitions': partitions + [name],
+            'last_timestamp': partition['timestamp'].iloc[-1].isoformat(),
+            'rows': rows,
+            'feature_params': self.feature_params,
+            'quality': state.get('quality', []) + [{'partition': name, **report.summary()}],
+        })
+        return len(partition)
+
+    def _tail(self, rows: int) -> Optional[pd.DataFrame]:
+        """
+        저장된 tail (tail_start(rows)부터의 기본 컬럼 bar, 저장된 bar가 없으면 None)
+
+        tail 파일이 없거나 길이가 맞지 않으면 (이전 형식) 파티션에서 다시 읽습니다.
+        """
+        tail_path = self.path / 'tail.parquet'
+        expected = rows - self.tail_start(rows)
+        if tail_path.exists():
+            tail = pd.read_parquet(tail_path)
+            if len(tail) == expected:
+                return tail
+        if not rows:
+            return None
+        data = self.load()
+        return data[BASE_COLUMNS].iloc[len(data) - expected:].reset_index(drop=True)
+
+    @staticmethod
+    def _normalize(bars: pd.DataFrame) -> pd.DataFrame:
+        """기본 컬럼만 남기고 시간순 정렬, 중복 시점 제거"""
+        if bars is None or bars.empty:
+            return pd.DataFrame(columns=BASE_COLUMNS)
+        missing = set(BASE_COLUMNS) - set(bars.columns)
+        if missing:
+            raise ValueError(f"필수 컬럼 누락: {sorted(missing)}")
+
+        bars = bars[BASE_COLUMNS].copy()
+        bars['timestamp'] = pd.to_datetime(bars['timestamp'])
+        bars = bars.sort_values('timestamp', kind='stable')
+        bars = bars.drop_duplicates('timestamp', keep='last')
+        return bars.reset_index(drop=True)
+
+    def _state(self) -> Dict[str, Any]:
+        path = self.path / 'state.json'
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        """상태 파일 교체 (파티션/tail 저장 후 마지막에 기록)"""
+        tmp = self.path / 'state.json.tmp'
+        tmp.write_text(json.dumps(state, indent=2))
+        os.replace(tmp, self.path / 'state.json')
@@ -0,0 +1,43 @@
+"""데이터 수집 에러
+
+DataFetcher는 실패를 빈 DataFrame으로 숨기지 않고 아래 에러로 알립니다.
+"""
+
+from typing import Optional
+
+
+class DataFetchError(Exception):
+    """데이터 수집 에러 (베이스)"""
+
+
+class TransportError(DataFetchError):
+    """네트워크 에러 (연결 실패, 타임아웃) - 재시도 소진"""
+
+
+class ExchangeAPIError(DataFetchError):
+    """거래소 API 에러 응답"""
+
+    def __init__(self, message: str, status_code: int, url: str, body: str = ""):
+        super().__init__(f"{message} (status={status_code}, url={url})")
+        self.status_code = status_code
+        self.url = url
+        self.body = body
+
+
+class RateLimitError(ExchangeAPIError):
+    """레이트 리밋 초과 (429/418) - 재시도 소진"""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        url: str,
+        body: str = "",
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message, status_code, url, body)
+        self.retry_after = retry_after
+
+
+class DataFormatError(DataFetchError):
+    """응답 형식 에러 (예상 컬럼 누락 등)"""
@@ -0,0 +1,218 @@
+"""파생 피처 계산
+
+김프율, 김프 Z-Score, 볼린저 밴드(김프 % 기반), 환율 이동평균을 계산합니다.
+파라미터 정의는 strategies/kimchi_premium/PARAMETERS.md를 따릅니다.
+
+롤링 통계는 블록 단위 누적합 차분으로 O(n)에 계산합니다 (윈도우 크기와 무관).
+각 값은 자기 블록(데이터 시작부터 block_size개 단위) 안의 값에만 의존하므로,
+블록 경계에서 시작하는 뒷부분 데이터(예: 정렬된 tail + 신규 bar)로 계산한
+결과는 전체 재계산과 비트 단위로 일치합니다.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.cache import memoize
+
+# PARAMETERS.md 기본값
+ZSCORE_WINDOW = 20
+BB_PERIOD = 20
+BB_STD_MULT = 2.0
+FX_MA_PERIOD = 720
+
+FEATURE_COLUMNS = ['kimp_rate', 'kimp_zscore', 'bb_mid', 'bb_upper', 'bb_lower', 'fx_ma']
+
+MIN_BLOCK_SIZE = 4096
+
+
+def kimp_rate(
+    upbit_price: np.ndarray,
+    binance_price: np.ndarray,
+    usd_krw: np.ndarray
+) -> np.ndarray:
+    """
+    김프율 계산 (벡터화)
+
+    Args:
+        upbit_price: 업비트 가격 (KRW)
+        binance_price: 바이낸스 가격 (USDT)
+        usd_krw: USD/KRW 환율
+
+    Returns:
+        김프율 배열 (바이낸스 원화 환산가가 0인 bar는 0)
+    """
+    upbit_price = np.asarray(upbit_price, dtype=np.float64)
+    binance_krw = np.asarray(binance_price, dtype=np.float64) * np.asarray(usd_krw, dtype=np.float64)
+
+    kimp = np.zeros(len(binance_krw))
+    valid = binance_krw != 0
+    kimp[valid] = (upbit_price[valid] - binance_krw[valid]) / binance_krw[valid]
+    return kimp
+
+
+def rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    롤링 평균/표준편차 (모표준편차, ddof=0)
+
+    처음 window-1개 bar와 NaN/inf가 포함된 윈도우는 NaN입니다.
+    값이 모두 같은 윈도우는 평균이 그 값, 표준편차가 정확히 0입니다.
+
+    Returns:
+        (평균, 표준편차)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if window <= 0 or n < window:
+        return mean, std
+
+    finite = np.isfinite(values)
+    total, squares, shift = _window_moments(np.where(finite, values, 0.0), finite, window)
+    invalid = _window_count(~finite, window) > 0
+    changes = np.diff(values, prepend=values[0]) != 0
+    constant = _window_count(changes[1:], window - 1) == 0 if window > 1 else np.ones(n, dtype=bool)
+
+    window_mean = total / window
+    variance = np.maximum(squares / window - window_mean * window_mean, 0.0)
+    window_mean += shift
+    window_mean[constant] = values[window - 1:][constant]
+    variance[constant] = 0.0
+
+    mean[window - 1:] = np.where(invalid, np.nan, window_mean)
+    std[window - 1:] = np.where(invalid, np.nan, np.sqrt(variance))
+    return mean, std
+
+
+def block_size(window: int) -> int:
+    """
+    롤링 누적합 블록 크기 (window 이상, MIN_BLOCK_SIZE 이상인 2의 거듭제곱)
+
+    2의 거듭제곱이므로 큰 블록의 경계는 작은 블록의 경계이기도 합니다.
+    """
+    return max(MIN_BLOCK_SIZE, 1 << (max(window, 1) - 1).bit_length())
+
+
+def _window_count(flags: np.ndarray, window: int) -> np.ndarray:
+    """길이 window 구간별 True 개수 (정수 누적합 차분이므로 정확)"""
+    cumulative = np.concatenate(([0], np.cumsum(flags, dtype=np.int64)))
+    return cumulative[window:] - cumulative[:len(cumulative) - window]
+
+
+def _window_moments(
+    values: np.ndarray,
+    finite: np.ndarray,
+    window: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    길이 window 구간별 (합, 제곱합) - 누적합 차분, O(n)
+
+    누적합은 블록(block_size(window)개)마다 새로 시작하고 각 블록의 첫
+    유효값만큼 이동한 값으로 쌓아 오차가 데이터 길이/가격 수준에 따라
+    커지지 않게 합니다. 윈도우는 최대 두 블록에 걸치며, 앞 블록 부분은
+    끝 블록 기준으로 환산합니다. 기준값과 누적합이 블록 시작부터의 값만으로
+    정해지므로 결과는 뒤에 이어지는 데이터와 무관합니다.
+
+    Returns:
+        (합, 제곱합, 기준값) - 합/제곱합은 윈도우 끝 bar 블록의 기준값만큼
+        이동한 값 기준 (len(values) - window + 1개)
+    """
+    n = len(values)
+    size = block_size(window)
+    blocks = -(-n // size)
+    padded = np.zeros(blocks * size)
+    padded[:n] = values
+    valid = np.zeros(blocks * size, dtype=bool)
+    valid[:n] = finite
+
+    x = padded.reshape(blocks, size)
+    mask = valid.reshape(blocks, size)
+    first = mask.argmax(axis=1)
+    centers = np.where(mask.any(axis=1), x[np.arange(blocks), first], 0.0)
+    d = np.where(mask, x - centers[:, None], 0.0)
+
+    after1 = np.cumsum(d, axis=1)                   # 블록 시작 ~ i (포함)
+    after2 = np.cumsum(d * d, axis=1)
+    before1 = np.hstack([np.zeros((blocks, 1)), after1[:, :-1]]).ravel()   # 블록 시작 ~ i (제외)
+    before2 = np.hstack([np.zeros((blocks, 1)), after2[:, :-1]]).ravel()
+    block1, block2 = after1[:, -1], after2[:, -1]
+    after1, after2 = after1.ravel(), after2.ravel()
+
+    end = np.arange(window - 1, n)
+    start = end - window + 1
+    end_block, start_block = end // size, start // size
+    shift = centers[end_block]
+
+    total = after1[end] - before1[start]
+    squares = after2[end] - before2[start]
+
+    split = start_block != end_block
+    if split.any():
+        s, e, b = start[split], end[split], start_block[split]
+        left1 = block1[b] - before1[s]
+        left2 = block2[b] - before2[s]
+        left_n = size - s % size
+        delta = centers[b] - centers[b + 1]
+        total[split] = left1 + left_n * delta + after1[e]
+        squares[split] = left2 + 2 * delta * left1 + left_n * delta * delta + after2[e]
+    return total, squares, shift
+
+
+def rolling_zscore(values: np.ndarray, window: int = ZSCORE_WINDOW) -> np.ndarray:
+    """롤링 Z-Score (표준편차 0이면 0)"""
+    values = np.asarray(values, dtype=np.float64)
+    mean, std = rolling_mean_std(values, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zscore = (values - mean) / std
+    zscore[std == 0] = 0.0
+    return zscore
+
+
+def bollinger_bands(
+    values: np.ndarray,
+    period: int = BB_PERIOD,
+    mult: float = BB_STD_MULT
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    볼린저 밴드
+
+    Returns:
+        (중심선, 상단, 하단)
+    """
+    mean, std = rolling_mean_std(values, period)
+    return mean, mean + mult * std, mean - mult * std
+
+
+@memoize(version='3', copy=True)
+def add_features(
+    data: pd.DataFrame,
+    zscore_window: int = ZSCORE_WINDOW,
+    bb_period: int = BB_PERIOD,
+    bb_mult: float = BB_STD_MULT,
+    fx_ma_period: int = FX_MA_PERIOD
+) -> pd.DataFrame:
+    """
+    김프 데이터에 파생 피처 컬럼 추가
+
+    같은 데이터/파라미터 호출은 메모이제이션 캐시 결과의 복사본을 반환하므로
+    반환된 DataFrame을 수정해도 캐시에는 영향이 없습니다.
+
+    Args:
+        data: upbit_price, binance_price, usd_krw 컬럼을 가진 DataFrame
+
+    Returns:
+        FEATURE_COLUMNS가 추가된 DataFrame
+    """
+    result = data.copy()
+    kimp = kimp_rate(data['upbit_price'], data['binance_price'], data['usd_krw'])
+    bb_mid, bb_upper, bb_lower = bollinger_bands(kimp, bb_period, bb_mult)
+
+    result['kimp_rate'] = kimp
+    result['kimp_zscore'] = rolling_zscore(kimp, zscore_window)
+    result['bb_mid'] = bb_mid
+    result['bb_upper'] = bb_upper
+    result['bb_lower'] = bb_lower
+    result['fx_ma'] = rolling_mean_std(data['usd_krw'].to_numpy(dtype=np.float64), fx_ma_period)[0]
+    return result
@@ -1,10 +1,15 @@
 """데이터 수집기"""
 
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
 import pandas as pd
-import httpx
-from loguru import logger
+
+from .errors import DataFormatError
+from .schema import to_compact
+from .transport import HttpTransport, TransportConfig
+
+UPBIT_API = "https://api.upbit.com"
+BINANCE_API = "https://api.binance.com"
+BINANCE_FUTURES_API = "https://fapi.binance.com"
 
 
 class DataFetcher:
@@ -15,13 +20,38 @@ class DataFetcher:
     - 업비트 (KRW 마켓)
     - 바이낸스 (USDT 마켓, 선물)
     
+    요청 실패는 빈 DataFrame 대신 DataFetchError 하위 에러로 전달됩니다.
+    여러 스레드가 하나의 transport를 공유하면 같은 페이지 요청은 한 번만 전송됩니다.
+    
+    Args:
+        transport: HTTP 전송 계층 (None이면 기본 설정으로 생성)
+        upbit_url: 업비트 API 주소
+        binance_url: 바이낸스 현물 API 주소
+        binance_futures_url: 바이낸스 선물 API 주소
+        compact: True면 컴팩트 스키마로 반환
+            (int64 epoch-ns 시각, float32 가격, categorical symbol/exchange)
+    
     Example:
         >>> fetcher = DataFetcher()
-        >>> df = fetcher.get_upbit_ohlcv('BTC', days=30)
+        >>> df = fetcher.get_upbit_ohlcv('BTC', count=200)
+        
+        >>> fetcher = DataFetcher(compact=True)   # 메모리 절약 스키마
     """
     
-    def __init__(self):
-        self.client = httpx.Client(timeout=30)
+    def __init__(
+        self,
+        transport: Optional[HttpTransport] = None,
+        upbit_url: str = UPBIT_API,
+        binance_url: str = BINANCE_API,
+        binance_futures_url: str = BINANCE_FUTURES_API,
+        compact: bool = False
+    ):
+        self._owns_transport = transport is None
+        self.transport = transport or HttpTransport(TransportConfig())
+        self.upbit_url = upbit_url.rstrip('/')
+        self.binance_url = binance_url.rstrip('/')
+        self.binance_futures_url = binance_futures_url.rstrip('/')
+        self.compact = compact
         
     def get_upbit_ohlcv(
         self, 
@@ -41,6 +71,9 @@ class DataFetcher:
             
         Returns:
             DataFrame with columns: [timestamp, open, high, low, close, volume]
+            
+        Raises:
+            DataFetchError: 요청 실패 또는 응답 형식 오류
         """
         interval_map = {
             'minute1': 'minutes/1',
@@ -50,19 +83,17 @@ class DataFetcher:
             'day': 'days'
         }
         
-        url = f"https://api.upbit.com/v1/candles/{interval_map.get(interval, 'minutes/1')}"
+        url = f"{self.upbit_url}/v1/candles/{interval_map.get(interval, 'minutes/1')}"
         params = {
             'market': f'KRW-{symbol}',
             'count': min(count, 200)
         }
         if to:
             params['to'] = to
-            
-        try:
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
+        
+        data = self.transport.get_json(url, params=params)
+        
+        def parse() -> pd.DataFrame:
             df = pd.DataFrame(data)
             df = df.rename(columns={
                 'candle_date_time_utc': 'timestamp',
@@ -77,12 +108,9 @@ class DataFetcher:
             df = df.sort_values('timestamp').reset_index(drop=True)
             df['exchange'] = 'upbit'
             df['symbol'] = symbol
-            
             return df
-            
-        except Exception as e:
-            logger.error(f"업비트 데이터 조회 실패: {e}")
-            return pd.DataFrame()
+        
+        return self._finish(_parse(parse, data, "업비트 OHLCV"))
     
     def get_binance_ohlcv(
         self,
@@ -106,11 +134,14 @@ class DataFetcher:
             
         Returns:
             DataFrame
+            
+        Raises:
+            DataFetchError: 요청 실패 또는 응답 형식 오류
         """
         if futures:
-            url = "https://fapi.binance.com/fapi/v1/klines"
+            url = f"{self.binance_futures_url}/fapi/v1/klines"
         else:
-            url = "https://api.binance.com/api/v3/klines"
+            url = f"{self.binance_url}/api/v3/klines"
             
         params = {
             'symbol': f'{symbol}USDT',
@@ -121,12 +152,10 @@ class DataFetcher:
             params['startTime'] = start_time
         if end_time:
             params['endTime'] = end_time
-            
-        try:
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
+        
+        data = self.transport.get_json(url, params=params)
+        
+        def parse() -> pd.DataFrame:
             df = pd.DataFrame(data, columns=[
                 'timestamp', 'open', 'high', 'low', 'close', 'volume',
                 'close_time', 'quote_volume', 'trades', 'taker_buy_volume',
@@ -138,12 +167,9 @@ class DataFetcher:
             df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].astype(float)
             df['exchange'] = 'binance_futures' if futures else 'binance'
             df['symbol'] = symbol
-            
             return df
-            
-        except Exception as e:
-            logger.error(f"바이낸스 데이터 조회 실패: {e}")
-            return pd.DataFrame()
+        
+        return self._finish(_parse(parse, data, "바이낸스 OHLCV"))
     
     def get_binance_funding_rate(
         self,
@@ -159,18 +185,19 @@ class DataFetcher:
             
         Returns:
             DataFrame
+            
+        Raises:
+            DataFetchError: 요청 실패 또는 응답 형식 오류
         """
-        url = "https://fapi.binance.com/fapi/v1/fundingRate"
+        url = f"{self.binance_futures_url}/fapi/v1/fundingRate"
         params = {
             'symbol': f'{symbol}USDT',
             'limit': limit
         }
         
-        try:
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
+        data = self.transport.get_json(url, params=params)
+        
+        def parse() -> pd.DataFrame:
             df = pd.DataFrame(data)
             df['fundingTime'] = pd.to_datetime(df['fundingTime'], unit='ms')
             df['fundingRate'] = df['fundingRate'].astype(float)
@@ -178,19 +205,35 @@ class DataFetcher:
                 'fundingTime': 'timestamp',
                 'fundingRate': 'funding_rate'
             })
-            
             return df[['timestamp', 'symbol', 'funding_rate']]
-            
-        except Exception as e:
-            logger.error(f"펀딩비 조회 실패: {e}")
-            return pd.DataFrame()
+        
+        return self._finish(_parse(parse, data, "펀딩비"))
+    
+    def _finish(self, df: pd.DataFrame) -> pd.DataFrame:
+        """반환 스키마 적용"""
+        if self.compact and not df.empty:
+            return to_compact(df)
+        return df
     
     def close(self):
-        """클라이언트 종료"""
-        self.client.close()
+        """클라이언트 종료 (외부에서 받은 transport는 유지)"""
+        if self._owns_transport:
+            self.transport.close()
         
     def __enter__(self):
         return self
         
     def __exit__(self, *args):
         self.close()
+
+
+def _parse(parse: Callable[[], pd.DataFrame], data: Any, name: str) -> pd.DataFrame:
+    """응답 파싱 (형식 오류는 DataFormatError로 변환)"""
+    if isinstance(data, dict) and ('error' in data or 'code' in data):
+        raise DataFormatError(f"{name} 에러 응답: {data}")
+    if isinstance(data, list) and not data:
+        return pd.DataFrame()  # 조회 구간에 데이터 없음
+    try:
+        return parse()
+    except (KeyError, ValueError, TypeError) as e:
+        raise DataFormatError(f"{name} 응답 형식 오류: {e!r}") from e
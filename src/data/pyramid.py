@@ -0,0 +1,179 @@
+"""멀티 해상도 봉 피라미드
+
+캐시된 1분봉을 한 번 집계해 5m/15m/1h/4h/1d 봉을 레벨별 Parquet으로 저장합니다.
+각 레벨은 바로 아래 레벨에서 집계하므로(1m → 5m → 15m → 1h → 4h → 1d)
+상위 레벨일수록 입력이 작아집니다. 조회 시에는 해당 레벨 파일만 읽습니다.
+
+지원 입력:
+- OHLCV 1분봉 (open, high, low, close, volume)
+- 김프 1분봉 (upbit_price, binance_price, usd_krw) → 가격은 봉 종가, 김프율은 OHLC
+
+봉 시점은 시작 시각(UTC) 기준입니다 (업비트/바이낸스 캔들 규칙과 동일).
+
+디렉토리 구조:
+    data/pyramid/BTC/
+    ├── 1m.parquet
+    ├── 5m.parquet
+    ├── ...
+    └── 1d.parquet
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .features import kimp_rate
+
+# 레벨 → pandas 리샘플 규칙 (아래 레벨에서 집계하는 순서)
+LEVELS: Dict[str, str] = {
+    '1m': '1min',
+    '5m': '5min',
+    '15m': '15min',
+    '1h': '1h',
+    '4h': '4h',
+    '1d': '1D',
+}
+
+# 거래소 interval 표기 → 레벨
+ALIASES: Dict[str, str] = {
+    'minute1': '1m',
+    'minute5': '5m',
+    'minute15': '15m',
+    'minute60': '1h',
+    'minute240': '4h',
+    'day': '1d',
+}
+
+OHLCV_AGG = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+KIMP_PRICE_AGG = {'upbit_price': 'last', 'binance_price': 'last', 'usd_krw': 'last'}
+KIMP_OHLC_AGG = {'kimp_open': 'first', 'kimp_high': 'max', 'kimp_low': 'min', 'kimp_close': 'last'}
+
+
+def resolve_level(resolution: str) -> str:
+    """해상도 표기 정규화 ('minute60' → '1h')"""
+    level = ALIASES.get(resolution, resolution)
+    if level not in LEVELS:
+        raise ValueError(f"지원하지 않는 해상도: {resolution} (지원: {list(LEVELS)})")
+    return level
+
+
+def aggregation(columns: List[str]) -> Dict[str, str]:
+    """컬럼 구성에 맞는 집계 규칙"""
+    agg = {}
+    for rules in (OHLCV_AGG, KIMP_PRICE_AGG, KIMP_OHLC_AGG):
+        agg.update({col: how for col, how in rules.items() if col in columns})
+    if not agg:
+        raise ValueError(f"집계 가능한 컬럼이 없습니다: {columns}")
+    return agg
+
+
+def resample_bars(bars: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """
+    봉 집계 (시작 시각 라벨, 거래가 없는 구간은 제외)
+
+    Args:
+        bars: DatetimeIndex를 가진 봉 DataFrame
+        rule: pandas 리샘플 규칙 (예: '5min')
+
+    Returns:
+        집계된 봉 DataFrame
+    """
+    agg = aggregation(list(bars.columns))
+    resampled = bars.resample(rule, label='left', closed='left').agg(agg)
+    anchor = 'close' if 'close' in agg else next(iter(agg))
+    return resampled[resampled[anchor].notna()]
+
+
+class BarPyramid:
+    """
+    멀티 해상도 봉 피라미드
+
+    Args:
+        root: 저장 루트 디렉토리
+        symbol: 심볼
+
+    Example:
+        >>> pyramid = BarPyramid('data/pyramid', 'BTC')
+        >>> pyramid.build(dataset.load())           # 1분봉에서 한 번 구축
+        >>> hourly = pyramid.get('1h', start='2023-01-01')
+        >>> daily = pyramid.get('day')               # 거래소 interval 표기도 지원
+    """
+
+    def __init__(self, root: str = 'data/pyramid', symbol: str = 'BTC'):
+        self.path = Path(root) / symbol
+        self.symbol = symbol
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def build(self, base: pd.DataFrame) -> Dict[str, int]:
+        """
+        1분봉에서 전체 레벨 구축
+
+        Args:
+            base: 1분봉 (DatetimeIndex 또는 timestamp 컬럼)
+
+        Returns:
+            {레벨: 봉 수}
+        """
+        bars = self._prepare(base)
+        counts = {}
+        for level, rule in LEVELS.items():
+            if level != '1m':
+                bars = resample_bars(bars, rule)
+            bars.rename_axis('timestamp').to_parquet(self._level_path(level))
+            counts[level] = len(bars)
+        return counts
+
+    def get(
+        self,
+        resolution: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        해상도별 봉 조회
+
+        Args:
+            resolution: '1m', '5m', '15m', '1h', '4h', '1d' 또는 'minute60' 등
+            start, end: 조회 구간 (양 끝 포함)
+
+        Returns:
+            DatetimeIndex + timestamp 컬럼을 가진 DataFrame
+        """
+        path = self._level_path(resolve_level(resolution))
+        if not path.exists():
+            raise FileNotFoundError(f"피라미드가 구축되지 않았습니다: {path}")
+
+        filters = []
+        if start is not None:
+            filters.append(('timestamp', '>=', pd.Timestamp(start)))
+        if end is not None:
+            filters.append(('timestamp', '<=', pd.Timestamp(end)))
+
+        bars = pd.read_parquet(path, filters=filters or None)
+        bars.index.name = None
+        bars.insert(0, 'timestamp', bars.index)
+        return bars
+
+    def levels(self) -> List[str]:
+        """구축된 레벨 목록"""
+        return [level for level in LEVELS if self._level_path(level).exists()]
+
+    def _level_path(self, level: str) -> Path:
+        return self.path / f'{level}.parquet'
+
+    @staticmethod
+    def _prepare(base: pd.DataFrame) -> pd.DataFrame:
+        """집계용 1분봉 (DatetimeIndex, 집계 대상 컬럼만)"""
+        bars = base.copy()
+        if not isinstance(bars.index, pd.DatetimeIndex):
+            bars.index = pd.DatetimeIndex(bars['timestamp'])
+        bars.index.name = None
+        bars = bars[~bars.index.duplicated(keep='last')].sort_index()
+
+        if {'upbit_price', 'binance_price', 'usd_krw'} <= set(bars.columns):
+            kimp = kimp_rate(bars['upbit_price'], bars['binance_price'], bars['usd_krw'])
+            for col in KIMP_OHLC_AGG:
+                bars[col] = kimp
+
+        return bars[list(aggregation(list(bars.columns)))]
@@ -0,0 +1,116 @@
+"""컴팩트 데이터 스키마
+
+여러 해의 멀티 심볼 1분봉을 워커 메모리에 올리기 위한 선택적(opt-in) 스키마입니다.
+
+- 시각: int64 epoch-ns (UTC) 컬럼/인덱스
+- 가격/수량: float32 (상대 정밀도 약 6e-8)
+- symbol/exchange 등 문자열: categorical (행마다 문자열을 저장하지 않음)
+
+float32 가격으로 계산한 김프율의 오차는 약 2e-7 이하입니다 (입력 3개의
+반올림 오차 합). 진입/청산 임계값(0.01 단위)보다 훨씬 작지만, 임계값에
+1e-7 이내로 붙은 bar에서는 시그널이 달라질 수 있습니다.
+손익 계산은 엔진에서 float64로 수행합니다.
+
+Example:
+    >>> compact = to_compact(dataset.load())
+    >>> compact.memory_usage(deep=True).sum()
+    >>> result = engine.run(strategy, compact, vectorized=True)
+"""
+
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+
+TIME_COLUMN = 'timestamp'
+CATEGORY_COLUMNS = ('symbol', 'exchange')
+
+
+def to_compact(data: pd.DataFrame, keep_float64: Iterable[str] = ()) -> pd.DataFrame:
+    """
+    컴팩트 스키마로 변환
+
+    Args:
+        data: 표준 스키마 DataFrame (datetime64 시각, float64 가격, 문자열 컬럼)
+        keep_float64: float64로 유지할 컬럼
+
+    Returns:
+        int64 epoch-ns 시각, float32 수치, categorical 문자열 컬럼의 DataFrame
+    """
+    keep = set(keep_float64)
+    columns = {}
+    for name, col in data.items():
+        if name == TIME_COLUMN or pd.api.types.is_datetime64_any_dtype(col):
+            columns[name] = epoch_ns(col)
+        elif pd.api.types.is_float_dtype(col) and name not in keep:
+            columns[name] = col.to_numpy(dtype=np.float32)
+        elif name in CATEGORY_COLUMNS or _is_text(col):
+            columns[name] = col.astype('category').array
+        else:
+            columns[name] = col.array
+
+    index = data.index
+    if isinstance(index, pd.DatetimeIndex):
+        index = pd.Index(epoch_ns(index), name=index.name)
+    return pd.DataFrame(columns, index=index)
+
+
+def from_compact(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    표준 스키마로 복원 (datetime64[ns], float64, 문자열)
+
+    float32로 변환하며 잃은 정밀도는 복원되지 않습니다.
+    """
+    result = data.copy()
+    for name, col in data.items():
+        if name == TIME_COLUMN and pd.api.types.is_integer_dtype(col):
+            result[name] = pd.to_datetime(col.to_numpy(), unit='ns')
+        elif col.dtype == np.float32:
+            result[name] = col.astype(np.float64)
+        elif isinstance(col.dtype, pd.CategoricalDtype):
+            result[name] = col.astype(str)
+
+    if pd.api.types.is_integer_dtype(result.index):
+        result.index = pd.DatetimeIndex(
+            pd.to_datetime(result.index.to_numpy(), unit='ns'), name=result.index.name
+        )
+    return result
+
+
+def concat_compact(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    컴팩트 DataFrame 결합 (멀티 심볼)
+
+    pd.concat은 카테고리가 다른 categorical 컬럼을 문자열(object)로 풀어버리므로
+    카테고리를 합친 뒤 결합합니다.
+    """
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    aligned = [f.copy() for f in frames]
+    for name, col in frames[0].items():
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            categories = pd.api.types.union_categoricals(
+                [f[name] for f in frames if name in f.columns]
+            ).categories
+            for f in aligned:
+                if name in f.columns:
+                    f[name] = f[name].cat.set_categories(categories)
+    return pd.concat(aligned)
+
+
+def epoch_ns(values) -> np.ndarray:
+    """datetime 값(Series/Index/배열)의 int64 epoch-ns (UTC) 배열"""
+    if pd.api.types.is_integer_dtype(getattr(values, 'dtype', None)):
+        return np.asarray(values, dtype=np.int64)
+    return pd.DatetimeIndex(values).as_unit('ns').asi8
+
+
+def is_epoch_index(index: pd.Index) -> bool:
+    """int64 epoch-ns 시각 인덱스 여부"""
+    return pd.api.types.is_integer_dtype(index) and not isinstance(index, pd.RangeIndex)
+
+
+def _is_text(col: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(col) or pd.api.types.is_string_dtype(col)
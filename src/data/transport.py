@@ -0,0 +1,227 @@
+"""HTTP 전송 계층
+
+거래소 API 요청의 연결 관리, 재시도, 요청 병합을 담당합니다.
+
+- 호스트별 커넥션 풀 (keep-alive, 선택적 HTTP/2)
+- 재시도: 네트워크 에러, 429/418, 5xx, 깨진 JSON 본문에 지수 백오프 (+지터, Retry-After 우선)
+- 요청 병합: 같은 URL + 파라미터의 동시 요청은 한 번만 전송하고 결과를 공유
+- 통계: 요청 수, 재시도, 에러율, 지연 시간
+"""
+
+import importlib.util
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from .errors import DataFormatError, ExchangeAPIError, RateLimitError, TransportError
+
+RATE_LIMIT_STATUSES = (418, 429)
+
+
+@dataclass
+class TransportConfig:
+    """전송 계층 설정"""
+    timeout: float = 30.0                # 요청 타임아웃 (초)
+    connect_timeout: float = 5.0         # 연결 타임아웃 (초)
+    max_connections: int = 20            # 호스트별 최대 연결 수
+    max_keepalive: int = 10              # 호스트별 keep-alive 연결 수
+    keepalive_expiry: float = 30.0       # keep-alive 유지 시간 (초)
+    http2: bool = False                  # HTTP/2 사용 (h2 패키지 필요)
+    max_retries: int = 3                 # 재시도 횟수 (PARAMETERS.md MAX_RETRY)
+    backoff_base: float = 0.5            # 백오프 시작 간격 (초)
+    backoff_max: float = 10.0            # 백오프 최대 간격 (초)
+    retry_statuses: Tuple[int, ...] = (418, 429, 500, 502, 503, 504)
+
+
+@dataclass
+class TransportStats:
+    """전송 통계"""
+    requests: int = 0        # 실제 전송한 HTTP 요청 수 (재시도 포함)
+    calls: int = 0           # get_json 호출 수
+    coalesced: int = 0       # 다른 호출과 병합된 호출 수
+    retries: int = 0
+    errors: int = 0          # 최종 실패한 호출 수
+    total_latency: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    def add(self, **counts: float) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+
+class _Call:
+    """진행 중인 요청 (병합 대상)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class HttpTransport:
+    """
+    거래소 API HTTP 전송 계층
+
+    스레드 안전하며, 여러 리서치 워커 스레드가 하나의 인스턴스를 공유할 때
+    같은 페이지 요청은 한 번만 전송됩니다.
+
+    Args:
+        config: 전송 설정
+
+    Example:
+        >>> transport = HttpTransport(TransportConfig(http2=True))
+        >>> data = transport.get_json(url, params={'market': 'KRW-BTC'})
+        >>> transport.stats.error_rate
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        self.stats = TransportStats()
+        self.http2 = self.config.http2 and importlib.util.find_spec('h2') is not None
+        if self.config.http2 and not self.http2:
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 연결합니다 (pip install httpx[http2])")
+
+        self._clients: Dict[str, httpx.Client] = {}
+        self._inflight: Dict[Tuple, _Call] = {}
+        self._lock = threading.Lock()
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET 요청 후 JSON 반환
+
+        Raises:
+            RateLimitError: 레이트 리밋 (재시도 소진)
+            ExchangeAPIError: 에러 응답
+            TransportError: 네트워크 에러 (재시도 소진)
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+        self.stats.add(calls=1, coalesced=0 if leader else 1)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                self.stats.add(errors=1)
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._request(url, params)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            self.stats.add(errors=1)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def close(self) -> None:
+        """모든 커넥션 풀 종료"""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _client(self, url: str) -> httpx.Client:
+        """호스트별 클라이언트 (커넥션 풀)"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                cfg = self.config
+                client = self._clients[host] = httpx.Client(
+                    http2=self.http2,
+                    timeout=httpx.Timeout(cfg.timeout, connect=cfg.connect_timeout),
+                    limits=httpx.Limits(
+                        max_connections=cfg.max_connections,
+                        max_keepalive_connections=cfg.max_keepalive,
+                        keepalive_expiry=cfg.keepalive_expiry
+                    )
+                )
+            return client
+
+    def _request(self, url: str, params: Optional[Dict[str, Any]]) -> Any:
+        """재시도 포함 요청"""
+        cfg = self.config
+        client = self._client(url)
+
+        for attempt in range(cfg.max_retries + 1):
+            last_attempt = attempt == cfg.max_retries
+            start = time.perf_counter()
+            try:
+                response = client.get(url, params=params)
+            except httpx.TransportError as e:
+                self.stats.add(requests=1, total_latency=time.perf_counter() - start)
+                if last_attempt:
+                    raise TransportError(f"요청 실패: {url} ({e!r})") from e
+                self._backoff(attempt, None, f"{type(e).__name__}: {url}")
+                continue
+            self.stats.add(requests=1, total_latency=time.perf_counter() - start)
+
+            status = response.status_code
+            if status < 400:
+                try:
+                    return response.json()
+                except ValueError as e:
+                    # 잘린 응답/프록시 에러 페이지 - 일시적일 수 있으므로 재시도
+                    if last_attempt:
+                        raise DataFormatError(
+                            f"JSON 파싱 실패: {url} (status={status}, body={response.text[:200]!r})"
+                        ) from e
+                    self._backoff(attempt, None, f"invalid JSON: {url}")
+                    continue
+
+            retry_after = _retry_after(response)
+            if status in cfg.retry_statuses and not last_attempt:
+                self._backoff(attempt, retry_after, f"status={status}: {url}")
+                continue
+
+            if status in RATE_LIMIT_STATUSES:
+                raise RateLimitError("레이트 리밋 초과", status, url, response.text, retry_after)
+            raise ExchangeAPIError("거래소 API 에러", status, url, response.text)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float], reason: str) -> None:
+        """재시도 대기 (Retry-After 우선, 없으면 지수 백오프 + 지터)"""
+        cfg = self.config
+        delay = retry_after if retry_after is not None else cfg.backoff_base * 2 ** attempt
+        delay = min(delay, cfg.backoff_max) * (1 + random.random() * 0.1)
+        self.stats.add(retries=1)
+        logger.warning(f"재시도 {attempt + 1}/{cfg.max_retries} ({delay:.2f}s 후) - {reason}")
+        time.sleep(delay)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더 (초)"""
+    value = response.headers.get('Retry-After')
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -1,10 +1,16 @@
 """전략 베이스 클래스"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+
+# generate_signals 액션 코드
+ACTION_CODES = {'BUY': 1, 'SELL': -1, 'HOLD': 0}
 
 
 class Signal(BaseModel):
@@ -17,6 +23,14 @@ class Signal(BaseModel):
     price: Optional[float] = None
     reason: str = ""
     metadata: Dict[str, Any] = {}
+    
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def _from_epoch_ns(cls, value: Any) -> Any:
+        """컴팩트 스키마의 epoch-ns 숫자 시각을 datetime으로 변환"""
+        if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+            return pd.Timestamp(int(value), unit='ns').to_pydatetime()
+        return value
 
 
 class BaseStrategy(ABC):
@@ -32,6 +46,12 @@ class BaseStrategy(ABC):
         ...         pass
     """
     
+    # 시그널 로직 버전 (로직 변경 시 올려서 캐시/저장 결과 무효화)
+    version: str = '1'
+    
+    # generate_signal이 참조하는 최근 bar 수 (on_bar 버퍼 크기)
+    lookback: int = 1
+    
     def __init__(self, name: str, params: Dict[str, Any]):
         """
         Args:
@@ -41,6 +61,7 @@ class BaseStrategy(ABC):
         self.name = name
         self.params = params
         self.positions: Dict[str, float] = {}
+        self._bars: Deque[Dict[str, Any]] = deque(maxlen=self.lookback)
         self._validate_params()
         
     def _validate_params(self) -> None:
@@ -61,6 +82,85 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def generate_signals(self, data: pd.DataFrame) -> pd.Series:
+        """
+        전체 구간 시그널 일괄 생성
+        
+        기본 구현은 bar마다 현재까지의 데이터(``data.iloc[:i+1]``)로
+        generate_signal을 호출하는 기준(reference) 경로입니다.
+        벡터화가 가능한 전략은 이 메서드를 오버라이드하고,
+        LookAheadBiasDetector로 기준 경로와의 일치를 검증합니다.
+        
+        Args:
+            data: OHLCV DataFrame
+            
+        Returns:
+            data.index에 정렬된 액션 시리즈 (1=BUY, -1=SELL, 0=없음)
+        """
+        self.reset()
+        actions = np.zeros(len(data), dtype=np.int8)
+        
+        for i in range(len(data)):
+            signal = self.generate_signal(data.iloc[:i+1])
+            if signal:
+                actions[i] = ACTION_CODES.get(signal.action, 0)
+        
+        return pd.Series(actions, index=data.index, name='action')
+    
+    def order_spec(self) -> Tuple[str, float]:
+        """
+        일괄 시그널 경로의 주문 (심볼, 수량 비율)
+        
+        BacktestEngine.run(vectorized=True)은 generate_signals의 액션 코드만
+        받으므로, 진입 주문의 심볼/수량은 이 메서드에서 가져옵니다.
+        generate_signal이 내는 Signal.symbol/quantity와 같아야 합니다.
+        
+        Returns:
+            (심볼, 보유 현금 대비 진입 비율)
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__}.order_spec 미구현 - vectorized=True 사용 불가"
+        )
+    
+    def resume_signals(self, data: pd.DataFrame, start: int, stop: int) -> np.ndarray:
+        """
+        진입 거부 후 시그널 재생성 (BacktestEngine.run(vectorized=True) 경로)
+        
+        bar start-1의 진입이 거부되어 포지션이 없는 상태에서 [start, stop)
+        구간의 액션을 다시 계산합니다. reset() 후 재개하므로 포지션 보유 여부
+        외의 상태가 없는 전략을 가정합니다.
+        
+        기본 구현은 bar별 prefix 슬라이싱 기준 경로입니다.
+        
+        Returns:
+            길이 stop - start 액션 배열 (1=BUY, -1=SELL, 0=없음)
+        """
+        self.reset()
+        actions = np.zeros(stop - start, dtype=np.int8)
+        
+        for i in range(start, stop):
+            signal = self.generate_signal(data.iloc[:i+1])
+            if signal:
+                actions[i - start] = ACTION_CODES.get(signal.action, 0)
+        
+        return actions
+    
+    def on_bar(self, bar: Dict[str, Any]) -> Optional[Signal]:
+        """
+        신규 bar 1개 처리 (라이브/리플레이 증분 인터페이스)
+        
+        기본 구현은 최근 ``lookback``개 bar 버퍼로 generate_signal을 호출합니다.
+        bar 하나로 판단하는 전략은 DataFrame 생성 없이 처리하도록 오버라이드합니다.
+        
+        Args:
+            bar: 컬럼명 → 값 (timestamp 포함)
+            
+        Returns:
+            Signal 또는 None
+        """
+        self._bars.append(bar)
+        return self.generate_signal(pd.DataFrame(list(self._bars)))
+    
     @abstractmethod
     def validate_params(self) -> bool:
         """
@@ -87,6 +187,18 @@ class BaseStrategy(ABC):
         elif side == 'SELL':
             self.positions[symbol] = self.positions.get(symbol, 0) - quantity
     
+    def on_order_rejected(self, order: Dict[str, Any]) -> None:
+        """
+        주문 거부 콜백 (리스크 한도 등으로 체결되지 않음)
+        
+        generate_signal에서 체결을 가정해 바꾼 포지션 상태를 되돌리도록
+        오버라이드합니다. 기본 구현은 아무것도 하지 않습니다.
+        
+        Args:
+            order: 거부된 주문 정보 (symbol, quantity, side)
+        """
+        pass
+    
     def on_error(self, error: Exception) -> None:
         """
         에러 핸들링
@@ -103,6 +215,7 @@ class BaseStrategy(ABC):
     def reset(self) -> None:
         """상태 초기화"""
         self.positions = {}
+        self._bars.clear()
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}', params={self.params})"
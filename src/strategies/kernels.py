@@ -0,0 +1,135 @@
+"""임계값 전략 상태 커널
+
+진입 임계값에서 들어가고 청산 임계값까지 유지하는 히스테리시스 상태를
+bar별 Python 루프 없이 NumPy로 계산합니다.
+
+진입 조건과 청산 조건이 겹치지 않으면 상태는 진입/청산 이벤트 bar에서만
+바뀝니다. 진입 이벤트는 직전 진입 이벤트 이후 청산 이벤트가 있었을 때만
+실제 진입이고, 청산 이벤트도 마찬가지입니다. 이벤트 위치는 ``np.flatnonzero``로
+찾고 "직전 반대 이벤트"는 이벤트 인덱스끼리의 searchsorted로 구하므로
+비용은 O(n + 이벤트 수 × log 이벤트 수)이며 bar별 Python 루프가 없습니다.
+
+분할 진입(PARAMETERS.md Level 1/Level 2)은 레벨별 히스테리시스의 합입니다.
+청산 임계값을 공유하므로 각 레벨은 독립적으로 진입하고 함께 청산됩니다.
+
+Example:
+    >>> state = hysteresis_state(kimp, entry=0.03, exit=0.01)
+    >>> actions = transitions(state)            # 1=진입, -1=청산
+    >>> levels = level_state(zscore, [-2.0, -2.5], exit=0.0, direction='below')
+    >>> weights = position_fraction(levels, [0.4, 0.6])
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+DIRECTIONS = ('above', 'below')
+
+
+def hysteresis_state(
+    values: np.ndarray,
+    entry: float,
+    exit: float,
+    direction: str = 'above'
+) -> np.ndarray:
+    """
+    히스테리시스 포지션 상태
+
+    direction='above': values >= entry에서 진입, values <= exit에서 청산
+    direction='below': values <= entry에서 진입, values >= exit에서 청산
+    NaN bar는 이벤트가 아니며 직전 상태를 유지합니다.
+
+    Args:
+        values: 지표 배열 (예: 김프율, Z-Score)
+        entry: 진입 임계값
+        exit: 청산 임계값 (진입 조건과 겹치지 않아야 함)
+        direction: 'above' 또는 'below'
+
+    Returns:
+        bar별 보유 여부 (bool 배열)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    enter, leave = _events(values, entry, exit, direction)
+    entries = np.flatnonzero(enter)
+    exits = np.flatnonzero(leave)
+
+    # 직전 같은 종류 이벤트 이후 반대 이벤트가 있었던 이벤트만 상태를 바꿈
+    prev_entry = np.concatenate(([-2], entries[:-1]))
+    prev_exit = np.concatenate(([-1], exits[:-1]))
+    opens = entries[_last_before(exits, entries) > prev_entry]
+    closes = exits[_last_before(entries, exits) > prev_exit]
+
+    delta = np.zeros(len(values), dtype=np.int8)
+    delta[opens] = 1
+    delta[closes] = -1
+    return np.cumsum(delta, dtype=np.int8).astype(bool)
+
+
+def level_state(
+    values: np.ndarray,
+    entries: Sequence[float],
+    exit: float,
+    direction: str = 'above'
+) -> np.ndarray:
+    """
+    분할 진입 레벨 상태
+
+    레벨 k는 entries[k] 도달 시 진입하고, 모든 레벨은 exit 도달 시 함께 청산됩니다.
+
+    Args:
+        values: 지표 배열
+        entries: 레벨별 진입 임계값 (예: Z-Score [-2.0, -2.5])
+        exit: 공통 청산 임계값
+        direction: 'above' 또는 'below'
+
+    Returns:
+        bar별 보유 레벨 수 (int8 배열, 0 ~ len(entries))
+    """
+    levels = np.zeros(len(values), dtype=np.int8)
+    for entry in entries:
+        levels += hysteresis_state(values, entry, exit, direction)
+    return levels
+
+
+def transitions(state: np.ndarray) -> np.ndarray:
+    """
+    상태 변화량 (액션 배열)
+
+    bool 상태는 1=진입, -1=청산, 레벨 상태는 추가/축소된 레벨 수입니다.
+    """
+    state = np.asarray(state, dtype=np.int8)
+    return np.diff(state, prepend=np.int8(0)).astype(np.int8)
+
+
+def position_fraction(levels: np.ndarray, ratios: Sequence[float]) -> np.ndarray:
+    """
+    레벨별 누적 진입 비율
+
+    Args:
+        levels: level_state 결과
+        ratios: 레벨별 진입 비율 (예: [0.4, 0.6])
+
+    Returns:
+        bar별 포지션 비율 (예: Level 1 → 0.4, Level 2 → 1.0)
+    """
+    cumulative = np.concatenate(([0.0], np.cumsum(ratios, dtype=np.float64)))
+    return cumulative[np.asarray(levels, dtype=np.intp)]
+
+
+def _events(values: np.ndarray, entry: float, exit: float, direction: str):
+    """진입/청산 이벤트 마스크 (겹치면 상태가 bar 순서에 의존하므로 거부)"""
+    if direction == 'above':
+        if entry <= exit:
+            raise ValueError(f"direction='above'는 entry > exit여야 합니다: {entry}, {exit}")
+        return values >= entry, values <= exit
+    if direction == 'below':
+        if entry >= exit:
+            raise ValueError(f"direction='below'는 entry < exit여야 합니다: {entry}, {exit}")
+        return values <= entry, values >= exit
+    raise ValueError(f"direction은 {DIRECTIONS} 중 하나여야 합니다: {direction}")
+
+
+def _last_before(events: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """위치별 직전(위치 미만) 이벤트 인덱스 (없으면 -1)"""
+    events = np.concatenate(([-1], events))
+    return events[np.searchsorted(events, positions, side='left') - 1]
@@ -12,10 +12,14 @@
 - 김프율이 exit_threshold 이하일 때
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+from ...data.features import kimp_rate
+from ...utils.logger import debug_enabled, get_logger
 from ..base import BaseStrategy, Signal
+from ..kernels import hysteresis_state, transitions
 
 
 class KimpCashCarryStrategy(BaseStrategy):
@@ -37,6 +41,9 @@ class KimpCashCarryStrategy(BaseStrategy):
         >>> signal = strategy.generate_signal(data)
     """
     
+    SYMBOL = 'BTC'
+    PRICE_COLUMNS = {'upbit_price': 0, 'binance_price': 0, 'usd_krw': 1300}  # 컬럼 → 없을 때 기본값
+    
     def __init__(self, params: Dict[str, Any]):
         # 기본값 설정
         default_params = {
@@ -88,6 +95,61 @@ class KimpCashCarryStrategy(BaseStrategy):
             return 0
         return (upbit_price - binance_krw) / binance_krw
     
+    def calculate_kimp_series(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        김프율 시계열 계산 (벡터화)
+        
+        calculate_kimp와 같은 연산 순서를 사용하므로 bar별 결과가 일치합니다.
+        
+        Args:
+            data: upbit_price, binance_price, usd_krw 컬럼을 가진 DataFrame
+            
+        Returns:
+            김프율 배열
+        """
+        return kimp_rate(*(
+            self._column(data, name, default) for name, default in self.PRICE_COLUMNS.items()
+        ))
+    
+    def generate_signals(self, data: pd.DataFrame) -> pd.Series:
+        """
+        전체 구간 시그널 일괄 생성
+        
+        각 bar의 김프율만 사용하므로 bar별 prefix 슬라이싱 없이
+        generate_signal을 반복 호출한 결과와 동일합니다.
+        
+        Returns:
+            액션 시리즈 (1=BUY, -1=SELL, 0=없음)
+        """
+        self.reset()
+        actions = self._actions(self.calculate_kimp_series(data))
+        return pd.Series(actions, index=data.index, name='action')
+    
+    def resume_signals(self, data: pd.DataFrame, start: int, stop: int) -> np.ndarray:
+        """진입 거부 후 시그널 재생성 (bar별 김프율만 사용하므로 구간 값만 다시 계산)"""
+        self.reset()
+        return self._actions(kimp_rate(*(
+            self._column(data, name, default)[start:stop]
+            for name, default in self.PRICE_COLUMNS.items()
+        )))
+    
+    def _actions(self, kimp: np.ndarray) -> np.ndarray:
+        """김프율 → 액션 배열 (포지션 없음에서 시작, 마지막 상태를 is_in_position에 반영)"""
+        state = hysteresis_state(kimp, self.entry_threshold, self.exit_threshold, 'above')
+        self.is_in_position = bool(state[-1]) if len(state) else False
+        return transitions(state)
+    
+    def order_spec(self) -> Tuple[str, float]:
+        """일괄 시그널 경로의 주문 (generate_signal과 같은 심볼/수량)"""
+        return self.SYMBOL, self.position_size
+    
+    @staticmethod
+    def _column(data: pd.DataFrame, name: str, default: float) -> np.ndarray:
+        """컬럼 배열 (없으면 기본값)"""
+        if name in data.columns:
+            return data[name].to_numpy(dtype=np.float64)
+        return np.full(len(data), float(default))
+    
     def generate_signal(self, data: pd.DataFrame) -> Optional[Signal]:
         """
         시그널 생성
@@ -105,15 +167,41 @@ class KimpCashCarryStrategy(BaseStrategy):
         if data.empty:
             return None
             
-        # 최신 데이터
-        latest = data.iloc[-1]
-        timestamp = latest.get('timestamp')
-        upbit_price = latest.get('upbit_price', 0)
-        binance_price = latest.get('binance_price', 0)
-        usd_krw = latest.get('usd_krw', 1300)  # 기본 환율
+        # 최신 데이터 (컬럼별로 읽음 - data.iloc[-1]은 컴팩트 스키마의 int64
+        # epoch-ns 시각을 float32 가격과 함께 float64로 바꿔 정밀도를 잃음)
+        bar = {
+            name: float(data[name].iat[-1])
+            for name in self.PRICE_COLUMNS if name in data.columns
+        }
+        if 'timestamp' in data.columns:
+            bar['timestamp'] = data['timestamp'].iat[-1]
+        return self._evaluate(bar)
+    
+    def on_bar(self, bar: Dict[str, Any]) -> Optional[Signal]:
+        """
+        신규 bar 1개 처리 (최신 bar만 사용하므로 버퍼 없음)
+        
+        Args:
+            bar: timestamp, upbit_price, binance_price, usd_krw 값
+            
+        Returns:
+            Signal 또는 None
+        """
+        return self._evaluate(bar)
+    
+    def _evaluate(self, bar: Any) -> Optional[Signal]:
+        """최신 bar(dict 또는 Series)의 진입/청산 판단"""
+        timestamp = bar.get('timestamp')
+        upbit_price = bar.get('upbit_price', 0)
+        binance_price = bar.get('binance_price', 0)
+        usd_krw = bar.get('usd_krw', 1300)  # 기본 환율
         
         # 김프율 계산
         kimp = self.calculate_kimp(upbit_price, binance_price, usd_krw)
+        if debug_enabled():
+            get_logger(strategy=self.name).debug(
+                f"{timestamp} 김프 {kimp:.4%} (포지션 보유: {self.is_in_position})"
+            )
         
         # 포지션 없음 → 진입 조건 확인
         if not self.is_in_position:
@@ -122,7 +210,7 @@ class KimpCashCarryStrategy(BaseStrategy):
                 return Signal(
                     timestamp=timestamp,
                     action='BUY',
-                    symbol='BTC',
+                    symbol=self.SYMBOL,
                     exchange='upbit,binance',
                     quantity=self.position_size,
                     price=upbit_price,
@@ -143,7 +231,7 @@ class KimpCashCarryStrategy(BaseStrategy):
                 return Signal(
                     timestamp=timestamp,
                     action='SELL',
-                    symbol='BTC',
+                    symbol=self.SYMBOL,
                     exchange='upbit,binance',
                     quantity=self.position_size,
                     price=upbit_price,
@@ -159,6 +247,11 @@ class KimpCashCarryStrategy(BaseStrategy):
         
         return None
     
+    def on_order_rejected(self, order: Dict[str, Any]) -> None:
+        """진입 거부 시 포지션 없음 상태로 복귀 (다음 bar부터 다시 진입 판단)"""
+        if order.get('side') == 'BUY':
+            self.is_in_position = False
+    
     def reset(self) -> None:
         """상태 초기화"""
         super().reset()
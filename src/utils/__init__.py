@@ -1,5 +1,33 @@
-"""유틸리티"""
+"""유틸리티
 
-from .logger import setup_logger
+공개 함수/클래스는 첫 사용 시 로드됩니다 (loguru 등 지연 import).
+"""
 
-__all__ = ["setup_logger"]
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cache import MemoCache, memoize
+    from .events import EventLog
+    from .logger import debug_enabled, get_logger, setup_logger
+
+_EXPORTS = {
+    "setup_logger": ".logger",
+    "get_logger": ".logger",
+    "debug_enabled": ".logger",
+    "EventLog": ".events",
+    "MemoCache": ".cache",
+    "memoize": ".cache",
+}
+
+__all__ = [
+    "setup_logger",
+    "get_logger",
+    "debug_enabled",
+    "EventLog",
+    "MemoCache",
+    "memoize",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
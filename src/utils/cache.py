@@ -0,0 +1,280 @@
+"""콘텐츠 주소 기반 메모이제이션 캐시
+
+입력의 해시(설정, 파라미터, 데이터 지문)를 키로 계산 결과를 재사용합니다.
+
+- 메모리 계층: LRU (항목 수 + 총 바이트 제한)
+- 디스크 계층: pickle 파일 (총 용량 제한, 오래 사용하지 않은 파일부터 삭제)
+
+Example:
+    >>> cache = MemoCache('data/cache', max_items=64, max_disk_bytes=2 * 1024**3)
+    >>> @memoize(cache, version='1')
+    ... def rolling_stats(series, window):
+    ...     ...
+"""
+
+import functools
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .hashing import array_fingerprint, frame_fingerprint, stable_hash
+
+_MISSING = object()
+
+# 기본 캐시 메모리 계층 용량 (add_features 결과 등 DataFrame 보관)
+DEFAULT_MAX_MEMORY_BYTES = 512 * 1024 ** 2
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중 통계"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / total if total else 0.0
+
+
+class MemoCache:
+    """
+    2계층 메모이제이션 캐시
+
+    캐시된 값은 복사하지 않고 그대로 반환하므로 호출 측에서 수정하지 마세요.
+
+    Args:
+        directory: 디스크 계층 경로 (None이면 메모리 계층만 사용)
+        max_items: 메모리 계층 최대 항목 수
+        max_disk_bytes: 디스크 계층 최대 용량
+        max_memory_bytes: 메모리 계층 최대 용량 (None이면 항목 수만 제한).
+            크기는 DataFrame/ndarray 값 버퍼 기준 추정치이며, 한도보다 큰 값은
+            메모리 계층에 두지 않습니다.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_items: int = 128,
+        max_disk_bytes: int = 1024 ** 3,
+        max_memory_bytes: Optional[int] = None
+    ):
+        self.directory = Path(directory) if directory else None
+        self.max_items = max_items
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.stats = CacheStats()
+
+        self._memory: OrderedDict = OrderedDict()
+        self._sizes: dict = {}
+        self.memory_bytes = 0
+        self._lock = threading.Lock()
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        캐시 조회 (메모리 → 디스크 순)
+
+        Returns:
+            캐시 값 또는 default
+        """
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """캐시 조회, 없으면 계산 후 저장"""
+        value = self._lookup(key)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """메모리/디스크 계층에 저장"""
+        self._remember(key, value)
+        if self.directory:
+            self._write(key, value)
+            self._evict_disk()
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            self._sizes.clear()
+            self.memory_bytes = 0
+        if self.directory:
+            for path in self.directory.glob('*/*.pkl'):
+                path.unlink(missing_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+        return bool(self.directory) and self._path(key).exists()
+
+    def _lookup(self, key: str) -> Any:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return self._memory[key]
+
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+            except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+                pass
+            else:
+                os.utime(path)  # 최근 사용 시각 갱신 (LRU 삭제 기준)
+                self.stats.disk_hits += 1
+                self._remember(key, value)
+                return value
+
+        self.stats.misses += 1
+        return _MISSING
+
+    def _remember(self, key: str, value: Any) -> None:
+        size = _sizeof(value) if self.max_memory_bytes is not None else 0
+        with self._lock:
+            self._forget(key)
+            if self.max_memory_bytes is not None and size > self.max_memory_bytes:
+                return
+            self._memory[key] = value
+            self._sizes[key] = size
+            self.memory_bytes += size
+            while len(self._memory) > self.max_items or (
+                self.max_memory_bytes is not None and self.memory_bytes > self.max_memory_bytes
+            ):
+                self._forget(next(iter(self._memory)))
+
+    def _forget(self, key: str) -> None:
+        """메모리 계층에서 삭제 (lock 안에서 호출)"""
+        if key in self._memory:
+            del self._memory[key]
+            self.memory_bytes -= self._sizes.pop(key)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f'{key}.pkl'
+
+    def _write(self, key: str, value: Any) -> None:
+        """임시 파일에 쓴 뒤 교체 (동시 쓰기 시 손상 방지)"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def _evict_disk(self) -> None:
+        """용량 초과 시 오래 사용하지 않은 파일부터 삭제"""
+        entries = []
+        total = 0
+        for path in self.directory.glob('*/*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def _sizeof(value: Any) -> int:
+    """메모리 사용량 추정 (pandas/numpy는 값 버퍼, dataclass/컨테이너는 구성 요소 합)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if is_dataclass(value) and not isinstance(value, type):
+        return sys.getsizeof(value) + sum(_sizeof(getattr(value, f.name)) for f in fields(value))
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_sizeof(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(item) for item in value.values())
+    return sys.getsizeof(value)
+
+
+_default_cache = MemoCache(max_memory_bytes=DEFAULT_MAX_MEMORY_BYTES)
+
+
+def default_cache() -> MemoCache:
+    """기본 캐시 (메모리 계층만 사용, DEFAULT_MAX_MEMORY_BYTES 제한)"""
+    return _default_cache
+
+
+def set_default_cache(cache: MemoCache) -> None:
+    """기본 캐시 교체 (예: 디스크 계층 사용)"""
+    global _default_cache
+    _default_cache = cache
+
+
+def fingerprint(obj: Any) -> str:
+    """
+    임의 입력의 지문
+
+    DataFrame/Series/ndarray는 값 바이트를 해시하고,
+    그 외는 JSON 직렬화 기반으로 해시합니다.
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return frame_fingerprint(obj)
+    if isinstance(obj, np.ndarray):
+        return array_fingerprint(obj)
+    return stable_hash(obj)
+
+
+def memoize(
+    cache: Optional[MemoCache] = None,
+    version: str = '1',
+    copy: bool = False
+) -> Callable:
+    """
+    함수 메모이제이션 데코레이터
+
+    키: 함수 경로 + version + 모든 인자의 지문.
+    함수 구현이 바뀌면 version을 올려 이전 결과를 무효화합니다.
+
+    Args:
+        cache: 사용할 캐시 (None이면 default_cache())
+        version: 구현 버전
+        copy: True면 캐시 결과의 복사본(.copy())을 반환 (DataFrame 등 가변 결과를
+            호출자가 수정해도 캐시가 오염되지 않음)
+    """
+    def decorator(func: Callable) -> Callable:
+        name = f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = stable_hash({
+                'func': name,
+                'version': version,
+                'args': [fingerprint(a) for a in args],
+                'kwargs': {k: fingerprint(v) for k, v in kwargs.items()},
+            })
+            target = cache if cache is not None else default_cache()
+            result = target.get_or_compute(key, lambda: func(*args, **kwargs))
+            return result.copy() if copy else result
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
@@ -0,0 +1,170 @@
+"""구조화 이벤트 로그 (JSONL)
+
+체결/시그널 이벤트를 한 줄에 하나의 JSON으로 기록합니다. log()는 이벤트를
+큐에 넣기만 하고, 직렬화와 파일 쓰기는 백그라운드 스레드가 batch_size개씩
+모아서 수행하므로 백테스트/라이브 루프가 I/O를 기다리지 않습니다.
+
+대기 이벤트가 max_pending개를 넘으면 log()는 기록 스레드가 따라잡을 때까지
+기다립니다. 기록이 실패하면(디스크 부족, 직렬화 불가 값 등) 기록 스레드는
+멈추고, 이후 log()/close()가 그 에러를 RuntimeError로 다시 발생시킵니다.
+
+Example:
+    >>> with EventLog('logs/events.jsonl') as events:
+    ...     events.log('fill', side='BUY', price=136_500_000, quantity=0.1)
+    >>> pd.read_json('logs/events.jsonl', lines=True)
+"""
+
+import json
+import queue
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+_STOP = object()
+
+# log()가 채우는 레코드 키 (호출자 필드로 덮어쓸 수 없음)
+RESERVED_FIELDS = ('ts', 'event')
+
+
+class EventLog:
+    """
+    배치 JSONL 이벤트 로그
+
+    Args:
+        path: 로그 파일 경로 (이어쓰기)
+        batch_size: 한 번에 기록할 최대 이벤트 수
+        flush_interval: 이벤트가 적을 때 기록 주기 (초)
+        max_pending: 기록 대기 이벤트 최대 수 (초과 시 log()가 대기)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        flush_interval: float = 0.5,
+        max_pending: int = 100_000
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.written = 0
+        self.batches = 0
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._writer = threading.Thread(target=self._run, name='event-log', daemon=True)
+        self._writer.start()
+
+    def log(self, event: str, **fields: Any) -> None:
+        """
+        이벤트 추가 (대기 이벤트가 max_pending개 미만이면 논블로킹)
+
+        Args:
+            event: 이벤트 종류 (예: 'fill', 'signal')
+            **fields: 이벤트 필드 (numpy 스칼라, datetime 지원, RESERVED_FIELDS 제외)
+
+        Raises:
+            ValueError: 예약된 필드명 사용
+            RuntimeError: close() 이후 호출, 또는 이전 기록 실패
+        """
+        if 'ts' in fields:
+            raise ValueError(f"예약된 필드명입니다: 'ts' (예약: {RESERVED_FIELDS})")
+        if self._closed:
+            raise RuntimeError(f"닫힌 EventLog에 기록할 수 없습니다: {self.path}")
+        self._put({'ts': time.time(), 'event': event, **fields})
+
+    def close(self) -> None:
+        """
+        남은 이벤트를 기록하고 종료
+
+        Raises:
+            RuntimeError: 기록 실패 (실패 이후 이벤트는 기록되지 않음)
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._put(_STOP)
+        finally:
+            self._writer.join()
+            self._file.close()
+        self._check()
+
+    def _put(self, item: Any) -> None:
+        """큐에 추가 (max_pending개 이상 대기 중이면 대기, 기록 스레드가 실패했으면 에러)"""
+        self._check()
+        while self._queue.qsize() >= self.max_pending:
+            time.sleep(0.001)
+            self._check()
+        self._queue.put(item)
+
+    def _check(self) -> None:
+        """기록 스레드 실패 확인"""
+        if self._error is not None:
+            raise RuntimeError(f"이벤트 로그 기록 실패: {self.path} - {self._error!r}") from self._error
+
+    def _run(self) -> None:
+        """백그라운드 기록 루프 (실패하면 에러를 저장하고 종료)"""
+        try:
+            self._loop()
+        except Exception as e:
+            self._error = e
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch: List[Dict[str, Any]] = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        lines = ''.join(
+            json.dumps(record, ensure_ascii=False, default=_encode) + '\n'
+            for record in batch
+        )
+        self._file.write(lines)
+        self._file.flush()
+        self.written += len(batch)
+        self.batches += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _encode(value: Any) -> Any:
+    """JSON 기본 직렬화가 안 되는 값 변환"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
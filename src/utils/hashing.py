@@ -0,0 +1,100 @@
+"""콘텐츠 해시 유틸리티
+
+백테스트 설정/파라미터와 입력 데이터를 결정적인(deterministic) 키로 변환합니다.
+결과 저장소와 메모이제이션 캐시가 같은 키를 공유합니다.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DIGEST_SIZE = 16
+
+
+def stable_hash(obj: Any) -> str:
+    """
+    JSON 직렬화 기반 해시
+
+    dict 키 순서와 무관하며 dataclass, numpy 스칼라를 지원합니다.
+
+    Args:
+        obj: 해시 대상 (dict, list, dataclass, 스칼라)
+
+    Returns:
+        32자리 16진수 문자열
+    """
+    payload = json.dumps(_normalize(obj), sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=DIGEST_SIZE).hexdigest()
+
+
+def array_fingerprint(values: np.ndarray, hasher=None) -> str:
+    """
+    배열 지문 (dtype, shape, 원본 바이트)
+
+    수치 배열은 복사 없이 메모리를 그대로 해시합니다.
+    """
+    h = hasher or hashlib.blake2b(digest_size=DIGEST_SIZE)
+    values = np.asarray(values)
+    if values.dtype == object:
+        values = pd.util.hash_array(values.ravel())
+    h.update(f"{values.dtype.str}{values.shape}".encode())
+    h.update(memoryview(np.ascontiguousarray(values)).cast('B'))
+    return h.hexdigest()
+
+
+def frame_fingerprint(data: pd.DataFrame | pd.Series) -> str:
+    """
+    DataFrame/Series 지문
+
+    인덱스와 각 컬럼의 이름, dtype, 값을 해시합니다.
+    같은 내용의 데이터는 항상 같은 지문을 가집니다.
+
+    Args:
+        data: 입력 데이터
+
+    Returns:
+        32자리 16진수 문자열
+    """
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    h.update(str(len(data)).encode())
+    _update(h, data.index)
+
+    if isinstance(data, pd.Series):
+        h.update(str(data.name).encode())
+        _update(h, data)
+    else:
+        for name in data.columns:
+            h.update(str(name).encode())
+            _update(h, data[name])
+    return h.hexdigest()
+
+
+def _update(h, obj: pd.Index | pd.Series) -> None:
+    """dtype과 값을 해시에 추가 (datetime은 내부 정수 표현 사용)"""
+    h.update(str(obj.dtype).encode())
+    if isinstance(obj.dtype, pd.CategoricalDtype):
+        values = np.asarray(obj.astype(object))
+    elif pd.api.types.is_datetime64_any_dtype(obj.dtype):
+        values = np.asarray(obj.array.asi8)
+    else:
+        values = np.asarray(obj)
+    array_fingerprint(values, h)
+
+
+def _normalize(obj: Any) -> Any:
+    """JSON 직렬화 가능한 형태로 변환"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _normalize(asdict(obj))
+    if isinstance(obj, dict):
+        return {str(k): _normalize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(v) for v in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return obj
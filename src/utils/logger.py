@@ -1,32 +1,76 @@
-"""로거 설정"""
+"""로거 설정
+
+loguru는 setup_logger/get_logger 호출 시 로드합니다 (엔진 워커 콜드 스타트).
+
+핫 루프의 디버그 로그는 debug_enabled()로 먼저 확인하세요. 레벨 확인은
+모듈 변수 비교 한 번이므로, 비활성 상태에서는 메시지 포맷팅과 loguru 호출
+비용이 들지 않습니다. 이 레벨은 setup_logger가 기록한 값이므로 loguru
+핸들러를 직접 추가/변경한 경우에는 반영되지 않습니다 (setup_logger 사용).
+
+Example:
+    >>> setup_logger('INFO', 'logs/run.log', enqueue=True)
+    >>> if debug_enabled():
+    ...     get_logger().debug(f"김프 {kimp:.4%}")
+"""
 
 import sys
-from loguru import logger
+from typing import Any, Optional
+
+# loguru 기본 레벨 번호
+LEVELS = {
+    'TRACE': 5,
+    'DEBUG': 10,
+    'INFO': 20,
+    'SUCCESS': 25,
+    'WARNING': 30,
+    'ERROR': 40,
+    'CRITICAL': 50,
+}
+
+# setup_logger로 설정한 최소 레벨 (호출 전에는 INFO: 핫 루프 디버그 로그 비활성)
+_level_no = LEVELS['INFO']
 
 
 def setup_logger(
     level: str = "INFO",
     log_file: str = None,
-    rotation: str = "10 MB"
+    rotation: str = "10 MB",
+    enqueue: bool = False
 ) -> None:
     """
     로거 설정
-    
+
     Args:
-        level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR)
+        level: 로그 레벨 (LEVELS 중 하나, 대소문자 무관)
         log_file: 로그 파일 경로 (None이면 콘솔만)
         rotation: 로그 파일 회전 크기
+        enqueue: True면 메시지를 큐에 넣고 백그라운드 스레드에서 출력
+            (호출 스레드가 I/O를 기다리지 않음, 종료 전 get_logger().complete() 호출).
+            레코드 직렬화 때문에 호출당 CPU 비용은 늘어나므로 핫 루프의
+            체결/시그널 기록은 EventLog를 사용하세요.
+
+    Raises:
+        ValueError: 알 수 없는 레벨
     """
+    level = level.upper()
+    if level not in LEVELS:
+        raise ValueError(f"알 수 없는 로그 레벨: {level!r} (가능: {list(LEVELS)})")
+
+    from loguru import logger
+    global _level_no
+
     # 기존 핸들러 제거
     logger.remove()
-    
+    _level_no = LEVELS[level]
+
     # 콘솔 출력
     logger.add(
         sys.stderr,
         level=level,
+        enqueue=enqueue,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
     )
-    
+
     # 파일 출력
     if log_file:
         logger.add(
@@ -34,5 +78,39 @@ def setup_logger(
             level=level,
             rotation=rotation,
             retention="7 days",
-            compression="gz"
+            compression="gz",
+            enqueue=enqueue
         )
+
+
+def get_logger(**extra: Any):
+    """
+    loguru 로거 (첫 호출 시 로드)
+
+    Args:
+        **extra: 바인딩할 컨텍스트 (예: strategy='kimp_cash_carry')
+    """
+    from loguru import logger
+    return logger.bind(**extra) if extra else logger
+
+
+def log_enabled(level: str) -> bool:
+    """해당 레벨 로그 출력 여부"""
+    return LEVELS.get(level.upper(), 0) >= _level_no
+
+
+def debug_enabled() -> bool:
+    """
+    DEBUG 로그 출력 여부 (핫 루프용)
+
+    setup_logger로 설정한 레벨 기준입니다 (호출 전에는 INFO로 간주해 False).
+    """
+    return _level_no <= 10
+
+
+def current_level() -> Optional[str]:
+    """설정된 최소 레벨 이름"""
+    for name, number in LEVELS.items():
+        if number == _level_no:
+            return name
+    return None
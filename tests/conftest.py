@@ -0,0 +1,37 @@
+"""테스트 공용 픽스처"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def make_kimp_data(
+    n: int = 600,
+    seed: int = 0,
+    start: str = '2024-01-01',
+    freq: str = 'min'
+) -> pd.DataFrame:
+    """
+    합성 김프 데이터 생성
+
+    김프율이 약 -1% ~ 5% 사이를 오가도록 업비트 가격을 만들어
+    진입/청산이 여러 번 발생하게 합니다.
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=n, freq=freq)
+    binance = 100_000 * np.exp(np.cumsum(rng.normal(0, 5e-4, n)))
+    usd_krw = 1_300 + np.cumsum(rng.normal(0, 0.05, n))
+    kimp = 0.02 + 0.03 * np.sin(np.arange(n) / 25) + rng.normal(0, 2e-3, n)
+    upbit = binance * usd_krw * (1 + kimp)
+
+    return pd.DataFrame({
+        'timestamp': index,
+        'upbit_price': upbit,
+        'binance_price': binance,
+        'usd_krw': usd_krw,
+    }, index=index)
+
+
+@pytest.fixture
+def kimp_data() -> pd.DataFrame:
+    return make_kimp_data()
@@ -0,0 +1,847 @@
+"""백테스트 엔진 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.engine import BacktestEngine, BacktestConfig
+from src.backtest.portfolio import Portfolio
+from src.backtest.risk import RiskConfig, RiskEngine
+from src.backtest.validation import LookAheadBiasDetector
+from src.data.schema import to_compact
+from src.utils.events import EventLog
+from src.strategies.kimp.cash_carry import KimpCashCarryStrategy
+
+
+class PeekingStrategy(KimpCashCarryStrategy):
+    """다음 bar 김프를 참조하는 (잘못된) 전략"""
+    
+    def generate_signals(self, data):
+        shifted = data.copy()
+        shifted[['upbit_price', 'binance_price', 'usd_krw']] = (
+            data[['upbit_price', 'binance_price', 'usd_krw']].shift(-1).ffill()
+        )
+        return super().generate_signals(shifted)
+
+
+class TestPortfolio:
+    """페어 포지션 손익 테스트"""
+    
+    def test_round_trip_pnl(self):
+        """김프 축소 시 실현손익 테스트 (수수료/슬리피지 없음)"""
+        portfolio = Portfolio(13_650_000)
+        ts = pd.Timestamp('2024-01-01')
+        
+        # 김프 5%에 1 BTC 진입 → 김프 0%에 청산, 선물은 가격 불변
+        entry = portfolio.open(1, ts, 'BTC', 1.0, 13_650_000, 10_000, 1_300)
+        exit_ = portfolio.close(2, ts, 'BTC', 13_000_000, 10_000, 1_300)
+        
+        assert entry.quantity == pytest.approx(1.0)
+        assert entry.hedge_quantity == pytest.approx(1.0)
+        assert exit_.pnl == pytest.approx(-650_000)
+        assert portfolio.cash == pytest.approx(13_650_000 - 650_000)
+        assert not portfolio.position.is_open
+        
+    def test_hedge_offsets_price_move(self):
+        """가격 동반 상승 시 헤지 손익 상쇄 테스트"""
+        portfolio = Portfolio(1_000_000)
+        ts = pd.Timestamp('2024-01-01')
+        
+        portfolio.open(0, ts, 'BTC', 1.0, 1_300, 1, 1_300)
+        trade = portfolio.close(1, ts, 'BTC', 1_430, 1.1, 1_300)
+        
+        assert trade.pnl == pytest.approx(0.0, abs=1e-6)
+        
+    def test_commission_charged_on_both_legs(self):
+        """양 레그 수수료 차감 테스트"""
+        portfolio = Portfolio(1_000_000, commission_rate=0.001)
+        ts = pd.Timestamp('2024-01-01')
+        
+        entry = portfolio.open(0, ts, 'BTC', 1.0, 1_300, 1, 1_300)
+        
+        # 현물 대금 + 양 레그 수수료 = 배정 금액
+        assert portfolio.cash == pytest.approx(0.0, abs=1e-6)
+        assert entry.commission == pytest.approx(2 * entry.quantity * 1_300 * 0.001)
+        
+        exit_ = portfolio.close(1, ts, 'BTC', 1_300, 1, 1_300)
+        assert exit_.pnl == pytest.approx(-(entry.commission + exit_.commission))
+        
+    def test_mark_to_market(self):
+        """bar별 평가금액 테스트"""
+        portfolio = Portfolio(1_300)
+        ts = pd.Timestamp('2024-01-01')
+        spot = np.array([1_300, 1_300, 1_330, 1_320, 1_310], dtype=float)
+        hedge = np.array([1.0, 1.0, 1.01, 1.0, 1.0])
+        fx = np.full(5, 1_300.0)
+        
+        portfolio.open(1, ts, 'BTC', 1.0, spot[1], hedge[1], fx[1])
+        portfolio.close(3, ts, 'BTC', spot[3], hedge[3], fx[3])
+        equity = portfolio.mark_to_market(spot, hedge, fx)
+        
+        expected = [1_300, 1_300, 1_330 - 13, 1_320, 1_320]
+        np.testing.assert_allclose(equity, expected)
+
+
+class TestBacktestEngine:
+    """백테스트 엔진 테스트"""
+    
+    def test_equity_moves_with_trades(self, kimp_data):
+        """거래 발생 시 자산 변동 테스트"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        engine = BacktestEngine(config)
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        
+        result = engine.run(strategy, kimp_data)
+        closed = [t for t in result.trades if t.side == 'SELL']
+        
+        assert len(result.equity_curve) == len(kimp_data)
+        assert result.equity_curve.iloc[0] == config.initial_capital
+        assert closed
+        assert all(t.pnl != 0 for t in closed)
+        assert result.equity_curve.nunique() > 1
+        
+    def test_hedge_requires_fx_column(self, kimp_data):
+        """선물 레그 사용 시 환율 컬럼 누락 에러 테스트"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31', fx_col='usdt_krw')
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        
+        for vectorized in (False, True):
+            with pytest.raises(ValueError, match='usdt_krw'):
+                BacktestEngine(config).run(strategy, kimp_data, vectorized=vectorized)
+        
+    def test_final_equity_matches_realized_pnl(self, kimp_data):
+        """평가금액과 실현손익 일치 테스트"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        engine = BacktestEngine(config)
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        
+        # 마지막 포지션이 청산된 구간까지만 사용
+        result = engine.run(strategy, kimp_data)
+        last_exit = max(t.timestamp for t in result.trades if t.side == 'SELL')
+        realized = sum(t.pnl for t in result.trades if t.timestamp <= last_exit and t.side == 'SELL')
+        
+        assert result.equity_curve.loc[last_exit] == pytest.approx(
+            config.initial_capital + realized
+        )
+        
+    def test_vectorized_matches_bar_loop(self, kimp_data):
+        """빠른 경로와 bar별 경로 결과 일치 테스트"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        
+        slow = BacktestEngine(config).run(KimpCashCarryStrategy(params), kimp_data)
+        fast = BacktestEngine(config).run(KimpCashCarryStrategy(params), kimp_data, vectorized=True)
+        
+        assert [(t.timestamp, t.side) for t in fast.trades] == [(t.timestamp, t.side) for t in slow.trades]
+        np.testing.assert_allclose(fast.equity_curve, slow.equity_curve)
+        
+    def test_bad_bars(self, kimp_data):
+        """잘못된 bar 제거/채우기로 가짜 진입 방지 테스트"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        data = kimp_data.copy()
+        data.iloc[100, data.columns.get_loc('upbit_price')] *= 1.5   # 가짜 50% 김프
+        data.iloc[200, data.columns.get_loc('binance_price')] = 0.0
+        
+        raw = BacktestEngine(config).run(KimpCashCarryStrategy(params), data)
+        clean = BacktestEngine(config).run(KimpCashCarryStrategy(params), kimp_data)
+        
+        assert data.index[100] in [t.timestamp for t in raw.trades]
+        for bad_bars in ('skip', 'ffill'):
+            engine = BacktestEngine(config, bad_bars=bad_bars)
+            result = engine.run(KimpCashCarryStrategy(params), data, vectorized=True)
+            
+            assert engine.quality.bad_rows == 2
+            assert [t.timestamp for t in result.trades] == [t.timestamp for t in clean.trades]
+        with pytest.raises(ValueError):
+            BacktestEngine(config, bad_bars='drop')
+    
+    def test_vectorized_order_spec(self, kimp_data):
+        """빠른 경로 주문 심볼/수량을 전략에서 가져오는지 테스트"""
+        class HalfSize(KimpCashCarryStrategy):
+            SYMBOL = 'ETH'
+        
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0, 'position_size': 0.5}
+        
+        slow = BacktestEngine(config).run(HalfSize(params), kimp_data)
+        fast = BacktestEngine(config).run(HalfSize(params), kimp_data, vectorized=True)
+        
+        assert {t.symbol for t in fast.trades} == {'ETH'}
+        assert [t.quantity for t in fast.trades] == pytest.approx([t.quantity for t in slow.trades])
+        
+    def test_compact_schema(self, kimp_data):
+        """컴팩트 스키마 입력 테스트 (int64 시각, float32 가격)"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-01-01 08:00')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        compact = to_compact(kimp_data)
+        
+        expected = BacktestEngine(config).run(KimpCashCarryStrategy(params), kimp_data, vectorized=True)
+        fast = BacktestEngine(config).run(KimpCashCarryStrategy(params), compact, vectorized=True)
+        slow = BacktestEngine(config).run(KimpCashCarryStrategy(params), compact)
+        
+        for result in (fast, slow):
+            assert [(t.timestamp, t.side) for t in result.trades] == [
+                (t.timestamp, t.side) for t in expected.trades
+            ]
+            np.testing.assert_allclose(result.equity_curve, expected.equity_curve, rtol=1e-6)
+            assert result.cagr == pytest.approx(expected.cagr, rel=1e-3)
+        assert fast.equity_curve.index.dtype == np.int64
+        
+    def test_compact_schema_keeps_ns_timestamps(self, kimp_data):
+        """컴팩트 스키마 bar별 경로의 시각 정밀도 테스트 (float64 변환 시 256ns 단위로 반올림됨)"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-01-01 08:00')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        data = kimp_data.copy()
+        data['timestamp'] += pd.Timedelta(microseconds=7)
+        data.index = pd.DatetimeIndex(data['timestamp'])
+        compact = to_compact(data)
+        
+        fast = BacktestEngine(config).run(KimpCashCarryStrategy(params), compact, vectorized=True)
+        slow = BacktestEngine(config).run(KimpCashCarryStrategy(params), compact)
+        
+        assert slow.trades
+        assert [pd.Timestamp(t.timestamp) for t in slow.trades] == [t.timestamp for t in fast.trades]
+        assert {pd.Timestamp(t.timestamp).microsecond for t in slow.trades} == {7}
+        
+    def test_fill_event_log(self, tmp_path, kimp_data):
+        """체결 이벤트 로그 기록 테스트"""
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        path = tmp_path / 'fills.jsonl'
+        
+        with EventLog(str(path)) as events:
+            result = BacktestEngine(config, event_log=events).run(
+                KimpCashCarryStrategy({}), kimp_data, vectorized=True
+            )
+        fills = pd.read_json(path, lines=True)
+        
+        assert len(fills) == len(result.trades)
+        assert fills['side'].tolist() == [t.side for t in result.trades]
+        assert set(fills['strategy']) == {'kimp_cash_carry'}
+        
+    def test_fill_event_log_on_cache_hit(self, tmp_path, kimp_data):
+        """캐시 적중 시에도 체결 이벤트 기록 테스트"""
+        from src.utils.cache import MemoCache
+        
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        cache = MemoCache()
+        paths = [tmp_path / 'miss.jsonl', tmp_path / 'hit.jsonl']
+        
+        for path in paths:
+            with EventLog(str(path)) as events:
+                BacktestEngine(config, event_log=events, cache=cache).run(KimpCashCarryStrategy({}), kimp_data)
+        miss, hit = (pd.read_json(path, lines=True).drop(columns='ts') for path in paths)
+        
+        assert cache.stats.memory_hits == 1
+        assert len(hit) > 0
+        pd.testing.assert_frame_equal(hit, miss)
+
+
+class TestLookAheadBiasDetector:
+    """Look-Ahead Bias 감지기 테스트"""
+    
+    def test_clean_strategy(self, kimp_data):
+        """미래 정보 미사용 전략 통과 테스트"""
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        detector = LookAheadBiasDetector(n_cuts=30, max_workers=4)
+        
+        report = detector.detect(strategy, kimp_data)
+        
+        assert len(report.cut_points) == 30
+        assert not report.has_lookahead
+        
+    def test_peeking_strategy_flagged(self, kimp_data):
+        """미래 정보 사용 전략 탐지 테스트"""
+        strategy = PeekingStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        detector = LookAheadBiasDetector(n_cuts=100, max_workers=4)
+        
+        report = detector.detect(strategy, kimp_data)
+        
+        assert report.has_lookahead
+        assert 'Look-Ahead 의심' in report.summary()
+        
+    def test_sequential_matches_pool(self, kimp_data):
+        """순차 실행(max_workers=1)과 프로세스 풀 결과 일치 테스트"""
+        strategy = PeekingStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        
+        sequential = LookAheadBiasDetector(n_cuts=20, max_workers=1).detect(strategy, kimp_data)
+        pooled = LookAheadBiasDetector(n_cuts=20, max_workers=2).detect(strategy, kimp_data)
+        
+        assert sequential.mismatches == pooled.mismatches
+        
+    def test_compare_reference(self, kimp_data):
+        """일괄 시그널과 기준 경로 일치 테스트"""
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        detector = LookAheadBiasDetector()
+        
+        assert detector.compare_reference(strategy, kimp_data) is None
+
+
+class TestResultStore:
+    """백테스트 결과 저장소 테스트"""
+    
+    def _run_grid(self, store, data):
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        for entry in (0.02, 0.025, 0.03, 0.04):
+            strategy = KimpCashCarryStrategy({'entry_threshold': entry, 'exit_threshold': 0.0})
+            store.get_or_run(BacktestEngine(config), strategy, data, vectorized=True)
+        return config
+    
+    def test_round_trip(self, tmp_path, kimp_data):
+        """저장/로드 일치 테스트"""
+        from src.backtest.store import ResultStore
+        
+        store = ResultStore(str(tmp_path))
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        result = BacktestEngine(config).run(strategy, kimp_data)
+        
+        run_id = store.save(result, strategy, 'hash')
+        loaded = store.load(run_id)
+        
+        assert loaded.config == config
+        assert loaded.sharpe_ratio == pytest.approx(result.sharpe_ratio)
+        assert [(t.side, t.pnl) for t in loaded.trades] == [(t.side, t.pnl) for t in result.trades]
+        pd.testing.assert_series_equal(loaded.equity_curve, result.equity_curve, check_names=False, check_freq=False)
+        
+    def test_saved_run_found_by_get_or_run(self, tmp_path, kimp_data, monkeypatch):
+        """직접 저장한 결과를 같은 엔진 설정/실행 인자의 get_or_run이 찾는지 테스트"""
+        from src.backtest.store import ResultStore
+        from src.utils.hashing import frame_fingerprint
+        
+        store = ResultStore(str(tmp_path))
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        engine = BacktestEngine(config, risk=RiskEngine(RiskConfig(daily_loss_limit=0.02)))
+        result = engine.run(strategy, kimp_data, vectorized=True)
+        
+        run_id = store.save(result, strategy, frame_fingerprint(kimp_data), engine=engine, vectorized=True)
+        monkeypatch.setattr(BacktestEngine, 'run', lambda *args, **kwargs: pytest.fail("재계산되면 안 됨"))
+        
+        assert store.get_or_run(engine, strategy, kimp_data, vectorized=True).total_trades == result.total_trades
+        assert run_id != store.save(result, strategy, frame_fingerprint(kimp_data))
+        
+    def test_identical_run_served_from_store(self, tmp_path, kimp_data, monkeypatch):
+        """동일 설정 + 데이터 재실행 시 저장 결과 사용 테스트"""
+        from src.backtest.store import ResultStore
+        
+        store = ResultStore(str(tmp_path))
+        config = self._run_grid(store, kimp_data)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("재계산되면 안 됨")
+        
+        monkeypatch.setattr(BacktestEngine, 'run', fail)
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.03, 'exit_threshold': 0.0})
+        result = store.get_or_run(BacktestEngine(config), strategy, kimp_data, vectorized=True)
+        
+        assert result.total_trades > 0
+        
+    def test_store_hit_restores_run_state(self, tmp_path, kimp_data):
+        """저장 결과 사용 시 리스크 차단 수/검증 결과 복원 테스트"""
+        from src.backtest.store import ResultStore
+        
+        data = kimp_data.copy()
+        data.loc[data.index[150:200], 'usd_krw'] *= 1.01
+        data.loc[data.index[300], 'binance_price'] = np.nan
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        
+        def engine():
+            return BacktestEngine(config, risk=RiskEngine(RiskConfig(fx_ma_period=60)), bad_bars='ffill')
+        
+        store = ResultStore(str(tmp_path))
+        first = store.get_or_run(engine(), KimpCashCarryStrategy(params), data)
+        reused = engine()
+        reused.risk.blocked = {'stale': 1}
+        strategy = KimpCashCarryStrategy(params)
+        strategy.is_in_position = True
+        second = store.get_or_run(reused, strategy, data)
+        
+        assert first.risk_blocked['fx_surge'] >= 1
+        assert second.risk_blocked == reused.risk.blocked == first.risk_blocked
+        assert reused.quality is second.quality
+        assert second.quality.summary() == first.quality.summary()
+        np.testing.assert_array_equal(second.quality.flags, first.quality.flags)
+        assert len(reused.trades) == first.total_trades
+        assert not strategy.is_in_position
+        
+    def test_query_filters(self, tmp_path, kimp_data):
+        """지표/파라미터 범위 검색 테스트"""
+        from src.backtest.store import ResultStore
+        
+        store = ResultStore(str(tmp_path))
+        self._run_grid(store, kimp_data)
+        
+        top = store.query(
+            order_by='sharpe_ratio',
+            limit=20,
+            metrics={'max_drawdown': (None, 0.5)},
+            params={'entry_threshold': (0.02, 0.03)}
+        )
+        
+        assert len(top) == 3
+        assert top['sharpe_ratio'].is_monotonic_decreasing
+        assert all(0.02 <= p['entry_threshold'] <= 0.03 for p in top['params'])
+
+
+class TestBacktestCache:
+    """백테스트 메모이제이션 테스트"""
+    
+    def test_repeated_run_served_from_cache(self, kimp_data):
+        """동일 실행 캐시 재사용 테스트"""
+        from src.utils.cache import MemoCache
+        
+        cache = MemoCache()
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        engine = BacktestEngine(config, cache=cache)
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        
+        first = engine.run(KimpCashCarryStrategy(params), kimp_data)
+        second = engine.run(KimpCashCarryStrategy(params), kimp_data.copy())
+        engine.run(KimpCashCarryStrategy({**params, 'entry_threshold': 0.03}), kimp_data)
+        
+        assert second is first
+        assert cache.stats.memory_hits == 1
+        assert cache.stats.misses == 2
+        
+    def test_cache_hit_restores_run_state(self, kimp_data):
+        """캐시 적중 시 전략 초기화 및 리스크 차단 수 복원 테스트"""
+        from src.utils.cache import MemoCache
+        
+        data = kimp_data.copy()
+        data.loc[data.index[150:200], 'usd_krw'] *= 1.01
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        risk = RiskEngine(RiskConfig(fx_ma_period=60))
+        engine = BacktestEngine(config, cache=MemoCache(), risk=risk)
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        
+        first = engine.run(KimpCashCarryStrategy(params), data)
+        blocked = dict(risk.blocked)
+        risk.blocked = {'stale': 1}
+        strategy = KimpCashCarryStrategy(params)
+        strategy.is_in_position = True
+        second = engine.run(strategy, data)
+        
+        assert second is first
+        assert blocked['fx_surge'] >= 1
+        assert risk.blocked == blocked == first.risk_blocked
+        assert not strategy.is_in_position
+        
+    def test_cache_hit_restores_quality(self, kimp_data):
+        """캐시 적중 시 engine.quality 복원 테스트"""
+        from src.utils.cache import MemoCache
+        
+        data = kimp_data.copy()
+        data.loc[data.index[100], 'binance_price'] = np.nan
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+        engine = BacktestEngine(config, cache=MemoCache(), bad_bars='ffill')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        
+        first = engine.run(KimpCashCarryStrategy(params), data)
+        engine.run(KimpCashCarryStrategy(params), kimp_data)
+        second = engine.run(KimpCashCarryStrategy(params), data)
+        
+        assert second is first
+        assert engine.quality is first.quality
+        assert engine.quality.bad_rows == 1
+
+
+class TestRiskEngine:
+    """주문 전 리스크 검사 테스트"""
+    
+    CONFIG = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+    PARAMS = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+    
+    def run(self, data, risk=None, vectorized=False):
+        engine = BacktestEngine(self.CONFIG, risk=risk)
+        return engine.run(KimpCashCarryStrategy(self.PARAMS), data, vectorized=vectorized)
+    
+    def test_spot_notional_cap(self, kimp_data):
+        """현물 레그 명목금액 한도로 진입 수량 제한 테스트"""
+        risk = RiskEngine(RiskConfig(max_spot_notional=5_000_000))
+        result = self.run(kimp_data, risk)
+        
+        entries = [t for t in result.trades if t.side == 'BUY']
+        assert entries
+        for trade in entries:
+            assert trade.quantity * trade.price <= 5_000_000 * (1 + self.CONFIG.slippage_rate) + 1e-6
+        assert len(result.trades) == len(self.run(kimp_data).trades)
+    
+    def test_fx_surge_blocks_entry(self, kimp_data):
+        """환율 급등 구간 진입 차단 테스트"""
+        data = kimp_data.copy()
+        data.loc[data.index[150:200], 'usd_krw'] *= 1.01
+        risk = RiskEngine(RiskConfig(fx_ma_period=60))
+        
+        baseline = self.run(data)
+        result = self.run(data, risk)
+        
+        def entry_bars(res):
+            return {data.index.get_loc(t.timestamp) for t in res.trades if t.side == 'BUY'}
+        
+        assert entry_bars(baseline) & set(range(150, 200))
+        assert not entry_bars(result) & set(range(150, 200))
+        assert risk.blocked['fx_surge'] >= 1
+        
+    def test_blocked_entry_fills_later(self, kimp_data):
+        """차단된 진입 이후 차단이 풀린 bar에서 재진입 테스트 (bar별/빠른 경로)"""
+        from src.data.features import rolling_mean_std
+        
+        data = kimp_data.copy()
+        data.loc[data.index[150:200], 'usd_krw'] *= 1.01
+        fx = data['usd_krw'].to_numpy()
+        blocked = fx > rolling_mean_std(fx, 60)[0] * 1.001
+        kimp = KimpCashCarryStrategy({}).calculate_kimp_series(data)
+        
+        # 차단 bar는 건너뛰고 포지션 없는 상태로 다음 bar에서 다시 판단
+        expected, holding = [], False
+        for i, value in enumerate(kimp):
+            if not holding and value >= self.PARAMS['entry_threshold'] and not blocked[i]:
+                holding = True
+                expected.append((i, 'BUY'))
+            elif holding and value <= self.PARAMS['exit_threshold']:
+                holding = False
+                expected.append((i, 'SELL'))
+        
+        baseline_entries = [
+            data.index.get_loc(t.timestamp) for t in self.run(data).trades if t.side == 'BUY'
+        ]
+        assert any(blocked[i] for i in baseline_entries)
+        assert any(not blocked[i] and blocked[i - 1] for i, side in expected if side == 'BUY')
+        
+        counts = []
+        for vectorized in (False, True):
+            risk = RiskEngine(RiskConfig(fx_ma_period=60))
+            trades = self.run(data, risk, vectorized=vectorized).trades
+            
+            assert [(data.index.get_loc(t.timestamp), t.side) for t in trades] == expected
+            counts.append(risk.blocked)
+        assert counts[0] == counts[1] and counts[0]['fx_surge'] >= 1
+        
+    def test_fx_ma_warmup_before_start(self, kimp_data):
+        """백테스트 시작 직후(환율 MA 기간 이내) 환율 급등 차단 테스트"""
+        data = kimp_data.copy()
+        data.loc[data.index[150:200], 'usd_krw'] *= 1.01
+        config = BacktestConfig(start_date='2024-01-01 01:00', end_date='2024-12-31')
+        params = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+        
+        def entry_bars(trades):
+            return {data.index.get_loc(t.timestamp) for t in trades if t.side == 'BUY'}
+        
+        baseline = BacktestEngine(config).run(KimpCashCarryStrategy(params), data)
+        assert 187 in entry_bars(baseline.trades)
+        
+        # 기간 첫 bar는 60, MA 기간 180 → 시작 전 bar 없이는 bar 239까지 MA 없음
+        for vectorized in (False, True):
+            risk = RiskEngine(RiskConfig(fx_ma_period=180))
+            result = BacktestEngine(config, risk=risk).run(
+                KimpCashCarryStrategy(params), data, vectorized=vectorized
+            )
+            
+            assert 187 not in entry_bars(result.trades)
+            assert risk.blocked['fx_surge'] >= 1
+        
+    def test_daily_loss_limit(self, kimp_data):
+        """일일 손실 한도 초과 시 진입 차단 테스트"""
+        risk = RiskEngine(RiskConfig(daily_loss_limit=0.02, fx_surge_threshold=None))
+        baseline = self.run(kimp_data)
+        result = self.run(kimp_data, risk)
+        
+        # 첫 왕복 거래 손실이 2%를 넘어 당일 이후 진입 차단
+        assert baseline.trades[1].pnl < -0.02 * self.CONFIG.initial_capital
+        assert [t.timestamp for t in result.trades] == [t.timestamp for t in baseline.trades[:2]]
+        assert risk.blocked['daily_loss'] >= 1
+    
+    def test_vectorized_matches_bar_loop(self, kimp_data):
+        """리스크 검사 적용 시 빠른 경로와 bar별 경로 결과 일치 테스트"""
+        data = kimp_data.copy()
+        data.loc[data.index[150:200], 'usd_krw'] *= 1.01
+        config = RiskConfig(max_spot_notional=8_000_000, max_margin_usage=0.5, fx_ma_period=60)
+        
+        slow = self.run(data, RiskEngine(config))
+        fast = self.run(data, RiskEngine(config), vectorized=True)
+        
+        assert [(t.timestamp, t.side, t.quantity) for t in fast.trades] == \
+            [(t.timestamp, t.side, t.quantity) for t in slow.trades]
+        np.testing.assert_allclose(fast.equity_curve, slow.equity_curve)
+    
+    def test_run_key_includes_risk(self, kimp_data):
+        """리스크 한도가 실행 키에 반영되는지 테스트"""
+        strategy = KimpCashCarryStrategy(self.PARAMS)
+        plain = BacktestEngine(self.CONFIG).run_key(strategy, 'hash')
+        loose = BacktestEngine(self.CONFIG, risk=RiskEngine(RiskConfig())).run_key(strategy, 'hash')
+        tight = BacktestEngine(
+            self.CONFIG, risk=RiskEngine(RiskConfig(daily_loss_limit=0.02))
+        ).run_key(strategy, 'hash')
+        
+        assert len({plain, loose, tight}) == 3
+
+
+class TestReplay:
+    """리플레이 하네스 테스트"""
+    
+    CONFIG = BacktestConfig(start_date='2024-01-01', end_date='2024-12-31')
+    PARAMS = {'entry_threshold': 0.04, 'exit_threshold': 0.0}
+    
+    def test_matches_backtest(self, kimp_data):
+        """증분 경로 시그널과 백테스트 체결 일치 테스트"""
+        from src.backtest.replay import ReplayHarness
+        
+        backtest = BacktestEngine(self.CONFIG).run(KimpCashCarryStrategy(self.PARAMS), kimp_data)
+        result = ReplayHarness(KimpCashCarryStrategy(self.PARAMS), chunk_size=128).run(kimp_data)
+        
+        assert result.bars == len(kimp_data)
+        assert len(result.signals) == len(backtest.trades) > 0
+        assert result.diff(backtest).empty
+        
+    def test_dataset_source(self, tmp_path, kimp_data):
+        """KimpDataset 청크 스트리밍 및 구간 조회 테스트"""
+        from src.backtest.replay import ReplayHarness
+        from src.data.dataset import KimpDataset
+        
+        dataset = KimpDataset(str(tmp_path / 'kimp'), 'BTC', {'fx_ma_period': 60})
+        dataset.rebuild(kimp_data.iloc[:300])
+        dataset.append(kimp_data.iloc[300:])
+        start, end = kimp_data.index[50], kimp_data.index[549]
+        
+        backtest = BacktestEngine(
+            BacktestConfig(start_date=str(start), end_date=str(end))
+        ).run(KimpCashCarryStrategy(self.PARAMS), kimp_data, vectorized=True)
+        result = ReplayHarness(KimpCashCarryStrategy(self.PARAMS), chunk_size=64).run(
+            dataset, start=str(start), end=str(end)
+        )
+        
+        assert result.bars == 500
+        assert result.diff(backtest).empty
+        
+    def test_diff_reports_mismatch(self, kimp_data):
+        """시그널 불일치 보고 테스트"""
+        from src.backtest.replay import ReplayHarness
+        
+        backtest = BacktestEngine(self.CONFIG).run(KimpCashCarryStrategy(self.PARAMS), kimp_data)
+        other = ReplayHarness(
+            KimpCashCarryStrategy({**self.PARAMS, 'entry_threshold': 0.03})
+        ).run(kimp_data)
+        
+        diffs = other.diff(backtest)
+        assert not diffs.empty
+        assert set(diffs['source']) <= {'replay', 'backtest'}
+        assert diffs['timestamp'].is_monotonic_increasing
+        
+    def test_default_on_bar(self, kimp_data):
+        """기본 on_bar (generate_signal 버퍼 경로) 테스트"""
+        from src.backtest.replay import ReplayHarness
+        from src.strategies.base import BaseStrategy
+        
+        class BufferedStrategy(KimpCashCarryStrategy):
+            lookback = 3
+            on_bar = BaseStrategy.on_bar
+        
+        backtest = BacktestEngine(self.CONFIG).run(KimpCashCarryStrategy(self.PARAMS), kimp_data)
+        strategy = BufferedStrategy(self.PARAMS)
+        result = ReplayHarness(strategy).run(kimp_data.iloc[:200])
+        
+        assert len(strategy._bars) == 3
+        assert result.diff([t for t in backtest.trades if t.timestamp < kimp_data.index[200]]).empty
+        
+    def test_stats_and_events(self, tmp_path, kimp_data):
+        """처리량/지연 통계 및 시그널 이벤트 기록 테스트"""
+        from src.backtest.replay import ReplayHarness
+        
+        strategy = KimpCashCarryStrategy(self.PARAMS)
+        with EventLog(str(tmp_path / 'replay.jsonl')) as events:
+            result = ReplayHarness(strategy, chunk_size=100, event_log=events).run(kimp_data)
+        
+        summary = result.summary()
+        assert result.latency.count == len(kimp_data)
+        assert 0 < summary['latency_p50_us'] <= summary['latency_p99_us'] <= summary['latency_max_us']
+        assert summary['bars_per_sec'] > 0
+        logged = pd.read_json(tmp_path / 'replay.jsonl', lines=True)
+        assert list(logged['action']) == list(result.signals['action'])
+        assert strategy.get_position('BTC') == pytest.approx(
+            1.0 if result.signals['action'].iloc[-1] == 'BUY' else 0.0
+        )
+        
+    def test_speed_multiplier(self, kimp_data):
+        """배속 재생 테스트 (600분 × 720,000배속 ≈ 50ms)"""
+        from src.backtest.replay import ReplayHarness
+        
+        result = ReplayHarness(KimpCashCarryStrategy(self.PARAMS), speed=720_000).run(kimp_data)
+        
+        assert result.elapsed >= 0.045
+
+
+class TestSweep:
+    """분산 스윕 테스트"""
+    
+    STRATEGY = 'src.strategies.kimp.cash_carry:KimpCashCarryStrategy'
+    GRID = {'entry_threshold': [0.03, 0.04], 'exit_threshold': [0.0, 0.01]}
+    
+    @pytest.fixture
+    def dataset(self, tmp_path, kimp_data):
+        from src.data.dataset import KimpDataset
+        
+        KimpDataset(str(tmp_path / 'kimp'), 'BTC', {'fx_ma_period': 60}).rebuild(kimp_data)
+        return {'root': str(tmp_path / 'kimp'), 'symbol': 'BTC'}
+    
+    def test_multi_process_workers(self, tmp_path, dataset):
+        """여러 워커 프로세스 실행 및 결과 수집 테스트"""
+        import multiprocessing
+        from src.backtest.sweep import SweepCoordinator, TaskQueue, date_windows, run_worker
+        
+        path = str(tmp_path / 'queue.db')
+        coordinator = SweepCoordinator(TaskQueue(path))
+        windows = date_windows('2024-01-01', '2024-01-01 09:59', '5h')
+        ids = coordinator.submit(self.STRATEGY, self.GRID, windows, dataset)
+        
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=run_worker, args=(path,)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=120)
+        
+        results = coordinator.results().set_index('task_id')
+        assert coordinator.progress() == {'done': 8}
+        assert sorted(results.index) == sorted(ids)
+        
+        # 단일 프로세스 실행 결과와 일치
+        row = results.loc[ids[0]]
+        config = BacktestConfig(start_date=row['start_date'], end_date=row['end_date'])
+        from src.data.dataset import KimpDataset
+        expected = BacktestEngine(config).run(
+            KimpCashCarryStrategy(row['params']),
+            KimpDataset(dataset['root'], 'BTC').load(),
+            vectorized=True
+        )
+        assert row['total_trades'] == expected.total_trades
+        assert row['total_return'] == pytest.approx(expected.total_return)
+        
+    def test_resubmit_is_idempotent(self, tmp_path, dataset):
+        """같은 태스크 재등록 무시 테스트"""
+        from src.backtest.sweep import SweepCoordinator, TaskQueue
+        
+        coordinator = SweepCoordinator(TaskQueue(str(tmp_path / 'queue.db')))
+        windows = [('2024-01-01', '2024-01-01 09:59')]
+        
+        first = coordinator.submit(self.STRATEGY, self.GRID, windows, dataset)
+        second = coordinator.submit(self.STRATEGY, self.GRID, windows, dataset)
+        
+        assert first == second
+        assert coordinator.progress() == {'pending': 4}
+        
+    def test_refreshed_dataset_is_new_task(self, tmp_path, kimp_data):
+        """데이터셋 갱신 후 재등록 시 새 태스크 + 태스크별 버전 데이터 사용 테스트"""
+        from src.backtest.sweep import SweepCoordinator, SweepWorker, TaskQueue
+        from src.data.dataset import KimpDataset
+        
+        kimp = KimpDataset(str(tmp_path / 'kimp'), 'BTC', {'fx_ma_period': 60})
+        kimp.rebuild(kimp_data.iloc[:400])
+        location = {'root': str(tmp_path / 'kimp'), 'symbol': 'BTC'}
+        coordinator = SweepCoordinator(TaskQueue(str(tmp_path / 'queue.db')))
+        grid, windows = {'entry_threshold': [0.04]}, [('2024-01-01', '2024-01-01 09:59')]
+        
+        [old] = coordinator.submit(self.STRATEGY, grid, windows, location)
+        old_data = kimp.load()
+        kimp.append(kimp_data.iloc[400:])
+        [new] = coordinator.submit(self.STRATEGY, grid, windows, location)
+        
+        assert old != new
+        assert SweepWorker(coordinator.queue, 'w1').run() == 2
+        
+        results = coordinator.results().set_index('task_id')['total_return']
+        config = BacktestConfig(start_date='2024-01-01', end_date='2024-01-01 09:59')
+        for task_id, data in ((old, old_data), (new, kimp.load())):
+            expected = BacktestEngine(config).run(KimpCashCarryStrategy({'entry_threshold': 0.04}), data, vectorized=True)
+            assert results[task_id] == pytest.approx(expected.total_return)
+        assert results[old] != results[new]
+        
+    def test_failed_task_retried(self, tmp_path, dataset):
+        """실패 태스크 재시도 후 실패 처리 테스트"""
+        from src.backtest.sweep import SweepCoordinator, SweepWorker, TaskQueue
+        
+        queue = TaskQueue(str(tmp_path / 'queue.db'), max_attempts=2)
+        SweepCoordinator(queue).submit(
+            self.STRATEGY, {'entry_threshold': [0.01], 'exit_threshold': [0.03]},
+            [('2024-01-01', '2024-01-01 09:59')], dataset
+        )
+        
+        processed = SweepWorker(queue, 'w1').run()
+        errors = queue.errors()
+        
+        assert processed == 2
+        assert queue.counts() == {'failed': 1}
+        assert errors['attempts'].tolist() == [2]
+        assert 'ValueError' in errors['error'].iloc[0]
+        
+    def test_expired_lease_reclaimed(self, tmp_path, dataset):
+        """임대 만료 태스크 재실행 및 결과 1행 유지 테스트"""
+        import time
+        from src.backtest.sweep import SweepCoordinator, SweepWorker, TaskQueue
+        
+        queue = TaskQueue(str(tmp_path / 'queue.db'), lease_seconds=0.05)
+        SweepCoordinator(queue).submit(
+            self.STRATEGY, {'entry_threshold': [0.04]},
+            [('2024-01-01', '2024-01-01 09:59')], dataset
+        )
+        stalled = queue.claim('stalled-worker')
+        time.sleep(0.1)
+        
+        worker = SweepWorker(queue, 'w2')
+        assert worker.run() == 1
+        
+        # 멈췄던 워커가 뒤늦게 끝나도 임대를 잃었으므로 기록하지 않음
+        assert not queue.complete(stalled, 'stalled-worker', worker.execute(stalled))
+        results = queue.results()
+        
+        assert results['worker'].tolist() == ['w2']
+        assert queue.counts() == {'done': 1}
+        
+    def test_stale_worker_cannot_reset_new_lease(self, tmp_path, dataset):
+        """임대 만료 후 재임대된 태스크를 이전 워커가 실패/완료 처리하지 못하는지 테스트"""
+        import time
+        from src.backtest.sweep import SweepCoordinator, TaskQueue
+        
+        queue = TaskQueue(str(tmp_path / 'queue.db'), lease_seconds=0.05)
+        SweepCoordinator(queue).submit(
+            self.STRATEGY, {'entry_threshold': [0.04]},
+            [('2024-01-01', '2024-01-01 09:59')], dataset
+        )
+        stalled = queue.claim('stalled-worker')
+        time.sleep(0.1)
+        queue.lease_seconds = 600.0
+        current = queue.claim('w2')
+        
+        assert queue.fail(stalled, 'stalled-worker', 'TimeoutError') is None
+        assert not queue.renew(stalled, 'stalled-worker')
+        assert not queue.complete(stalled, 'stalled-worker', {})
+        assert queue.counts() == {'running': 1}
+        assert queue.claim('w3') is None
+        
+        # 같은 워커라도 이전 임대(시도 번호)로는 변경 불가
+        assert queue.fail(stalled, 'w2', 'TimeoutError') is None
+        assert queue.complete(current, 'w2', {'total_trades': 1})
+        assert queue.counts() == {'done': 1}
+        assert queue.results()['worker'].tolist() == ['w2']
+        
+    def test_long_task_keeps_lease(self, tmp_path, dataset):
+        """임대 시간보다 오래 걸리는 태스크의 임대 갱신 테스트"""
+        import time
+        from src.backtest.sweep import SweepCoordinator, SweepWorker, TaskQueue
+        
+        queue = TaskQueue(str(tmp_path / 'queue.db'), lease_seconds=0.15)
+        SweepCoordinator(queue).submit(
+            self.STRATEGY, {'entry_threshold': [0.04]},
+            [('2024-01-01', '2024-01-01 09:59')], dataset
+        )
+        
+        class SlowWorker(SweepWorker):
+            def execute(self, task):
+                time.sleep(0.6)
+                assert queue.claim('other') is None   # 갱신된 임대는 만료되지 않음
+                return super().execute(task)
+        
+        assert SlowWorker(queue, 'w1').run() == 1
+        assert queue.counts() == {'done': 1}
+        assert queue.results()['worker'].tolist() == ['w1']
@@ -0,0 +1,481 @@
+"""데이터 모듈 테스트"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.mock_exchange import MockExchange
+from src.data.dataset import KimpDataset
+from src.data.errors import DataFormatError, ExchangeAPIError, RateLimitError, TransportError
+from src.data.features import add_features, kimp_rate, rolling_mean_std
+from src.data.fetcher import DataFetcher
+from src.data.pyramid import BarPyramid, resample_bars
+from src.data.schema import concat_compact, from_compact, to_compact
+from src.data.transport import HttpTransport, TransportConfig
+from src.data.validation import (
+    BAD_PRICE, CLOCK_SKEW, DUPLICATE, GAP, KIMP_OUTLIER, UNSORTED, ValidationConfig, clean, validate,
+)
+from src.strategies.kimp.cash_carry import KimpCashCarryStrategy
+from src.utils.cache import default_cache
+
+from .conftest import make_kimp_data
+
+
+class TestFeatures:
+    """파생 피처 테스트"""
+    
+    def test_kimp_rate_matches_scalar(self, kimp_data):
+        """벡터 김프율과 스칼라 계산 일치 테스트"""
+        strategy = KimpCashCarryStrategy({})
+        kimp = kimp_rate(kimp_data['upbit_price'], kimp_data['binance_price'], kimp_data['usd_krw'])
+        row = kimp_data.iloc[123]
+        
+        assert kimp[123] == strategy.calculate_kimp(
+            row['upbit_price'], row['binance_price'], row['usd_krw']
+        )
+        
+    def test_rolling_matches_pandas(self):
+        """롤링 통계와 pandas 결과 일치 테스트"""
+        values = np.random.default_rng(1).normal(size=500)
+        mean, std = rolling_mean_std(values, 20)
+        rolling = pd.Series(values).rolling(20)
+        
+        np.testing.assert_allclose(mean, rolling.mean(), atol=1e-12)
+        np.testing.assert_allclose(std, rolling.std(ddof=0), atol=1e-12)
+        
+    def test_rolling_long_series_precision(self):
+        """긴 추세 시계열(블록 경계 포함) 롤링 통계 정밀도 테스트"""
+        values = 1300 + np.cumsum(np.random.default_rng(2).normal(0, 0.05, 20_000))
+        values[[7, 9000]] = np.nan
+        windows = np.lib.stride_tricks.sliding_window_view(values, 720)
+        mean, std = rolling_mean_std(values, 720)
+        
+        np.testing.assert_allclose(mean[719:], windows.mean(axis=1), rtol=1e-12)
+        np.testing.assert_allclose(std[719:], windows.std(axis=1), rtol=1e-9)
+        
+    def test_rolling_constant_window(self):
+        """값이 같은 윈도우의 표준편차 0 테스트"""
+        values = np.r_[np.full(30, 0.0123), np.arange(10.0)]
+        mean, std = rolling_mean_std(values, 5)
+        
+        assert (std[4:30] == 0).all() and (mean[4:30] == 0.0123).all()
+        assert (std[31:] > 0).all()
+        
+    def test_add_features_memoized(self, kimp_data):
+        """피처 계산 메모이제이션 테스트"""
+        first = add_features(kimp_data, fx_ma_period=60)
+        hits = default_cache().stats.memory_hits
+        second = add_features(kimp_data.copy(), fx_ma_period=60)
+        
+        second['kimp_rate'] = 0.0
+        third = add_features(kimp_data, fx_ma_period=60)
+        
+        assert default_cache().stats.memory_hits == hits + 2
+        assert second is not first
+        pd.testing.assert_frame_equal(third, first)
+        assert first['fx_ma'].iloc[59] == pytest.approx(kimp_data['usd_krw'].iloc[:60].mean())
+
+
+@pytest.fixture
+def exchange():
+    with MockExchange() as server:
+        yield server
+
+
+def make_fetcher(url: str, **config) -> DataFetcher:
+    transport = HttpTransport(TransportConfig(backoff_base=0.001, **config))
+    return DataFetcher(transport, upbit_url=url, binance_url=url, binance_futures_url=url)
+
+
+class TestDataFetcher:
+    """데이터 수집기 테스트 (모의 거래소)"""
+    
+    def test_upbit_ohlcv(self, exchange):
+        """업비트 OHLCV 파싱 테스트"""
+        df = make_fetcher(exchange.url).get_upbit_ohlcv('BTC', count=5)
+        
+        assert len(df) == 5
+        assert df['timestamp'].is_monotonic_increasing
+        assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'exchange', 'symbol']
+        
+    def test_retry_then_success(self, exchange):
+        """일시적 에러 재시도 테스트"""
+        fetcher = make_fetcher(exchange.url)
+        exchange.fail_next(2, status=503)
+        
+        df = fetcher.get_binance_ohlcv('BTC', limit=10)
+        
+        assert len(df) == 10
+        assert fetcher.transport.stats.retries == 2
+        assert fetcher.transport.stats.errors == 0
+        
+    def test_typed_errors(self, exchange):
+        """실패 시 빈 DataFrame 대신 에러 발생 테스트"""
+        fetcher = make_fetcher(exchange.url, max_retries=1)
+        
+        exchange.fail_next(1, status=400)
+        with pytest.raises(ExchangeAPIError) as exc_info:
+            fetcher.get_binance_ohlcv('BTC')
+        assert exc_info.value.status_code == 400
+        
+        exchange.fail_next(2, status=429, retry_after=0)
+        with pytest.raises(RateLimitError):
+            fetcher.get_binance_ohlcv('BTC')
+        
+        assert fetcher.transport.stats.error_rate == 1.0
+        
+    def test_malformed_json(self, exchange):
+        """깨진 JSON 응답 재시도 후 DataFormatError 테스트"""
+        fetcher = make_fetcher(exchange.url, max_retries=1)
+        
+        exchange.malformed_next(1)
+        assert len(fetcher.get_upbit_ohlcv('BTC', count=10)) == 10
+        
+        exchange.malformed_next(2)
+        with pytest.raises(DataFormatError, match='JSON'):
+            fetcher.get_upbit_ohlcv('BTC', count=10)
+        assert fetcher.transport.stats.retries == 2
+        
+    def test_transport_error(self):
+        """연결 실패 에러 테스트"""
+        fetcher = make_fetcher('http://127.0.0.1:9', max_retries=1)
+        
+        with pytest.raises(TransportError):
+            fetcher.get_upbit_ohlcv('BTC')
+        
+    def test_concurrent_requests_coalesced(self):
+        """동시 동일 요청 병합 테스트"""
+        with MockExchange(latency=0.2) as server:
+            fetcher = make_fetcher(server.url)
+            results = []
+            
+            def fetch():
+                results.append(fetcher.get_binance_ohlcv('BTC', limit=100))
+            
+            threads = [threading.Thread(target=fetch) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        
+        assert len(results) == 8
+        assert server.hits['/api/v3/klines'] == 1
+        assert fetcher.transport.stats.coalesced == 7
+
+
+class TestKimpDataset:
+    """김프 데이터셋 증분 갱신 테스트"""
+    
+    PARAMS = {'fx_ma_period': 120}
+    
+    def test_incremental_matches_full_rebuild(self, tmp_path, kimp_data):
+        """증분 갱신 결과와 전체 재구축 일치 테스트"""
+        full = KimpDataset(str(tmp_path / 'full'), feature_params=self.PARAMS)
+        full.rebuild(kimp_data)
+        
+        incremental = KimpDataset(str(tmp_path / 'inc'), feature_params=self.PARAMS)
+        for end in (50, 51, 200, 333, len(kimp_data)):
+            available = kimp_data.iloc[:end]
+            incremental.refresh(lambda since: available[available['timestamp'] > since] if since else available)
+        
+        assert len(incremental.partitions()) == 5
+        pd.testing.assert_frame_equal(incremental.load(), full.load(), check_exact=True)
+        
+    def test_incremental_exact_across_blocks(self, tmp_path):
+        """누적합 블록 경계를 넘는 증분 갱신의 비트 단위 일치 테스트"""
+        data = make_kimp_data(10_000)
+        full = KimpDataset(str(tmp_path / 'full'), feature_params=self.PARAMS)
+        full.rebuild(data)
+        
+        incremental = KimpDataset(str(tmp_path / 'inc'), feature_params=self.PARAMS)
+        for start, end in ((0, 3000), (3000, 4100), (4100, 4300), (4300, 8200), (8200, 10_000)):
+            incremental.append(data.iloc[start:end])
+        
+        assert incremental.tail_start(8199) == 4096
+        pd.testing.assert_frame_equal(incremental.load(), full.load(), check_exact=True)
+        
+    def test_refresh_fetches_only_new_bars(self, tmp_path, kimp_data):
+        """마지막 캐시 시점 전달 및 중복 무시 테스트"""
+        dataset = KimpDataset(str(tmp_path), feature_params=self.PARAMS)
+        dataset.rebuild(kimp_data.iloc[:100])
+        requested = []
+        
+        def loader(since):
+            requested.append(since)
+            return kimp_data.iloc[90:120]  # 겹치는 구간 포함
+        
+        added = dataset.refresh(loader)
+        
+        # 마지막 bar(99)는 보류 중이므로 98 이후부터 다시 가져옴
+        assert requested == [kimp_data['timestamp'].iloc[98]]
+        assert added == 20
+        assert dataset.load()['timestamp'].is_unique
+        
+    def test_load_range(self, tmp_path, kimp_data):
+        """기간 필터 로드 테스트"""
+        dataset = KimpDataset(str(tmp_path), feature_params=self.PARAMS)
+        dataset.rebuild(kimp_data)
+        
+        data = dataset.load(start='2024-01-01 01:00', end='2024-01-01 02:00')
+        
+        assert len(data) == 61
+        assert isinstance(data.index, pd.DatetimeIndex)
+        
+    def test_feature_params_mismatch(self, tmp_path, kimp_data):
+        """피처 파라미터 변경 시 재구축 요구 테스트"""
+        KimpDataset(str(tmp_path), feature_params=self.PARAMS).rebuild(kimp_data.iloc[:100])
+        
+        with pytest.raises(ValueError):
+            KimpDataset(str(tmp_path), feature_params={'fx_ma_period': 60}).append(kimp_data)
+
+
+class TestBarPyramid:
+    """멀티 해상도 봉 피라미드 테스트"""
+    
+    @pytest.fixture
+    def ohlcv(self):
+        rng = np.random.default_rng(2)
+        index = pd.date_range('2024-01-01', periods=3 * 24 * 60, freq='min')
+        close = 100 + np.cumsum(rng.normal(0, 0.1, len(index)))
+        return pd.DataFrame({
+            'open': close + rng.normal(0, 0.05, len(index)),
+            'high': close + 0.2,
+            'low': close - 0.2,
+            'close': close,
+            'volume': rng.integers(1, 10, len(index)).astype(float),
+        }, index=index)
+    
+    def test_levels_match_direct_resample(self, tmp_path, ohlcv):
+        """단계별 집계와 1분봉 직접 집계 일치 테스트"""
+        pyramid = BarPyramid(str(tmp_path))
+        counts = pyramid.build(ohlcv)
+        
+        assert counts == {'1m': 4320, '5m': 864, '15m': 288, '1h': 72, '4h': 18, '1d': 3}
+        for level, rule in (('1h', '1h'), ('4h', '4h'), ('1d', '1D')):
+            direct = resample_bars(ohlcv, rule)
+            stored = pyramid.get(level).drop(columns='timestamp')
+            pd.testing.assert_frame_equal(stored, direct, check_freq=False)
+            
+    def test_get_alias_and_range(self, tmp_path, ohlcv):
+        """거래소 interval 표기 및 기간 조회 테스트"""
+        pyramid = BarPyramid(str(tmp_path))
+        pyramid.build(ohlcv.iloc[:-30])  # 마지막 시간봉은 30분만 존재
+        
+        hourly = pyramid.get('minute60', start='2024-01-02', end='2024-01-02 05:00')
+        
+        assert len(hourly) == 6
+        assert hourly['timestamp'].iloc[0] == pd.Timestamp('2024-01-02')
+        assert pyramid.get('1h')['close'].iloc[-1] == ohlcv['close'].iloc[-31]
+        
+    def test_kimp_ohlc(self, tmp_path, kimp_data):
+        """김프율 OHLC 집계 테스트"""
+        pyramid = BarPyramid(str(tmp_path))
+        pyramid.build(kimp_data)
+        
+        hourly = pyramid.get('1h')
+        kimp = pd.Series(
+            kimp_rate(kimp_data['upbit_price'], kimp_data['binance_price'], kimp_data['usd_krw']),
+            index=kimp_data.index
+        )
+        
+        assert len(hourly) == 10
+        assert hourly['kimp_high'].iloc[0] == kimp.iloc[:60].max()
+        assert hourly['kimp_close'].iloc[-1] == kimp.iloc[-1]
+        assert hourly['upbit_price'].iloc[0] == kimp_data['upbit_price'].iloc[59]
+        
+    def test_unknown_resolution(self, tmp_path):
+        """지원하지 않는 해상도 테스트"""
+        with pytest.raises(ValueError):
+            BarPyramid(str(tmp_path)).get('3m')
+
+
+class TestCompactSchema:
+    """컴팩트 스키마 테스트"""
+    
+    def test_dtypes_and_memory(self, kimp_data):
+        """컴팩트 변환 dtype 및 메모리 절감 테스트"""
+        data = kimp_data.assign(symbol='BTC', exchange='upbit')
+        compact = to_compact(data)
+        
+        assert compact.index.dtype == np.int64
+        assert compact['timestamp'].dtype == np.int64
+        assert compact['upbit_price'].dtype == np.float32
+        assert isinstance(compact['symbol'].dtype, pd.CategoricalDtype)
+        assert compact.memory_usage(deep=True).sum() < data.memory_usage(deep=True).sum() / 2
+        
+        restored = from_compact(compact)
+        pd.testing.assert_index_equal(restored.index, data.index.as_unit('ns'))
+        assert list(restored['symbol'].unique()) == ['BTC']
+        
+    def test_kimp_precision(self, kimp_data):
+        """float32 가격의 김프율 오차 테스트
+        
+        가격 3개가 각각 상대 2^-24 이내로 반올림되므로 김프율 오차는
+        약 3 * 6e-8 * (1 + 김프율) 이하입니다.
+        """
+        compact = to_compact(kimp_data)
+        exact = kimp_rate(kimp_data['upbit_price'], kimp_data['binance_price'], kimp_data['usd_krw'])
+        approx = kimp_rate(compact['upbit_price'], compact['binance_price'], compact['usd_krw'])
+        
+        assert np.abs(approx - exact).max() < 2.5e-7
+        
+        strategy = KimpCashCarryStrategy({})
+        np.testing.assert_array_equal(
+            strategy.generate_signals(compact).to_numpy(),
+            strategy.generate_signals(kimp_data).to_numpy()
+        )
+        
+    def test_concat_multi_symbol(self, kimp_data):
+        """멀티 심볼 결합 시 categorical 유지 테스트"""
+        frames = [to_compact(kimp_data.assign(symbol=s)) for s in ('BTC', 'ETH')]
+        
+        combined = concat_compact(frames)
+        
+        assert isinstance(combined['symbol'].dtype, pd.CategoricalDtype)
+        assert combined['symbol'].value_counts().to_dict() == {'BTC': 600, 'ETH': 600}
+        
+    def test_fetcher_compact(self, exchange):
+        """수집기 컴팩트 출력 테스트"""
+        fetcher = make_fetcher(exchange.url)
+        fetcher.compact = True
+        
+        df = fetcher.get_binance_ohlcv('BTC', limit=10)
+        
+        assert df['timestamp'].dtype == np.int64
+        assert df['close'].dtype == np.float32
+        assert isinstance(df['exchange'].dtype, pd.CategoricalDtype)
+
+
+def corrupt(data: pd.DataFrame) -> pd.DataFrame:
+    """잘못된 bar 주입 (50% 김프, 0 가격, NaN 환율, 중복 시각, 5분 누락)"""
+    data = data.copy()
+    data.iloc[100, data.columns.get_loc('upbit_price')] *= 1.5
+    data.iloc[200, data.columns.get_loc('binance_price')] = 0.0
+    data.iloc[300, data.columns.get_loc('usd_krw')] = np.nan
+    data = pd.concat([data.iloc[:401], data.iloc[[400]], data.iloc[401:]])
+    return data.drop(data.index[451:456])
+
+
+class TestValidation:
+    """데이터 품질 검증 테스트"""
+    
+    def test_clean_data(self, kimp_data):
+        """정상 데이터 검증 테스트"""
+        report = validate(kimp_data)
+        
+        assert report.ok
+        assert report.mask.all()
+        assert report.summary()['rows'] == len(kimp_data)
+        
+    def test_flags_and_report(self, kimp_data):
+        """행별 플래그 및 요약 테스트"""
+        data = corrupt(kimp_data)
+        report = validate(data)
+        
+        assert report.flags[100] & KIMP_OUTLIER
+        assert report.flags[200] & BAD_PRICE
+        assert report.flags[300] & BAD_PRICE
+        assert report.flags[401] & DUPLICATE
+        assert report.flags[451] & GAP
+        assert list(np.flatnonzero(~report.mask)) == [100, 200, 300, 401]
+        assert report.gaps == 1 and report.missing_bars == 5
+        assert report.lead_lag == 0
+        
+    def test_unsorted_and_clock_skew(self, kimp_data):
+        """역순 시각 및 거래소 원본 시각 차이 테스트"""
+        data = kimp_data.iloc[:50].copy()
+        data['upbit_timestamp'] = data['timestamp']
+        data['binance_timestamp'] = data['timestamp']
+        data.iloc[10, data.columns.get_loc('binance_timestamp')] += pd.Timedelta('30s')
+        data = pd.concat([data.iloc[:20], data.iloc[[25]], data.iloc[20:25], data.iloc[26:]])
+        
+        report = validate(data, ValidationConfig(max_skew='5s'))
+        
+        assert report.flags[10] & CLOCK_SKEW
+        assert report.flags[21] & UNSORTED
+        assert report.counts['clock_skew'] == 1
+        
+    def test_lead_lag(self, kimp_data):
+        """업비트 지연 시차 추정 테스트"""
+        lagged = kimp_data.assign(upbit_price=kimp_data['upbit_price'].shift(2)).iloc[2:]
+        
+        report = validate(lagged)
+        
+        assert report.lead_lag == 2
+        assert not report.ok
+        
+    def test_clean_methods(self, kimp_data):
+        """잘못된 bar 제거/채우기 테스트"""
+        data = corrupt(kimp_data)
+        report = validate(data)
+        
+        skipped = clean(data, report, 'skip')
+        filled = clean(data, report, 'ffill')
+        
+        assert len(skipped) == len(data) - 4
+        assert len(filled) == len(data) - 1
+        assert filled['timestamp'].is_unique
+        assert filled['upbit_price'].iloc[100] == filled['upbit_price'].iloc[99]
+        assert validate(filled).ok and validate(skipped).ok
+        with pytest.raises(ValueError):
+            clean(data, report, 'interpolate')
+            
+    def test_compact_input(self, kimp_data):
+        """컴팩트 스키마 입력 테스트"""
+        report = validate(to_compact(corrupt(kimp_data)))
+        
+        assert list(np.flatnonzero(~report.mask)) == [100, 200, 300, 401]
+        
+    def test_dataset_validates_on_append(self, tmp_path, kimp_data):
+        """데이터셋 저장 시 자동 검증 및 채우기 테스트"""
+        dataset = KimpDataset(str(tmp_path), feature_params={'fx_ma_period': 60})
+        data = corrupt(kimp_data)
+        dataset.rebuild(data.iloc[:250])
+        dataset.append(data.iloc[250:])
+        
+        quality = dataset.quality()
+        data = dataset.load()
+        
+        assert [q['bad_rows'] for q in quality] == [2, 1]
+        assert quality[1]['missing_bars'] == 5
+        assert len(data) == len(kimp_data) - 6    # 중복 1 + 누락 5 (마지막 bar는 보류)
+        assert data['fx_ma'].iloc[300:].notna().all()
+        assert validate(data).mask.all()
+        
+    def test_edge_spike(self, kimp_data):
+        """데이터 끝 bar 스파이크 검사 테스트 (한쪽 이웃/context 기준)"""
+        data = kimp_data.copy()
+        data.loc[data.index[-1], 'upbit_price'] *= 1.17
+        
+        assert validate(data).bad_rows == 1
+        assert validate(data.iloc[:-1], following=data.iloc[-1:]).ok
+        
+        report = validate(data.iloc[-1:], context=data.iloc[:-1])
+        assert report.counts['kimp_outlier'] == 1
+        
+    def test_dataset_checks_last_bar(self, tmp_path, kimp_data):
+        """추가 마지막 bar를 다음 bar와 함께 검증하는지 테스트"""
+        dataset = KimpDataset(str(tmp_path), feature_params={'fx_ma_period': 60})
+        data = kimp_data.copy()
+        data.loc[data.index[99], 'upbit_price'] *= 1.17
+        
+        assert dataset.rebuild(data.iloc[:100]) == 99
+        assert dataset.append(data.iloc[100:200]) == 100
+        
+        stored = dataset.load()
+        assert dataset.quality()[1]['kimp_outlier'] == 1
+        assert stored['upbit_price'].iloc[99] == stored['upbit_price'].iloc[98]
+        
+    def test_lead_lag_with_context(self, tmp_path, kimp_data):
+        """작은 증분 추가에서도 tail context로 시차 추정 테스트"""
+        lagged = kimp_data.assign(upbit_price=kimp_data['upbit_price'].shift(2)).iloc[2:]
+        dataset = KimpDataset(str(tmp_path), feature_params={'fx_ma_period': 120})
+        dataset.rebuild(lagged.iloc[:300])
+        
+        for start in range(300, 420, 40):
+            dataset.append(lagged.iloc[start:start + 40])
+        
+        assert [q['lead_lag'] for q in dataset.quality()[1:]] == [2, 2, 2]
+
@@ -0,0 +1,42 @@
+"""Import 콜드 스타트 테스트"""
+
+from benchmarks.bench_import import (
+    IMPORT_BUDGET_SEC, OWN_IMPORT_BUDGET_SEC, heavy_modules_loaded, measure,
+)
+
+
+class TestColdStart:
+    """엔진 워커 콜드 스타트 테스트"""
+    
+    def test_engine_worker_skips_heavy_modules(self):
+        """엔진 전용 import 시 무거운 의존성 미로드 테스트"""
+        result = measure()
+        
+        assert heavy_modules_loaded(result['modules']) == []
+        
+    def test_engine_worker_import_time(self):
+        """엔진 워커 import 시간 상한 테스트 (3회 중 최솟값)"""
+        results = [measure() for _ in range(3)]
+        
+        assert min(r['elapsed'] for r in results) < IMPORT_BUDGET_SEC
+        assert min(r['own'] for r in results) < OWN_IMPORT_BUDGET_SEC
+        
+    def test_lazy_exports_resolve(self):
+        """지연 export 접근 테스트"""
+        import src.backtest
+        import src.data
+        import src.utils
+        
+        assert src.backtest.ResultStore.__name__ == 'ResultStore'
+        assert src.data.DataFetcher.__name__ == 'DataFetcher'
+        assert callable(src.utils.setup_logger)
+        assert 'DataFetcher' in dir(src.data)
+        
+    def test_all_matches_exports(self):
+        """__all__ (lint용 리터럴)과 지연 export 목록 일치 테스트"""
+        import src.backtest
+        import src.data
+        import src.utils
+        
+        for package in (src.backtest, src.data, src.utils):
+            assert sorted(package.__all__) == sorted(package._EXPORTS)
@@ -4,9 +4,27 @@ import pytest
 import pandas as pd
 from datetime import datetime
 
+import numpy as np
+
+from src.strategies.base import BaseStrategy
+from src.strategies.kernels import hysteresis_state, level_state, position_fraction, transitions
 from src.strategies.kimp.cash_carry import KimpCashCarryStrategy
 
 
+def loop_state(values, entry, exit, direction='above'):
+    """bar별 루프 기준 구현"""
+    sign = 1 if direction == 'above' else -1
+    state = np.zeros(len(values), dtype=bool)
+    held = False
+    for i, value in enumerate(values):
+        if not held and sign * value >= sign * entry:
+            held = True
+        elif held and sign * value <= sign * exit:
+            held = False
+        state[i] = held
+    return state
+
+
 class TestKimpCashCarryStrategy:
     """김프 차익거래 전략 테스트"""
     
@@ -126,6 +144,77 @@ class TestKimpCashCarryStrategy:
         assert signal.action == 'SELL'
         assert signal.metadata['type'] == 'EXIT'
         assert strategy.is_in_position == False
+        
+    def test_order_rejected_resets_position(self):
+        """진입 거부 콜백 후 다음 bar 재진입 테스트"""
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.03, 'exit_threshold': 0.01})
+        data = pd.DataFrame([{
+            'timestamp': datetime.now(),
+            'upbit_price': 136_500_000,
+            'binance_price': 100_000,
+            'usd_krw': 1_300
+        }])
+        
+        assert strategy.generate_signal(data).action == 'BUY'
+        strategy.on_order_rejected({'symbol': 'BTC', 'quantity': 1.0, 'side': 'BUY'})
+        
+        assert strategy.is_in_position == False
+        assert strategy.generate_signal(data).action == 'BUY'
+
+
+class TestThresholdKernels:
+    """임계값 상태 커널 테스트"""
+    
+    def test_matches_loop(self):
+        """커널과 bar별 루프 결과 일치 테스트 (NaN 포함)"""
+        values = np.random.default_rng(3).normal(size=5000).cumsum() / 10
+        values[::97] = np.nan
+        
+        for direction, entry, exit in (('above', 1.0, -0.5), ('below', -2.0, 0.0)):
+            np.testing.assert_array_equal(
+                hysteresis_state(values, entry, exit, direction),
+                loop_state(values, entry, exit, direction)
+            )
+            
+    def test_level_entries(self):
+        """분할 진입 (Level 1 40% / Level 2 60%) 테스트"""
+        zscore = np.array([0.0, -2.1, -2.3, -2.6, -1.0, -2.4, 0.1, -2.7, 0.5])
+        
+        levels = level_state(zscore, [-2.0, -2.5], exit=0.0, direction='below')
+        
+        np.testing.assert_array_equal(levels, [0, 1, 1, 2, 2, 2, 0, 2, 0])
+        np.testing.assert_array_equal(transitions(levels), [0, 1, 0, 1, 0, 0, -2, 2, -2])
+        np.testing.assert_allclose(
+            position_fraction(levels, [0.4, 0.6]), [0, 0.4, 0.4, 1, 1, 1, 0, 1, 0]
+        )
+        
+    def test_overlapping_thresholds(self):
+        """진입/청산 조건이 겹치는 임계값 거부 테스트"""
+        with pytest.raises(ValueError):
+            hysteresis_state(np.zeros(3), 0.01, 0.03)
+        with pytest.raises(ValueError):
+            hysteresis_state(np.zeros(3), 0.0, -1.0, direction='below')
+            
+    def test_strategy_signals_match_bar_loop(self, kimp_data):
+        """전략 일괄 시그널과 generate_signal 반복 결과 일치 테스트"""
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        fast = strategy.generate_signals(kimp_data)
+        final_state = strategy.is_in_position
+        
+        reference = BaseStrategy.generate_signals(strategy, kimp_data)
+        
+        pd.testing.assert_series_equal(fast, reference)
+        assert final_state == strategy.is_in_position
+        
+    def test_resume_signals_match_bar_loop(self, kimp_data):
+        """진입 거부 후 재생성 시그널과 기준 경로 일치 테스트"""
+        strategy = KimpCashCarryStrategy({'entry_threshold': 0.04, 'exit_threshold': 0.0})
+        
+        for start, stop in ((0, 64), (151, 215), (300, len(kimp_data))):
+            fast = strategy.resume_signals(kimp_data, start, stop)
+            reference = BaseStrategy.resume_signals(strategy, kimp_data, start, stop)
+            
+            np.testing.assert_array_equal(fast, reference)
 
 
 class TestPerformanceMetrics:
@@ -0,0 +1,180 @@
+"""유틸리티 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import logger as log_config
+from src.utils.cache import MemoCache, memoize
+from src.utils.events import EventLog
+from src.utils.hashing import frame_fingerprint, stable_hash
+
+
+class TestHashing:
+    """콘텐츠 해시 테스트"""
+    
+    def test_stable_hash_key_order(self):
+        """dict 키 순서 무관 테스트"""
+        assert stable_hash({'a': 1, 'b': 2.0}) == stable_hash({'b': np.float64(2.0), 'a': 1})
+        
+    def test_frame_fingerprint(self, kimp_data):
+        """데이터 지문 테스트"""
+        changed = kimp_data.copy()
+        changed.iloc[-1, 1] += 1
+        
+        assert frame_fingerprint(kimp_data) == frame_fingerprint(kimp_data.copy())
+        assert frame_fingerprint(kimp_data) != frame_fingerprint(changed)
+
+
+class TestMemoCache:
+    """메모이제이션 캐시 테스트"""
+    
+    def test_memory_lru(self):
+        """메모리 계층 LRU 테스트"""
+        cache = MemoCache(max_items=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert 'a' in cache
+        assert 'b' not in cache
+        
+    def test_memory_byte_limit(self):
+        """메모리 계층 바이트 제한 테스트"""
+        cache = MemoCache(max_memory_bytes=2_000)
+        for key in 'abc':
+            cache.set(key, np.zeros(100))
+        cache.set('big', np.zeros(1_000))
+        
+        assert 'a' not in cache and 'big' not in cache
+        assert 'b' in cache and 'c' in cache
+        assert cache.memory_bytes == 1_600
+        
+    def test_disk_tier(self, tmp_path):
+        """디스크 계층 재사용 테스트"""
+        MemoCache(str(tmp_path)).set('key', {'x': 1})
+        cache = MemoCache(str(tmp_path))
+        
+        assert cache.get('key') == {'x': 1}
+        assert cache.stats.disk_hits == 1
+        
+    def test_disk_eviction(self, tmp_path):
+        """디스크 용량 제한 테스트"""
+        cache = MemoCache(str(tmp_path), max_items=1, max_disk_bytes=3_000)
+        for i in range(5):
+            cache.set(f'{i:02d}', np.zeros(100))
+            
+        total = sum(p.stat().st_size for p in tmp_path.glob('*/*.pkl'))
+        assert total <= 3_000
+        assert '04' in cache
+        
+    def test_memoize(self, kimp_data):
+        """함수 메모이제이션 테스트"""
+        calls = []
+        cache = MemoCache()
+        
+        @memoize(cache)
+        def spread(data, scale=1.0):
+            calls.append(1)
+            return (data['upbit_price'] - data['binance_price']) * scale
+        
+        spread(kimp_data)
+        spread(kimp_data.copy())
+        spread(kimp_data, scale=2.0)
+        
+        assert len(calls) == 2
+        assert cache.stats.memory_hits == 1
+
+
+class TestLogger:
+    """로거 레벨 확인 테스트"""
+    
+    def test_debug_gate_follows_setup(self):
+        """setup_logger 레벨과 debug_enabled 연동 테스트"""
+        try:
+            log_config.setup_logger('DEBUG')
+            assert log_config.debug_enabled()
+            
+            log_config.setup_logger('WARNING', enqueue=True)
+            assert not log_config.debug_enabled()
+            assert not log_config.log_enabled('INFO')
+            assert log_config.log_enabled('ERROR')
+        finally:
+            log_config.get_logger().complete()
+            log_config.setup_logger('INFO')
+            
+    def test_unknown_level(self):
+        """알 수 없는 레벨 거부 테스트 (기존 설정 유지)"""
+        with pytest.raises(ValueError, match='VERBOSE'):
+            log_config.setup_logger('verbose')
+        
+        assert log_config.current_level() == 'INFO'
+        log_config.setup_logger('debug')
+        try:
+            assert log_config.debug_enabled()
+        finally:
+            log_config.setup_logger('INFO')
+
+
+class TestEventLog:
+    """JSONL 이벤트 로그 테스트"""
+    
+    def test_batched_jsonl(self, tmp_path):
+        """배치 기록 및 직렬화 테스트"""
+        path = tmp_path / 'events.jsonl'
+        with EventLog(str(path), batch_size=100) as events:
+            for i in range(250):
+                events.log('fill', bar=np.int64(i), price=np.float32(1.5), time=pd.Timestamp('2024-01-01'))
+        
+        records = pd.read_json(path, lines=True)
+        
+        assert len(records) == 250
+        assert records['bar'].tolist() == list(range(250))
+        assert (records['event'] == 'fill').all()
+        assert events.written == 250
+        assert events.batches >= 3
+        
+    def test_append(self, tmp_path):
+        """기존 파일 이어쓰기 테스트"""
+        path = tmp_path / 'events.jsonl'
+        for _ in range(2):
+            with EventLog(str(path)) as events:
+                events.log('signal', action='BUY')
+        
+        assert len(path.read_text().splitlines()) == 2
+        
+    def test_reserved_fields_and_closed_log(self, tmp_path):
+        """예약 필드 덮어쓰기 거부 및 close 이후 기록 에러 테스트"""
+        events = EventLog(str(tmp_path / 'events.jsonl'))
+        with pytest.raises(ValueError, match='ts'):
+            events.log('fill', ts=0)
+        with pytest.raises(TypeError):
+            events.log('fill', **{'event': 'other'})
+        events.close()
+        
+        with pytest.raises(RuntimeError):
+            events.log('fill', side='BUY')
+        assert events.written == 0
+        
+    def test_write_failure_raised(self, tmp_path):
+        """기록 스레드 실패를 log/close에서 다시 발생시키는지 테스트"""
+        events = EventLog(str(tmp_path / 'events.jsonl'), flush_interval=0.01)
+        events._file.close()    # 디스크/파일 오류 흉내
+        events.log('fill', side='BUY')
+        events._writer.join(timeout=5)
+        
+        with pytest.raises(RuntimeError, match='기록 실패'):
+            events.log('fill', side='SELL')
+        with pytest.raises(RuntimeError, match='기록 실패'):
+            events.close()
+        
+    def test_bounded_queue(self, tmp_path):
+        """대기 이벤트 상한 테스트 (가득 차면 기록될 때까지 대기)"""
+        path = tmp_path / 'events.jsonl'
+        with EventLog(str(path), batch_size=10, flush_interval=0.01, max_pending=5) as events:
+            for i in range(100):
+                events.log('fill', bar=i)
+            assert events._queue.qsize() <= 5
+        
+        assert len(path.read_text().splitlines()) == 100